@@ -0,0 +1,176 @@
+"""
+ai_response/ 폴더의 구간별 AI 분석 결과 수집
+- 세션마다 이미 호출해서 받아 둔 2분 단위 분석 결과를 다시 호출하지 않고 레포트에 재사용
+- 파일을 스레드 풀로 동시에 읽고 파싱 (.json / .txt / .md)
+- 구간: 파일명의 구간 정보 (VTT와 같은 _000-002분 형식), 없으면 JSON의 start_min/end_min 또는 time_range
+- 세션 기준 시간으로 맞춘 뒤 발화 시작 시간에 이분 탐색으로 정렬 → 구간별 발화 범위를 붙인 주석 목록
+"""
+
+import re
+import json
+from bisect import bisect_left
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# 파일명의 구간 정보 (vtt_source.SEGMENT_RE와 같은 형식)
+SEGMENT_RE = re.compile(r'_(\d{3})-(\d{3})분')
+
+# JSON time_range 값 (예: "2-4분", "02:00-04:00")
+TIME_RANGE_RE = re.compile(r'(\d+)(?::(\d{2}))?\s*분?\s*[-~]\s*(\d+)(?::(\d{2}))?')
+
+RESPONSE_SUFFIXES = ('.json', '.txt', '.md')
+
+# 분석 텍스트가 들어 있는 JSON 키 (앞에 있는 키 우선)
+TEXT_KEYS = ('summary', 'ai_summary', 'analysis', 'response', 'content', 'text')
+
+DEFAULT_WORKERS = 8
+
+
+def _mmss(seconds: float) -> str:
+    """초 → MM:SS"""
+    return f"{int(seconds // 60):02d}:{int(seconds % 60):02d}"
+
+
+def _extract_text(data: Any) -> str:
+    """JSON 응답에서 분석 텍스트 꺼내기 (문자열 / 키 / 메시지 content 블록 목록)"""
+    if isinstance(data, str):
+        return data.strip()
+    if isinstance(data, list):
+        return '\n'.join(filter(None, (_extract_text(item) for item in data)))
+    if isinstance(data, dict):
+        for key in TEXT_KEYS:
+            if key in data:
+                text = _extract_text(data[key])
+                if text:
+                    return text
+        if 'choices' in data:
+            return _extract_text([choice.get('message', choice) for choice in data['choices']])
+    return ''
+
+
+def _json_window(data: Any) -> Optional[Tuple[float, float]]:
+    """JSON 안의 구간 정보 (분)"""
+    if not isinstance(data, dict):
+        return None
+    if 'start_min' in data and 'end_min' in data:
+        return float(data['start_min']), float(data['end_min'])
+
+    m = TIME_RANGE_RE.search(str(data.get('time_range', '')))
+    if m is None:
+        return None
+    start = int(m.group(1)) + int(m.group(2) or 0) / 60
+    end = int(m.group(3)) + int(m.group(4) or 0) / 60
+    return start, end
+
+
+def parse_response_file(path: Path) -> Dict[str, Any]:
+    """
+    AI 응답 파일 하나 파싱
+
+    Returns:
+        {'status': 'success', 'source', 'start', 'end' (세션 기준 초), 'text'}
+        또는 {'status': 'error', 'source', 'error'}
+    """
+    try:
+        content = path.read_text(encoding='utf-8')
+        data = json.loads(content) if path.suffix == '.json' else content
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        return {'status': 'error', 'source': path.name, 'error': str(e)}
+
+    segment = SEGMENT_RE.search(path.name)
+    try:
+        window = (int(segment.group(1)), int(segment.group(2))) if segment else _json_window(data)
+    except (TypeError, ValueError) as e:
+        return {'status': 'error', 'source': path.name, 'error': f"구간 정보가 올바르지 않습니다: {e}"}
+    if window is None:
+        return {'status': 'error', 'source': path.name, 'error': '구간 정보가 없습니다'}
+
+    text = _extract_text(data)
+    if not text:
+        return {'status': 'error', 'source': path.name, 'error': '분석 텍스트가 없습니다'}
+
+    return {
+        'status': 'success',
+        'source': path.name,
+        'start': window[0] * 60,
+        'end': window[1] * 60,
+        'text': text,
+    }
+
+
+def load_ai_responses(ai_response_dir, workers: int = DEFAULT_WORKERS) -> List[Dict[str, Any]]:
+    """
+    ai_response/ 폴더의 모든 응답 파일을 동시에 파싱
+
+    Args:
+        ai_response_dir: ai_response 폴더 경로 (없으면 빈 목록)
+        workers: 동시에 읽을 파일 수
+
+    Returns:
+        parse_response_file 결과 목록 (파일명 순)
+    """
+    directory = Path(ai_response_dir)
+    if not directory.is_dir():
+        return []
+
+    files = sorted(p for p in directory.iterdir() if p.suffix in RESPONSE_SUFFIXES and p.is_file())
+    if len(files) <= 1:
+        return [parse_response_file(p) for p in files]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(files))) as pool:
+        return list(pool.map(parse_response_file, files))
+
+
+def align_annotations(responses: List[Dict[str, Any]],
+                      utterances: Sequence[Tuple[bool, float, float, str]]) -> List[Dict[str, Any]]:
+    """
+    응답 구간을 발화 시간축에 정렬
+
+    Args:
+        responses: load_ai_responses 결과 (실패한 항목은 건너뜀)
+        utterances: (아동 여부, 시작 초, 종료 초, 텍스트) 목록 (시작 시간 순)
+
+    Returns:
+        구간 시작 순 [{'start_time', 'end_time', 'time_range', 'summary', 'source',
+                      'utterance_range': [첫 발화, 마지막 발화 + 1], 'utterance_count', 'child_utterance_count'}]
+    """
+    starts = [u[1] for u in utterances]
+    annotations = []
+
+    for r in sorted((r for r in responses if r['status'] == 'success'),
+                    key=lambda r: (r['start'], r['end'], r['source'])):
+        first = bisect_left(starts, r['start'])
+        last = bisect_left(starts, r['end'], first)
+        annotations.append({
+            'start_time': _mmss(r['start']),
+            'end_time': _mmss(r['end']),
+            'time_range': f"{_mmss(r['start'])}-{_mmss(r['end'])}",
+            'summary': r['text'],
+            'source': r['source'],
+            'utterance_range': [first, last],
+            'utterance_count': last - first,
+            'child_utterance_count': sum(1 for u in utterances[first:last] if u[0]),
+        })
+
+    return annotations
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='ai_response/ 구간별 AI 분석 결과 확인')
+    parser.add_argument('session', help='세션 폴더 (ai_response/ 포함)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='동시에 읽을 파일 수')
+    args = parser.parse_args()
+
+    responses = load_ai_responses(Path(args.session) / 'ai_response', args.workers)
+    for r in responses:
+        if r['status'] == 'success':
+            print(f"✅ {_mmss(r['start'])}-{_mmss(r['end'])}  {r['source']}  ({len(r['text'])}자)")
+        else:
+            print(f"❌ {r['source']} - {r['error']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+"""
+분석 결과 형식 어댑터
+- 세 가지 분석 JSON을 report_generator가 쓰는 enhanced 형식(metadata/metrics)으로 변환
+  · basic    : analyze_play_session.py → *_analysis.json
+  · detailed : analyze_metrics.py      → *_detailed_analysis.json
+  · enhanced : enhanced_analysis.py    → *_enhanced_analysis.json (변환 없음)
+- 원본에 없는 지표는 None으로 두고(주제 분포는 생략), 추정한 값은 metrics['estimated']에 기록
+  (레포트는 None/추정 지표를 등급 없이 '측정 불가'로 표시)
+- 같은 세션의 여러 형식 파일 중 하나만 고르는 헬퍼 (enhanced > detailed > basic)
+"""
+
+import re
+import json
+from pathlib import Path
+from typing import Dict, Any, List, Iterable, Union
+
+
+# 형식별 파일 접미사 (선호 순서)
+FORMAT_SUFFIXES = [
+    ('enhanced', '_enhanced_analysis.json'),
+    ('detailed', '_detailed_analysis.json'),
+    ('basic', '_analysis.json'),
+]
+
+FORMAT_PRIORITY = {kind: i for i, (kind, _) in enumerate(FORMAT_SUFFIXES)}
+
+# 평균 어절 길이(글자). 단어 수가 없는 형식에서 글자 수로 단어 수를 추정할 때 사용
+CHARS_PER_WORD = 3.0
+
+# analyze_metrics.py 정서 범주 → 긍정/부정
+POSITIVE_EMOTIONS = ('기쁨', '사랑', '놀람')
+NEGATIVE_EMOTIONS = ('슬픔', '화남', '두려움')
+
+_DURATION_RE = re.compile(r'(\d{1,2})[_:](\d{2})[_:](\d{2})')
+_DATE_RE = re.compile(r'^(\d{8})-')
+
+
+def detect_format(data: Dict[str, Any]) -> str:
+    """
+    분석 결과 dict의 형식 판별
+
+    Returns:
+        'enhanced' / 'detailed' / 'basic'
+
+    Raises:
+        ValueError: 알 수 없는 형식
+    """
+    if 'metrics' in data and 'metadata' in data:
+        return 'enhanced'
+    if 'session_info' in data:
+        return 'detailed'
+    if 'meta_info' in data:
+        return 'basic'
+    raise ValueError(f"알 수 없는 분석 결과 형식입니다 (키: {', '.join(sorted(data))})")
+
+
+def split_analysis_name(path: Union[str, Path]):
+    """
+    분석 파일 이름에서 (세션명, 형식) 추출
+
+    Returns:
+        (session_name, kind). 분석 파일이 아니면 (None, None)
+    """
+    name = Path(path).name
+    for kind, suffix in FORMAT_SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)], kind
+    return None, None
+
+
+def pick_session_files(paths: Iterable[Union[str, Path]], kinds: Iterable[str] = None) -> List[Path]:
+    """
+    세션별로 분석 파일 하나만 선택 (enhanced > detailed > basic)
+
+    Args:
+        paths: 분석 파일 경로들 (보통 glob("*_analysis.json") 결과)
+        kinds: 허용할 형식. None이면 전부
+
+    Returns:
+        세션명 순으로 정렬된 경로 목록
+    """
+    allowed = set(kinds) if kinds is not None else set(FORMAT_PRIORITY)
+    best = {}
+    for path in paths:
+        session, kind = split_analysis_name(path)
+        if kind not in allowed:
+            continue
+        current = best.get(session)
+        if current is None or FORMAT_PRIORITY[kind] < current[0]:
+            best[session] = (FORMAT_PRIORITY[kind], Path(path))
+
+    return [best[session][1] for session in sorted(best)]
+
+
+def parse_duration(text: str) -> float:
+    """'02_00_48' / '02:00:48' 형태의 시간을 초로 변환 (없으면 0.0)"""
+    match = _DURATION_RE.search(text or '')
+    if not match:
+        return 0.0
+    hours, minutes, seconds = (int(g) for g in match.groups())
+    return float(hours * 3600 + minutes * 60 + seconds)
+
+
+def session_date(session_name: str) -> str:
+    """'20251021-임지우교사-...' 형태의 세션명에서 날짜(YYYYMMDD) 추출 (없으면 '')"""
+    match = _DATE_RE.match(session_name or '')
+    return match.group(1) if match else ''
+
+
+def _ratio(positive: int, negative: int) -> float:
+    """긍정/부정 비율 (부정이 0이면 긍정 수 그대로)"""
+    return positive / negative if negative > 0 else float(positive)
+
+
+def _switch_metrics(total_switches: int, duration: float) -> Dict[str, Any]:
+    """맥락 전환 지표 (주제 분포는 enhanced 분석에만 있어 넣지 않음)"""
+    return {
+        'total_switches': total_switches,
+        'switches_per_minute': total_switches / (duration / 60) if duration > 0 else 0,
+    }
+
+
+def _from_basic(data: Dict[str, Any]) -> Dict[str, Any]:
+    """analyze_play_session.py 결과 → enhanced 형식"""
+    meta = data['meta_info']
+    speech = data['speech_ratio']
+    emotion = data['emotion_analysis']
+    problem_solving = data['problem_solving']
+
+    # 기본 형식의 duration 칸은 채워지지 않는 경우가 있어 세션명에서 다시 읽음
+    duration = parse_duration(meta.get('duration', '')) or parse_duration(meta.get('session_name', ''))
+    child_count = speech['child_utterance_count']
+    child_words = round(speech['child_words'] / CHARS_PER_WORD)
+    positive = emotion['positive_count']
+    negative = emotion['negative_count']
+
+    metrics = {
+        'child_utterance_ratio': speech['child_speech_ratio'] / 100,
+        'child_utterance_count': child_count,
+        'teacher_utterance_count': speech['teacher_utterance_count'],
+        'total_utterance_count': speech['total_utterance_count'],
+        'child_word_count': child_words,
+        'teacher_word_count': round(speech['teacher_words'] / CHARS_PER_WORD),
+        'child_avg_words_per_utterance': child_words / child_count if child_count > 0 else 0,
+        # 발화 시간은 세 형식 중 enhanced에만 있음
+        'child_speaking_duration': None,
+        'teacher_speaking_duration': None,
+        'total_session_duration': duration,
+        'child_speaking_ratio': None,
+        # 기본 형식에는 발화 단위 주제 연속 길이가 없음 (turn_taking은 화자 교대 길이라 다른 지표)
+        'topic_persistence': None,
+        'context_switches': _switch_metrics(data['topic_continuity']['topic_changes'], duration),
+        'problem_solving_utterances': {
+            'child_count': problem_solving['problem_solving_count'],
+            'teacher_count': None,
+            'child_examples': problem_solving['examples'],
+            'teacher_examples': [],
+        },
+        'positive_utterances': positive,
+        'negative_utterances': negative,
+        'positive_negative_ratio': _ratio(positive, negative),
+        # 기본 형식은 키워드별 빈도가 없어 정서 키워드를 옮기지 않음
+        'emotion_keywords': {'positive': [], 'negative': []},
+        'main_topics': [list(item) for item in data['topic_keywords']['top_keywords']],
+        'time_segments': [],
+        'dialogue_samples': [],
+        'notable_child_utterances': [],
+        'ai_annotations': [],
+        'estimated': ['child_word_count', 'teacher_word_count', 'child_avg_words_per_utterance'],
+    }
+
+    return {
+        'metadata': {
+            # 일부 기본 형식 파일은 date 칸이 없어 세션명에서 읽음
+            'date': meta.get('date') or session_date(meta.get('session_name', '')),
+            'teacher': meta.get('teacher_name', ''),
+            'child': meta.get('child_name', ''),
+            'age': meta.get('child_age', ''),
+            'duration': meta.get('duration', ''),
+        },
+        'metrics': metrics,
+        'timestamp': data.get('analyzed_at', 'N/A'),
+    }
+
+
+def _from_detailed(data: Dict[str, Any]) -> Dict[str, Any]:
+    """analyze_metrics.py 결과 → enhanced 형식"""
+    info = data['session_info']
+    speech = data['speech_ratio']
+    problem_solving = data['problem_solving']
+    sentiment = data['sentiment']
+    emotion_counts = data.get('emotion_words', {}).get('emotion_counts', {})
+
+    duration = parse_duration(info.get('duration', ''))
+    child_count = speech['child_utterance_count']
+    child_words = round(speech['child_text_length'] / CHARS_PER_WORD)
+    positive = sentiment['positive_count']
+    negative = sentiment['negative_count']
+
+    def ranked(names):
+        counts = [[name, emotion_counts[name]] for name in names if emotion_counts.get(name, 0) > 0]
+        return sorted(counts, key=lambda x: -x[1])
+
+    metrics = {
+        'child_utterance_ratio': speech['child_utterance_ratio'] / 100,
+        'child_utterance_count': child_count,
+        'teacher_utterance_count': speech['teacher_utterance_count'],
+        'total_utterance_count': speech['total_utterance_count'],
+        'child_word_count': child_words,
+        'teacher_word_count': round(speech['teacher_text_length'] / CHARS_PER_WORD),
+        'child_avg_words_per_utterance': child_words / child_count if child_count > 0 else 0,
+        'child_speaking_duration': None,
+        'teacher_speaking_duration': None,
+        'total_session_duration': duration,
+        'child_speaking_ratio': None,
+        'topic_persistence': data['context_switches']['avg_consecutive_utterances'],
+        'context_switches': _switch_metrics(data['topic_consistency']['topic_changes'], duration),
+        'problem_solving_utterances': {
+            'child_count': problem_solving['problem_solving_utterance_count'],
+            'teacher_count': None,
+            'child_examples': problem_solving.get('examples', []),
+            'teacher_examples': [],
+        },
+        'positive_utterances': positive,
+        'negative_utterances': negative,
+        'positive_negative_ratio': _ratio(positive, negative),
+        'emotion_keywords': {
+            'positive': ranked(POSITIVE_EMOTIONS),
+            'negative': ranked(NEGATIVE_EMOTIONS),
+        },
+        'main_topics': [[kw['word'], kw['count']] for kw in data['main_topics']['top_keywords']],
+        'time_segments': [],
+        'dialogue_samples': [],
+        'notable_child_utterances': [],
+        'ai_annotations': [],
+        'estimated': ['child_word_count', 'teacher_word_count', 'child_avg_words_per_utterance'],
+    }
+
+    teacher = info.get('teacher_name', '')
+    if teacher.endswith('교사'):
+        teacher = teacher[:-len('교사')]
+
+    return {
+        'metadata': {
+            'date': info.get('date', ''),
+            'teacher': teacher,
+            'child': info.get('child_name', ''),
+            'age': info.get('age', ''),
+            'duration': info.get('duration', ''),
+        },
+        'metrics': metrics,
+        'timestamp': 'N/A',
+    }
+
+
+_ADAPTERS = {
+    'basic': _from_basic,
+    'detailed': _from_detailed,
+}
+
+
+def to_enhanced(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    분석 결과(dict)를 enhanced 형식으로 변환
+
+    Args:
+        data: 세 형식 중 하나의 분석 결과
+
+    Returns:
+        {'metadata': ..., 'metrics': ..., 'timestamp': ...}. enhanced 입력은 그대로 반환
+    """
+    kind = detect_format(data)
+    if kind == 'enhanced':
+        return data
+    return _ADAPTERS[kind](data)
+
+
+def load_analysis(path: Union[str, Path]) -> Dict[str, Any]:
+    """분석 JSON 파일을 읽어 enhanced 형식으로 반환"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return to_enhanced(json.load(f))
@@ -11,12 +11,22 @@ from typing import Dict, List, Tuple
 from collections import Counter, defaultdict
 import statistics
 
+from vtt_source import VTTSource
+
+# _후처리됨.vtt 파일 우선, 없으면 _subtitle.vtt 사용
+VTT_PATTERNS = ("*_후처리됨.vtt", "*_subtitle.vtt")
 
 class PlaySessionAnalyzer:
     """놀이 세션 분석 클래스"""
     
-    def __init__(self, session_path: str):
+    def __init__(self, session_path: str, source=None):
+        """
+        Args:
+            session_path: 세션 디렉토리 경로
+            source: 공유 VTT 소스 (vtt_source.VTTSource). 지정하면 다른 분석기와 파싱 결과 공유
+        """
         self.session_path = Path(session_path)
+        self.source = source if source is not None else VTTSource(self.session_path)
         self.session_name = self.session_path.name
         
         # 경로 설정
@@ -28,55 +38,19 @@ class PlaySessionAnalyzer:
         self.dialogues = []
         self.audio_features = {}
         
-    def parse_vtt_file(self, vtt_path: Path) -> List[Dict]:
-        """VTT 파일 파싱"""
-        dialogues = []
-        
-        with open(vtt_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # VTT 블록 파싱
-        blocks = content.split('\n\n')
-        
-        for block in blocks:
-            if '-->' in block:
-                lines = block.strip().split('\n')
-                if len(lines) >= 2:
-                    time_line = lines[0]
-                    text_line = ' '.join(lines[1:])
-                    
-                    # 화자와 텍스트 분리
-                    speaker_match = re.match(r'\[(.*?)\]\s*(.*)', text_line)
-                    if speaker_match:
-                        speaker = speaker_match.group(1)
-                        text = speaker_match.group(2).strip()
-                        
-                        # 시간 파싱
-                        time_match = re.match(r'(\d+:\d+:\d+\.\d+)\s*-->\s*(\d+:\d+:\d+\.\d+)', time_line)
-                        if time_match:
-                            dialogues.append({
-                                'start': time_match.group(1),
-                                'end': time_match.group(2),
-                                'speaker': speaker,
-                                'text': text
-                            })
-        
-        return dialogues
-    
     def load_all_vtt_files(self):
-        """모든 VTT 파일 로드"""
+        """모든 VTT 파일 로드 (파일 선택/중복 큐 제거는 vtt_source.VTTSource)"""
         print(f"VTT 파일 로딩 중: {self.vtt_dir}")
         
-        # _후처리됨.vtt 파일 우선, 없으면 _subtitle.vtt 사용
-        vtt_files = sorted(self.vtt_dir.glob("*_후처리됨.vtt"))
-        if not vtt_files:
-            vtt_files = sorted(self.vtt_dir.glob("*_subtitle.vtt"))
-        
-        for vtt_file in vtt_files:
-            dialogues = self.parse_vtt_file(vtt_file)
-            self.dialogues.extend(dialogues)
+        for cue in self.source.cues(VTT_PATTERNS):
+            self.dialogues.append({
+                'start': cue['start_time'],
+                'end': cue['end_time'],
+                'speaker': cue['speaker'],
+                'text': ' '.join(cue['text'].split('\n'))
+            })
         
-        print(f"총 {len(self.dialogues)}개 발화 로드됨")
+        print(f"총 {len(self.dialogues)}개 발화 로드됨 (중복 큐 {self.source.dropped}개 제거)")
     
     def load_audio_features(self):
         """오디오 특징 로드"""
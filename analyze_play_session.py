@@ -15,15 +15,22 @@ from collections import Counter, defaultdict
 from datetime import datetime
 import statistics
 
+from vtt_source import VTTSource, is_teacher
+
+# _subtitle.vtt 파일 우선 (후처리된 버전), 없으면 미처리/후처리 버전 사용
+VTT_PATTERNS = ("*_subtitle.vtt", "*.vtt")
+
 class PlaySessionAnalyzer:
     """놀이 세션 분석기"""
     
-    def __init__(self, session_dir):
+    def __init__(self, session_dir, source=None):
         """
         Args:
             session_dir: 세션 디렉토리 경로 (예: raw_data/20251017-이민정교사-김준우-만4세-02_00_48-65kbps_mono)
+            source: 공유 VTT 소스 (vtt_source.VTTSource). 지정하면 다른 분석기와 파싱 결과 공유
         """
         self.session_dir = Path(session_dir)
+        self.source = source if source is not None else VTTSource(self.session_dir)
         self.session_name = self.session_dir.name
         
         # 디렉토리 구조
@@ -35,6 +42,7 @@ class PlaySessionAnalyzer:
         # 분석 결과 저장
         self.meta_info = {}
         self.dialogues = []  # [{speaker, text, start_time, end_time, segment}]
+        self.dropped_cues = 0
         self.segments = []  # 2분 단위 세그먼트 정보
         
         # 감정 키워드 사전 (한국어)
@@ -107,57 +115,23 @@ class PlaySessionAnalyzer:
         
         return self.meta_info
     
-    def parse_vtt_file(self, vtt_path):
-        """VTT 파일 파싱"""
-        dialogues = []
-        
-        with open(vtt_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # VTT 엔트리 파싱 (타임스탬프 + 텍스트)
-        pattern = r'(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}\.\d{3})\s*\n\[([^\]]+)\]\s*(.+?)(?=\n\n|\Z)'
-        matches = re.findall(pattern, content, re.DOTALL)
-        
-        for start_time, end_time, speaker, text in matches:
-            # 화자 분류
-            speaker_type = 'teacher' if ('교사' in speaker or '선생님' in speaker) else 'child'
-            
-            dialogues.append({
-                'start_time': start_time,
-                'end_time': end_time,
-                'speaker': speaker.strip(),
-                'speaker_type': speaker_type,
-                'text': text.strip()
-            })
-        
-        return dialogues
-    
     def load_all_dialogues(self):
-        """모든 VTT 파일에서 대화 로드"""
+        """모든 VTT 파일에서 대화 로드 (파일 선택/중복 큐 제거는 vtt_source.VTTSource)"""
         all_dialogues = []
         
-        # _subtitle.vtt 파일 우선 (후처리된 버전)
-        vtt_files = sorted(self.vtt_dir.glob("*_subtitle.vtt"))
-        
-        if not vtt_files:
-            # subtitle.vtt가 없으면 미처리/후처리 버전 사용
-            vtt_files = sorted(self.vtt_dir.glob("*.vtt"))
-        
-        for vtt_file in vtt_files:
-            # 세그먼트 시간 정보 추출 (예: 000-002분)
-            segment_match = re.search(r'_(\d{3}-\d{3})분', vtt_file.name)
-            segment = segment_match.group(1) if segment_match else ''
-            
-            dialogues = self.parse_vtt_file(vtt_file)
-            
-            # 세그먼트 정보 추가
-            for d in dialogues:
-                d['segment'] = segment
-                d['segment_file'] = vtt_file.name
-            
-            all_dialogues.extend(dialogues)
+        for cue in self.source.cues(VTT_PATTERNS):
+            all_dialogues.append({
+                'start_time': cue['start_time'],
+                'end_time': cue['end_time'],
+                'speaker': cue['speaker'],
+                'speaker_type': 'teacher' if is_teacher(cue['speaker']) else 'child',
+                'text': cue['text'],
+                'segment': cue['segment'],
+                'segment_file': cue['segment_file']
+            })
         
         self.dialogues = all_dialogues
+        self.dropped_cues = self.source.dropped
         return all_dialogues
     
     def analyze_speech_ratio(self):
@@ -368,7 +342,7 @@ class PlaySessionAnalyzer:
         
         # 2. 대화 데이터 로드
         self.load_all_dialogues()
-        print(f"  - 대화 데이터 로드 완료: 총 {len(self.dialogues)}개 발화")
+        print(f"  - 대화 데이터 로드 완료: 총 {len(self.dialogues)}개 발화 (중복 큐 {self.dropped_cues}개 제거)")
         
         # 3. 각종 분석 실행
         analysis_results = {
@@ -6,10 +6,15 @@
 """
 
 import json
+from functools import partial
 from pathlib import Path
 from analyze_play_session import PlaySessionAnalyzer
-from generate_reports import ReportGenerator
-import pandas as pd
+from analysis_adapters import pick_session_files, split_analysis_name
+from sharding import shard_arg, select_shard
+from batch_runner import ResultLog, run_bounded
+from corpus import CorpusReader, append_to_corpus
+from comparison import ComparisonAggregator, ComparisonCSVWriter, extract_row
+from render_farm import print_plan, render_reports
 from datetime import datetime
 
 
@@ -28,120 +33,210 @@ def find_all_sessions(raw_data_dir):
     return sorted(sessions)
 
 
-def analyze_all_sessions(raw_data_dir="raw_data", output_dir="analysis_results"):
-    """모든 세션 분석"""
+def _analyze_session(session_dir, output_dir, corpus=None, store=None):
+    """세션 하나 분석 (프로세스 풀 워커) - 결과 요약만 반환"""
+    session_dir = Path(session_dir)
+    
+    try:
+        analyzer = PlaySessionAnalyzer(session_dir)
+        analysis_file = Path(output_dir) / f"{session_dir.name}_analysis.json"
+        result = analyzer.save_analysis(analysis_file)
+        append_to_corpus(corpus, session_dir.name, 'analysis', result)
+        if store:
+            # SQLite 저장소를 쓸 때만 sqlite3 로드 (CLI 시작 시간 절약)
+            from metrics_store import append_to_store
+            append_to_store(store, session_dir.name, result)
+        return {'status': 'success', 'analysis_file': str(analysis_file)}
+    except Exception as e:
+        return {'status': 'error', 'error': str(e)}
+
+
+def analyze_all_sessions(raw_data_dir="raw_data", output_dir="analysis_results", shard=None,
+                         workers=1, max_rss_mb=None, results_log=None, corpus=None, store=None):
+    """
+    모든 세션 분석
+    
+    세션별 결과 요약은 끝나는 즉시 JSONL 파일에 기록하고, 메모리에는 카운터만 유지합니다.
+    
+    Args:
+        shard: (index, count) 튜플. 지정하면 해당 샤드의 세션만 분석
+        workers: 동시 분석 프로세스 수
+        max_rss_mb: 전체 RSS 상한 (MB). 넘으면 동시 실행 수를 줄임
+        results_log: 결과 요약 JSONL 경로 (기본값: output_dir/analyze_results.jsonl)
+        corpus: 분석 결과 코퍼스(JSONL) 경로. 지정하면 세션별 JSON과 함께 한 줄씩 추가
+        store: 세션 지표 저장소(SQLite) 경로. 지정하면 세션마다 지표 한 행 추가
+    
+    Returns:
+        {'total', 'success', 'failed', 'results_log'} 카운터
+    """
     sessions = find_all_sessions(raw_data_dir)
+    found_count = len(sessions)
+    sessions = select_shard(sessions, shard)
     
     print(f"\n{'='*80}")
-    print(f"🔍 총 {len(sessions)}개 세션 발견")
+    print(f"🔍 총 {found_count}개 세션 발견")
+    if shard:
+        print(f"🧩 샤드 {shard[0]}/{shard[1]}: {len(sessions)}개 세션 담당")
     print(f"{'='*80}\n")
     
-    results = []
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
+    results_log = Path(results_log or output_path / "analyze_results.jsonl")
     
-    for i, session_dir in enumerate(sessions, 1):
-        print(f"\n[{i}/{len(sessions)}] 분석 중: {session_dir.name}")
-        print("-" * 80)
-        
-        try:
-            # 분석 실행
-            analyzer = PlaySessionAnalyzer(session_dir)
-            analysis_file = output_path / f"{session_dir.name}_analysis.json"
-            result = analyzer.save_analysis(analysis_file)
-            results.append(result)
-            
-            print(f"✅ 완료: {session_dir.name}")
+    counters = {'total': len(sessions), 'success': 0, 'failed': 0, 'results_log': str(results_log)}
+    
+    with ResultLog(results_log) as log:
+        def on_result(session_dir, result):
+            done = counters['success'] + counters['failed'] + 1
+            log.write({'session': session_dir.name, **result})
             
-        except Exception as e:
-            print(f"❌ 오류 발생: {session_dir.name}")
-            print(f"   에러: {str(e)}")
-            continue
+            if result['status'] == 'success':
+                counters['success'] += 1
+                print(f"✅ [{done}/{len(sessions)}] 완료: {session_dir.name}")
+            else:
+                counters['failed'] += 1
+                print(f"❌ [{done}/{len(sessions)}] 오류 발생: {session_dir.name}")
+                print(f"   에러: {result.get('error')}")
+        
+        run_bounded(sessions, partial(_analyze_session, output_dir=output_path,
+                                       corpus=corpus, store=store),
+                    workers=workers, max_rss_mb=max_rss_mb, on_result=on_result)
     
     print(f"\n{'='*80}")
-    print(f"✨ 전체 분석 완료! ({len(results)}/{len(sessions)} 성공)")
+    print(f"✨ 전체 분석 완료! ({counters['success']}/{len(sessions)} 성공)")
+    print(f"📄 결과 요약: {results_log}")
     print(f"{'='*80}\n")
     
-    return results
+    return counters
 
 
-def generate_all_reports(analysis_dir="analysis_results", report_dir="reports"):
-    """모든 분석 결과에 대해 레포트 생성"""
+def generate_all_reports(analysis_dir="analysis_results", report_dir="reports", render_workers=None,
+                         dry_run=False):
+    """
+    모든 분석 결과에 대해 레포트 생성 (증분 렌더링)
+    
+    세션마다 분석 파일 하나만 사용합니다 (enhanced > detailed > basic 순으로 선택).
+    렌더 팜(render_farm.render_reports)으로 분석 내용이나 템플릿이 바뀐 (세션, 대상)만 다시 만들고,
+    파일은 모아서 원자적으로 저장하며, 진행 상황은 한 줄로만 표시합니다.
+    
+    Args:
+        render_workers: 렌더링 프로세스 수 (None이면 현재 프로세스에서 순차 렌더링)
+        dry_run: 렌더링하지 않고 다시 렌더링할 (세션, 대상)과 이유만 출력
+    
+    Returns:
+        render_reports 요약 dict
+    """
     analysis_path = Path(analysis_dir)
-    analysis_files = sorted(analysis_path.glob("*_analysis.json"))
+    analysis_files = pick_session_files(analysis_path.glob("*_analysis.json"))
     
     print(f"\n{'='*80}")
-    print(f"📝 총 {len(analysis_files)}개 레포트 생성 시작")
+    print(f"📝 총 {len(analysis_files)}개 세션 레포트 {'렌더링 계획' if dry_run else '생성 시작'}")
     print(f"{'='*80}\n")
     
-    for i, analysis_file in enumerate(analysis_files, 1):
-        print(f"\n[{i}/{len(analysis_files)}] 레포트 생성 중: {analysis_file.stem}")
-        print("-" * 80)
-        
-        try:
-            generator = ReportGenerator(analysis_file)
-            generator.save_all_reports(report_dir)
-            print(f"✅ 완료")
-            
-        except Exception as e:
-            print(f"❌ 오류 발생: {str(e)}")
-            continue
+    summary = render_reports(analysis_files, report_dir, render_workers or 1, incremental=True,
+                             dry_run=dry_run)
+    if dry_run:
+        print_plan(summary)
+        return summary
     
+    for (analysis_file, audience), reason in summary['skipped']:
+        print(f"⚠️  건너뜀 ({Path(analysis_file).stem} / {audience}): {reason}")
+    for (analysis_file, audience), error in summary['errors']:
+        print(f"❌ 오류 발생 ({Path(analysis_file).stem} / {audience}): {error}")
     print(f"\n{'='*80}")
-    print(f"✨ 전체 레포트 생성 완료!")
+    print(f"✨ 전체 레포트 생성 완료! ({summary['written']}개 파일, 변경 없음 {summary['unchanged']}개, "
+          f"건너뜀 {len(summary['skipped'])}개)")
     print(f"{'='*80}\n")
+    return summary
 
 
-def generate_comparison_report(analysis_dir="analysis_results"):
-    """비교 리포트 생성"""
-    analysis_path = Path(analysis_dir)
-    analysis_files = sorted(analysis_path.glob("*_analysis.json"))
+def collect_analysis_files(analysis_dirs):
+    """
+    여러 분석 결과 폴더에서 *_analysis.json 수집
+    
+    샤드 출력을 합칠 때 같은 세션이 여러 폴더에 있으면 처음 발견된 것만 사용합니다.
+    같은 접미사를 쓰는 *_detailed_analysis.json / *_enhanced_analysis.json은 제외합니다.
+    """
+    if isinstance(analysis_dirs, (str, Path)):
+        analysis_dirs = [analysis_dirs]
+    
+    files_by_name = {}
+    for analysis_dir in analysis_dirs:
+        for analysis_file in Path(analysis_dir).glob("*_analysis.json"):
+            if split_analysis_name(analysis_file)[1] != 'basic':
+                continue
+            files_by_name.setdefault(analysis_file.name, analysis_file)
+    
+    return [files_by_name[name] for name in sorted(files_by_name)]
+
+
+def iter_analysis_data(analysis_dir="analysis_results", corpus=None):
+    """
+    분석 결과 dict 순회
+    
+    코퍼스(JSONL)가 주어지면 세션별 파일을 열지 않고 코퍼스 파일에서 순서대로 읽습니다.
+    
+    Args:
+        analysis_dir: 분석 결과 폴더 (또는 폴더 목록)
+        corpus: 코퍼스 경로 (또는 경로 목록). 지정하면 analysis_dir 대신 사용
+    """
+    if corpus:
+        if isinstance(corpus, (str, Path)):
+            corpus = [corpus]
+        
+        seen = set()
+        for corpus_path in corpus:
+            for session, data in CorpusReader(corpus_path).iter_records('analysis'):
+                if session not in seen:
+                    seen.add(session)
+                    yield data
+        return
+    
+    for analysis_file in collect_analysis_files(analysis_dir):
+        with open(analysis_file, 'r', encoding='utf-8') as f:
+            yield json.load(f)
+
+
+def generate_comparison_report(analysis_dir="analysis_results", report_dir="reports", corpus=None):
+    """
+    비교 리포트 생성
+    
+    Args:
+        analysis_dir: 분석 결과 폴더 (샤드 병합 시 폴더 목록)
+        report_dir: CSV/TXT 저장 폴더
+        corpus: 분석 결과 코퍼스 경로 (또는 목록). 지정하면 폴더 대신 코퍼스에서 읽음
+    """
+    report_path = Path(report_dir)
+    report_path.mkdir(exist_ok=True)
     
     print(f"\n{'='*80}")
-    print(f"📊 비교 리포트 생성 중... ({len(analysis_files)}개 세션)")
+    print(f"📊 비교 리포트 생성 중... ({corpus or analysis_dir})")
     print(f"{'='*80}\n")
     
-    # 데이터 수집
-    comparison_data = []
+    # 데이터 수집: 세션 단위로 CSV 한 줄 기록 + 통계 누적 (전체를 메모리에 올리지 않음)
+    csv_file = report_path / "comparison_report.csv"
+    agg = ComparisonAggregator()
+    
+    with ComparisonCSVWriter(csv_file) as writer:
+        for data in iter_analysis_data(analysis_dir, corpus):
+            row = extract_row(data)
+            writer.write(row)
+            agg.add(row)
     
-    for analysis_file in analysis_files:
-        with open(analysis_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        meta = data['meta_info']
-        speech_ratio = data['speech_ratio']
-        speech_amount = data['child_speech_amount']
-        emotion = data['emotion_analysis']
-        topics = data['topic_keywords']
-        problem_solving = data['problem_solving']
-        turn_taking = data['turn_taking']
-        
-        comparison_data.append({
-            '세션명': meta['session_name'],
-            '날짜': meta.get('date', 'N/A'),
-            '선생님': meta.get('teacher_name', 'N/A'),
-            '아동': meta.get('child_name', 'N/A'),
-            '나이': meta.get('child_age', 'N/A'),
-            '아동발화비율(%)': round(speech_ratio['child_speech_ratio'], 1),
-            '아동발화횟수': speech_ratio['child_utterance_count'],
-            '평균발화길이': round(speech_amount['avg_utterance_length'], 1),
-            '긍정비율(%)': round(emotion['positive_ratio'], 1),
-            '부정비율(%)': round(emotion['negative_ratio'], 1),
-            '고유단어수': topics['unique_words'],
-            '어휘다양도(%)': round(topics['unique_words'] / topics['total_words'] * 100, 1),
-            '문제해결비율(%)': round(problem_solving['problem_solving_ratio'], 1),
-            '총턴수': turn_taking['total_turns'],
-            '턴균형도': round(turn_taking['turn_taking_balance'], 2)
-        })
-    
-    # DataFrame 생성
-    df = pd.DataFrame(comparison_data)
-    
-    # CSV 저장
-    csv_file = Path("reports") / "comparison_report.csv"
-    df.to_csv(csv_file, index=False, encoding='utf-8-sig')
     print(f"✅ CSV 저장: {csv_file}")
     
+    if agg.count == 0:
+        print("⚠️  비교할 분석 결과가 없습니다.")
+        return agg
+    
+    stats = agg.stats
+    speech = stats['아동발화비율(%)']
+    length = stats['평균발화길이']
+    positive = stats['긍정비율(%)']
+    negative = stats['부정비율(%)']
+    vocab = stats['어휘다양도(%)']
+    ps = stats['문제해결비율(%)']
+    
     # 텍스트 리포트 생성
     report = f"""
 {'='*100}
@@ -149,86 +244,74 @@ def generate_comparison_report(analysis_dir="analysis_results"):
 {'='*100}
 
 생성 일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-분석 대상: 총 {len(comparison_data)}개 세션
+분석 대상: 총 {agg.count}개 세션
 
 {'='*100}
 1️⃣  기본 통계
 {'='*100}
 
-총 세션 수: {len(comparison_data)}개
-분석 기간: {df['날짜'].min()} ~ {df['날짜'].max()}
-선생님 수: {df['선생님'].nunique()}명
-아동 수: {df['아동'].nunique()}명
+총 세션 수: {agg.count}개
+분석 기간: {agg.date_min} ~ {agg.date_max}
+선생님 수: {len(agg.teachers)}명
+아동 수: {len(agg.children)}명
 
 {'='*100}
 2️⃣  아동 발화 분석
 {'='*100}
 
 📊 아동 발화 비율
-  • 평균: {df['아동발화비율(%)'].mean():.1f}%
-  • 최소: {df['아동발화비율(%)'].min():.1f}% ({df.loc[df['아동발화비율(%)'].idxmin(), '아동']})
-  • 최대: {df['아동발화비율(%)'].max():.1f}% ({df.loc[df['아동발화비율(%)'].idxmax(), '아동']})
-  • 표준편차: {df['아동발화비율(%)'].std():.1f}%
+  • 평균: {speech.mean:.1f}%
+  • 최소: {speech.min:.1f}% ({speech.min_label})
+  • 최대: {speech.max:.1f}% ({speech.max_label})
+  • 표준편차: {speech.std:.1f}%
 
 📝 평균 발화 길이
-  • 평균: {df['평균발화길이'].mean():.1f}자
-  • 최소: {df['평균발화길이'].min():.1f}자 ({df.loc[df['평균발화길이'].idxmin(), '아동']})
-  • 최대: {df['평균발화길이'].max():.1f}자 ({df.loc[df['평균발화길이'].idxmax(), '아동']})
+  • 평균: {length.mean:.1f}자
+  • 최소: {length.min:.1f}자 ({length.min_label})
+  • 최대: {length.max:.1f}자 ({length.max_label})
 
 {'='*100}
 3️⃣  감정 분석
 {'='*100}
 
 😊 긍정 비율
-  • 평균: {df['긍정비율(%)'].mean():.1f}%
-  • 최소: {df['긍정비율(%)'].min():.1f}% ({df.loc[df['긍정비율(%)'].idxmin(), '아동']})
-  • 최대: {df['긍정비율(%)'].max():.1f}% ({df.loc[df['긍정비율(%)'].idxmax(), '아동']})
+  • 평균: {positive.mean:.1f}%
+  • 최소: {positive.min:.1f}% ({positive.min_label})
+  • 최대: {positive.max:.1f}% ({positive.max_label})
 
 😔 부정 비율
-  • 평균: {df['부정비율(%)'].mean():.1f}%
-  • 최소: {df['부정비율(%)'].min():.1f}% ({df.loc[df['부정비율(%)'].idxmin(), '아동']})
-  • 최대: {df['부정비율(%)'].max():.1f}% ({df.loc[df['부정비율(%)'].idxmax(), '아동']})
+  • 평균: {negative.mean:.1f}%
+  • 최소: {negative.min:.1f}% ({negative.min_label})
+  • 최대: {negative.max:.1f}% ({negative.max_label})
 
 {'='*100}
 4️⃣  인지 발달
 {'='*100}
 
 📚 어휘 다양도 (TTR)
-  • 평균: {df['어휘다양도(%)'].mean():.1f}%
-  • 최소: {df['어휘다양도(%)'].min():.1f}% ({df.loc[df['어휘다양도(%)'].idxmin(), '아동']})
-  • 최대: {df['어휘다양도(%)'].max():.1f}% ({df.loc[df['어휘다양도(%)'].idxmax(), '아동']})
+  • 평균: {vocab.mean:.1f}%
+  • 최소: {vocab.min:.1f}% ({vocab.min_label})
+  • 최대: {vocab.max:.1f}% ({vocab.max_label})
 
 🧩 문제해결 발화
-  • 평균: {df['문제해결비율(%)'].mean():.1f}%
-  • 최소: {df['문제해결비율(%)'].min():.1f}% ({df.loc[df['문제해결비율(%)'].idxmin(), '아동']})
-  • 최대: {df['문제해결비율(%)'].max():.1f}% ({df.loc[df['문제해결비율(%)'].idxmax(), '아동']})
+  • 평균: {ps.mean:.1f}%
+  • 최소: {ps.min:.1f}% ({ps.min_label})
+  • 최대: {ps.max:.1f}% ({ps.max_label})
 
 {'='*100}
 5️⃣  상위/하위 순위
 {'='*100}
-
-🏆 아동 발화 비율 상위 3명:
-"""
-    
-    top_3_speech = df.nlargest(3, '아동발화비율(%)')
-    for i, row in enumerate(top_3_speech.itertuples(), 1):
-        report += f"  {i}. {row.아동} ({row.나이}) - {row.아동발화비율:}%\n"
-    
-    report += f"""
-🏆 어휘 다양도 상위 3명:
-"""
-    
-    top_3_vocab = df.nlargest(3, '어휘다양도(%)')
-    for i, row in enumerate(top_3_vocab.itertuples(), 1):
-        report += f"  {i}. {row.아동} ({row.나이}) - {row.어휘다양도:}%\n"
-    
-    report += f"""
-🏆 문제해결 발화 상위 3명:
 """
     
-    top_3_ps = df.nlargest(3, '문제해결비율(%)')
-    for i, row in enumerate(top_3_ps.itertuples(), 1):
-        report += f"  {i}. {row.아동} ({row.나이}) - {row.문제해결비율:}%\n"
+    top_titles = [
+        ('아동발화비율(%)', '아동 발화 비율'),
+        ('어휘다양도(%)', '어휘 다양도'),
+        ('문제해결비율(%)', '문제해결 발화'),
+    ]
+    for col, title in top_titles:
+        report += f"\n🏆 {title} 상위 3명:\n"
+        for i, (value, (child, age)) in enumerate(agg.top[col].items(), 1):
+            report += f"  {i}. {child} ({age}) - {value}%\n"
     
     report += f"""
 {'='*100}
@@ -236,15 +319,7 @@ def generate_comparison_report(analysis_dir="analysis_results"):
 {'='*100}
 """
     
-    age_groups = df.groupby('나이').agg({
-        '아동발화비율(%)': 'mean',
-        '평균발화길이': 'mean',
-        '긍정비율(%)': 'mean',
-        '어휘다양도(%)': 'mean',
-        '문제해결비율(%)': 'mean'
-    }).round(1)
-    
-    report += "\n" + age_groups.to_string()
+    report += "\n" + agg.group_table('나이')
     
     report += f"""
 
@@ -253,17 +328,7 @@ def generate_comparison_report(analysis_dir="analysis_results"):
 {'='*100}
 """
     
-    teacher_groups = df.groupby('선생님').agg({
-        '아동발화비율(%)': 'mean',
-        '평균발화길이': 'mean',
-        '긍정비율(%)': 'mean',
-        '어휘다양도(%)': 'mean',
-        '문제해결비율(%)': 'mean',
-        '아동': 'count'
-    }).round(1)
-    teacher_groups.columns = ['평균아동발화비율', '평균발화길이', '평균긍정비율', '평균어휘다양도', '평균문제해결비율', '세션수']
-    
-    report += "\n" + teacher_groups.to_string()
+    report += "\n" + agg.group_table('선생님', with_count=True)
     
     report += f"""
 
@@ -271,11 +336,11 @@ def generate_comparison_report(analysis_dir="analysis_results"):
 8️⃣  전체 평가
 {'='*100}
 
-✅ 전체적으로 아동들의 발화 참여도가 평균 {df['아동발화비율(%)'].mean():.1f}%로 양호합니다.
-✅ 감정 표현이 긍정적인 경향을 보입니다 (평균 긍정 비율 {df['긍정비율(%)'].mean():.1f}%).
+✅ 전체적으로 아동들의 발화 참여도가 평균 {speech.mean:.1f}%로 양호합니다.
+✅ 감정 표현이 긍정적인 경향을 보입니다 (평균 긍정 비율 {positive.mean:.1f}%).
 """
     
-    if df['문제해결비율(%)'].mean() < 5:
+    if ps.mean < 5:
         report += "⚠️  전반적으로 문제해결 발화 비율이 낮으므로, 탐구 활동 강화가 필요합니다.\n"
     
     report += f"""
@@ -285,19 +350,74 @@ def generate_comparison_report(analysis_dir="analysis_results"):
 """
     
     # 텍스트 리포트 저장
-    txt_file = Path("reports") / "comparison_report.txt"
+    txt_file = report_path / "comparison_report.txt"
     with open(txt_file, 'w', encoding='utf-8') as f:
         f.write(report)
     
     print(f"✅ 텍스트 리포트 저장: {txt_file}")
     print(f"\n{report}")
     
-    return df
+    return agg
+
+
+def merge_shards(analysis_dirs, report_dir="reports", corpus=None):
+    """
+    샤드별 분석 결과를 합쳐 비교 리포트(CSV/TXT) 생성
+    
+    Args:
+        analysis_dirs: 샤드별 분석 결과 폴더 목록
+        corpus: 샤드별 코퍼스 경로 목록 (지정하면 폴더 대신 사용)
+    """
+    sources = corpus or analysis_dirs
+    print("\n" + "="*80)
+    print(f"🧩 샤드 결과 병합: {len(sources)}개 {'코퍼스' if corpus else '폴더'}")
+    print("="*80)
+    for source in sources:
+        print(f"  - {source}")
+    
+    agg = generate_comparison_report(analysis_dirs, report_dir, corpus)
+    print(f"🧩 병합된 세션: {agg.count}개")
+    return agg
 
 
 def main():
     """메인 함수"""
-    import sys
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='놀이 세션 배치 분석')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    merge_parser = subparsers.add_parser('merge', help='샤드 출력 병합 후 비교 리포트 생성')
+    merge_parser.add_argument('analysis_dirs', nargs='*', help='샤드별 분석 결과 폴더')
+    merge_parser.add_argument('--corpus', nargs='+', help='샤드별 분석 결과 코퍼스(JSONL)')
+    merge_parser.add_argument('--report-dir', type=str, default='reports', help='비교 리포트 저장 폴더')
+    
+    parser.add_argument('--raw-data-dir', type=str, default='raw_data', help='raw_data 디렉토리 경로')
+    parser.add_argument('--output-dir', type=str, default='analysis_results', help='분석 결과 저장 폴더')
+    parser.add_argument('--report-dir', type=str, default='reports', help='레포트 저장 폴더')
+    parser.add_argument('--shard', type=shard_arg, help='분산 처리 샤드 (i/N, i는 0부터 시작)')
+    parser.add_argument('--workers', type=int, default=1, help='동시 분석 프로세스 수')
+    parser.add_argument('--render-workers', type=int, help='레포트 렌더링 프로세스 수 (기본: 순차 렌더링)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='분석/렌더링 없이 기존 분석 결과 기준으로 다시 렌더링할 (세션, 대상)만 출력')
+    parser.add_argument('--max-rss-mb', type=float, help='전체 메모리(RSS) 상한 (MB)')
+    parser.add_argument('--results-log', type=str, help='세션별 결과 요약 JSONL 경로')
+    parser.add_argument('--corpus', type=str, help='분석 결과를 한 줄씩 추가할 코퍼스(JSONL) 경로')
+    parser.add_argument('--store', type=str, help='세션 지표를 추가할 SQLite 저장소 경로')
+    
+    args = parser.parse_args()
+    
+    if args.command == 'merge':
+        if not args.analysis_dirs and not args.corpus:
+            parser.error('merge: 분석 결과 폴더 또는 --corpus 를 지정하세요')
+        merge_shards(args.analysis_dirs, args.report_dir, args.corpus)
+        return
+    
+    shard = args.shard
+    
+    if args.dry_run:
+        generate_all_reports(args.output_dir, args.report_dir, args.render_workers, dry_run=True)
+        return
     
     print("\n" + "="*80)
     print("🚀 놀이 세션 배치 분석 시스템")
@@ -305,23 +425,29 @@ def main():
     
     # 1. 모든 세션 분석
     print("\n📍 단계 1: 세션 분석")
-    analyze_all_sessions()
+    analyze_all_sessions(args.raw_data_dir, args.output_dir, shard,
+                         args.workers, args.max_rss_mb, args.results_log, args.corpus, args.store)
     
     # 2. 모든 레포트 생성
     print("\n📍 단계 2: 레포트 생성")
-    generate_all_reports()
+    generate_all_reports(args.output_dir, args.report_dir, args.render_workers)
     
-    # 3. 비교 리포트 생성
-    print("\n📍 단계 3: 비교 분석")
-    generate_comparison_report()
+    # 3. 비교 리포트 생성 (샤드 모드에서는 merge 단계에서 한 번에 생성)
+    if shard:
+        print("\n📍 단계 3: 비교 분석은 모든 샤드 완료 후 merge 명령으로 생성합니다")
+        print(f"   python batch_analyze.py merge <샤드별 {args.output_dir} 폴더...>")
+    else:
+        print("\n📍 단계 3: 비교 분석")
+        generate_comparison_report(args.output_dir, args.report_dir, args.corpus)
     
     print("\n" + "="*80)
     print("✨ 모든 작업 완료!")
     print("="*80)
     print("\n결과 확인:")
-    print("  - 분석 결과: analysis_results/ 폴더")
-    print("  - 개별 레포트: reports/ 폴더")
-    print("  - 비교 리포트: reports/comparison_report.txt 및 .csv")
+    print(f"  - 분석 결과: {args.output_dir}/ 폴더")
+    print(f"  - 개별 레포트: {args.report_dir}/ 폴더")
+    if not shard:
+        print(f"  - 비교 리포트: {args.report_dir}/comparison_report.txt 및 .csv")
     print()
 
 
@@ -0,0 +1,148 @@
+"""
+메모리 제한 배치 실행기
+- 세션별 결과 요약을 JSON Lines 파일로 즉시 기록 (메모리에는 카운터만 유지)
+- 프로세스 풀로 병렬 처리
+- RSS 상한을 넘으면 동시 실행 수를 줄이고, 여유가 생기면 다시 늘림
+  (현재 RSS를 잴 수 있을 때만: Linux /proc 또는 psutil. 최대 RSS(ru_maxrss)는 한 번 올라가면
+   내려오지 않아 동시 실행 수가 끝까지 줄어든 채로 남으므로 상한 판단에 쓰지 않음)
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+
+class ResultLog:
+    """세션 결과 요약 JSONL 기록기"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+
+    def write(self, record: Dict[str, Any]):
+        """한 줄(compact JSON)로 기록 후 바로 flush"""
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_results(path) -> Iterator[Dict[str, Any]]:
+    """ResultLog로 기록된 JSONL 파일을 한 줄씩 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def current_rss_mb(pid: Optional[int] = None) -> Optional[float]:
+    """
+    프로세스의 현재 RSS (MB)
+
+    Linux는 /proc/<pid>/statm, 그 외에는 psutil(설치된 경우)을 사용합니다.
+    측정할 수 없으면 None (최대 RSS로 대체하지 않음 - 줄어들지 않아 상한 판단에 쓸 수 없음).
+    """
+    pid = pid or os.getpid()
+    try:
+        with open(f'/proc/{pid}/statm', 'r') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+    except Exception:  # psutil 미설치, 프로세스 종료, 권한 없음
+        return None
+
+
+def _run_measured(worker: Callable, item):
+    """워커 실행 후 (결과, pid, RSS) 반환 - 부모가 전체 메모리 사용량을 추정하는 데 사용"""
+    result = worker(item)
+    return result, os.getpid(), current_rss_mb()
+
+
+def run_bounded(items: Iterable, worker: Callable, workers: int = 1,
+                max_rss_mb: Optional[float] = None,
+                on_result: Optional[Callable] = None):
+    """
+    항목들을 워커로 처리하며 결과를 하나씩 콜백으로 전달
+
+    결과를 모아두지 않으므로 항목 수와 무관하게 메모리가 일정합니다.
+
+    Args:
+        items: 처리할 항목 (세션 경로 등)
+        worker: 항목 하나를 받아 결과 요약(dict)을 반환하는 최상위 함수 (pickle 가능해야 함)
+        workers: 최대 동시 프로세스 수 (1이면 현재 프로세스에서 순차 처리)
+        max_rss_mb: 부모+워커 RSS 합계 상한 (MB). None이면 제한 없음.
+                    현재 RSS를 잴 수 없는 환경(Linux가 아니고 psutil 없음)에서는 적용하지 않음
+        on_result: on_result(item, result) 콜백. 워커 예외 시 result는
+                   {'status': 'error', 'error': ...}
+    """
+    on_result = on_result or (lambda item, result: None)
+
+    if workers <= 1:
+        for item in items:
+            try:
+                result = worker(item)
+            except Exception as e:
+                result = {'status': 'error', 'error': str(e)}
+            on_result(item, result)
+        return
+
+    # 병렬 실행할 때만 multiprocessing 로드 (순차 실행 CLI의 시작 시간 절약)
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    limit = workers
+    worker_rss = {}
+    pending = {}
+    items = iter(items)
+    exhausted = False
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while pending or not exhausted:
+            while not exhausted and len(pending) < limit:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[executor.submit(_run_measured, worker, item)] = item
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                try:
+                    result, pid, rss = future.result()
+                    if rss is not None:
+                        worker_rss[pid] = rss
+                except Exception as e:
+                    result = {'status': 'error', 'error': str(e)}
+                on_result(item, result)
+
+            if max_rss_mb:
+                parent_rss = current_rss_mb()
+                if parent_rss is None:
+                    print("⚠️  현재 RSS를 측정할 수 없어 메모리 상한을 적용하지 않습니다 (psutil 설치 필요)")
+                    max_rss_mb = None
+                    continue
+                total_rss = parent_rss + sum(worker_rss.values())
+                if total_rss > max_rss_mb and limit > 1:
+                    limit -= 1
+                    print(f"⚠️  RSS {total_rss:.0f}MB > 상한 {max_rss_mb:.0f}MB: 동시 실행 {limit}개로 축소")
+                elif total_rss < max_rss_mb * 0.8 and limit < workers:
+                    limit += 1
+                    print(f"🔼 RSS {total_rss:.0f}MB: 동시 실행 {limit}개로 복구")
@@ -0,0 +1,196 @@
+"""
+분석기 성능 비교
+- analyze_play_session (basic), analyze_metrics (detailed), enhanced_analysis (enhanced)
+- 세션마다 각 분석기를 반복 실행하고 가장 빠른 시간을 비교 (파일 저장 제외)
+- --stages: enhanced 단계별 시간 (VTT 파싱 / 지표 계산 / 에피소드 클러스터링) + numpy import 시간
+
+Usage: python benchmark_analyzers.py <raw_data_dir 또는 세션 폴더...> [--repeat N] [--stages]
+"""
+
+import io
+import sys
+import time
+import contextlib
+from pathlib import Path
+
+import analyze_play_session
+import analyze_metrics
+import enhanced_analysis
+from vtt_source import VTTSource
+
+
+def _basic(session_dir):
+    analyze_play_session.PlaySessionAnalyzer(session_dir).generate_full_analysis()
+
+
+def _detailed(session_dir):
+    analyze_metrics.PlaySessionAnalyzer(str(session_dir)).analyze_all()
+
+
+def _enhanced(session_dir):
+    analyzer = enhanced_analysis.PlaySessionAnalyzer(str(session_dir))
+    analyzer.parse_vtt_files()
+    analyzer.calculate_metrics()
+
+
+ANALYZERS = [
+    ('basic', _basic),
+    ('detailed', _detailed),
+    ('enhanced', _enhanced),
+]
+
+
+def find_sessions(paths):
+    """세션 폴더 목록 (vtt/ 가 있는 폴더, 상위 폴더를 주면 하위 세션 전체)"""
+    sessions = []
+    for path in map(Path, paths):
+        if (path / "vtt").is_dir():
+            sessions.append(path)
+        elif path.is_dir():
+            sessions.extend(sorted(p for p in path.iterdir() if (p / "vtt").is_dir()))
+    return sessions
+
+
+def time_analyzer(run, session_dir, repeat: int) -> float:
+    """가장 빠른 실행 시간 (초). 분석기의 진행 출력은 숨김"""
+    best = float('inf')
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            run(session_dir)
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+    return best
+
+
+def benchmark(sessions, repeat: int = 5):
+    """
+    세션별/분석기별 시간 측정 후 표 출력
+
+    Returns:
+        {분석기: 전체 세션 합계 (초)}
+    """
+    totals = {name: 0.0 for name, _ in ANALYZERS}
+
+    header = f"{'세션':40s}" + ''.join(f"{name:>12s}" for name, _ in ANALYZERS)
+    print(header)
+    print('-' * len(header))
+
+    for session_dir in sessions:
+        cells = []
+        for name, run in ANALYZERS:
+            elapsed = time_analyzer(run, session_dir, repeat)
+            totals[name] += elapsed
+            cells.append(f"{elapsed * 1000:10.1f}ms")
+        print(f"{session_dir.name[:40]:40s}" + ''.join(cells))
+
+    print('-' * len(header))
+    print(f"{'합계':40s}" + ''.join(f"{totals[name] * 1000:10.1f}ms" for name, _ in ANALYZERS))
+
+    baseline = totals['enhanced']
+    if baseline > 0:
+        print()
+        for name, _ in ANALYZERS:
+            print(f"  {name:10s}: enhanced 대비 {totals[name] / baseline:5.2f}배")
+
+    return totals
+
+
+def _best(run, repeat: int) -> float:
+    """run()이 돌려준 경과 시간 중 최솟값 (초)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return min(run() for _ in range(repeat))
+
+
+def enhanced_stages(session_dir, repeat: int = 5):
+    """
+    enhanced 분석 단계별 가장 빠른 시간 (초)
+
+    Returns:
+        {'parse': VTT 파싱, 'metrics': 지표 계산 (에피소드 제외), 'episodes': 에피소드 클러스터링}
+    """
+    def parse():
+        source = VTTSource(session_dir)
+        start = time.perf_counter()
+        source.utterances()
+        return time.perf_counter() - start
+
+    def episodes():
+        source = VTTSource(session_dir)
+        source.utterances()
+        start = time.perf_counter()
+        source.core_episodes()
+        return time.perf_counter() - start
+
+    # 파싱/에피소드가 캐시된 소스로 calculate_metrics 자체만 측정
+    warm = VTTSource(session_dir)
+    warm.core_episodes()
+
+    def metrics():
+        analyzer = enhanced_analysis.PlaySessionAnalyzer(str(session_dir), source=warm)
+        analyzer.parse_vtt_files()
+        start = time.perf_counter()
+        analyzer.calculate_metrics()
+        return time.perf_counter() - start
+
+    return {
+        'utterances': len(warm.utterances()),
+        'parse': _best(parse, repeat),
+        'metrics': _best(metrics, repeat),
+        'episodes': _best(episodes, repeat),
+    }
+
+
+def benchmark_stages(sessions, repeat: int = 5):
+    """
+    enhanced 단계별 시간 표 + numpy import 시간 출력
+
+    Returns:
+        {'stages': {세션명: enhanced_stages 결과}, 'numpy_import_ms': 중앙값 (numpy 없으면 None)}
+    """
+    from startup_benchmark import measure_import
+
+    stages = {}
+    header = f"{'세션':40s}{'발화':>8s}{'파싱':>12s}{'지표':>12s}{'에피소드':>12s}"
+    print(header)
+    print('-' * len(header))
+    for session_dir in sessions:
+        result = enhanced_stages(session_dir, repeat)
+        stages[session_dir.name] = result
+        print(f"{session_dir.name[:40]:40s}{result['utterances']:8d}"
+              + ''.join(f"{result[key] * 1000:10.2f}ms" for key in ('parse', 'metrics', 'episodes')))
+    print('-' * len(header))
+
+    numpy_ms = measure_import('numpy', repeat)['ms']
+    if numpy_ms is None:
+        print("\n  numpy import: 없음 (설치되지 않음)")
+    else:
+        print(f"\n  numpy import: {numpy_ms:.1f}ms (새 프로세스, 중앙값)")
+
+    return {'stages': stages, 'numpy_import_ms': numpy_ms}
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='분석기 성능 비교')
+    parser.add_argument('paths', nargs='+', help='raw_data 폴더 또는 세션 폴더')
+    parser.add_argument('--repeat', type=int, default=5, help='세션별 반복 횟수 (최솟값 사용)')
+    parser.add_argument('--stages', action='store_true',
+                        help='enhanced 단계별 시간과 numpy import 시간 출력')
+    args = parser.parse_args()
+
+    sessions = find_sessions(args.paths)
+    if not sessions:
+        print("❌ vtt/ 폴더가 있는 세션을 찾을 수 없습니다.")
+        sys.exit(1)
+
+    print(f"⏱️  세션 {len(sessions)}개, 반복 {args.repeat}회\n")
+    benchmark(sessions, args.repeat)
+    if args.stages:
+        print()
+        benchmark_stages(sessions, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+"""
+분석 호출 지연/비용 집계
+- 호출 기록: chunk_executor 결과 하나 → 대기 시간, 응답 지연, 전체 소요, 프롬프트/응답 토큰, 캐시 적중 여부
+- 집계: 지연/대기/소요의 p50·p95·최대·합계 + 토큰 합계 + 캐시 적중/실패/재시도 수 (+ 단가가 있으면 예상 비용)
+  캐시 적중은 호출하지 않았으므로 지연 통계에서 빼고 토큰 합계에는 'saved'로 따로 셈
+- CallLog: 세션/단계별 기록을 모아 실행 리포트 JSON으로 저장 → 동시 호출 수/속도 제한/예산 산정 근거
+
+Usage: python call_metrics.py <실행 리포트.json>
+"""
+
+import json
+import math
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+# 집계할 백분위
+PERCENTILES = (50, 95)
+
+
+def call_record(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    chunk_executor 결과 → 호출 기록 (응답 텍스트 제외)
+
+    Returns:
+        {'index', 'status', 'cached', 'attempts', 'queue_wait', 'latency', 'elapsed',
+         'prompt_tokens', 'response_tokens', 'input_tokens', 'output_tokens'}
+    """
+    usage = result.get('usage') or {}
+    return {
+        'index': result['index'],
+        'status': result['status'],
+        'cached': result.get('cached', False),
+        'attempts': result.get('attempts', 0),
+        'queue_wait': round(result.get('queue_wait', 0.0), 4),
+        'latency': round(result.get('latency', 0.0), 4),
+        'elapsed': round(result.get('elapsed', 0.0), 4),
+        'prompt_tokens': result.get('prompt_tokens', 0),
+        'response_tokens': result.get('response_tokens', 0),
+        'input_tokens': usage.get('input_tokens', 0),
+        'output_tokens': usage.get('output_tokens', 0),
+    }
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """백분위 (정렬 후 선형 보간, 값이 없으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _distribution(values: List[float]) -> Dict[str, float]:
+    stats = {f"p{q}": round(percentile(values, q), 4) for q in PERCENTILES}
+    stats['max'] = round(max(values), 4) if values else 0.0
+    stats['total'] = round(sum(values, 0.0), 4)
+    return stats
+
+
+def summarize_calls(records: List[Dict[str, Any]], input_price: Optional[float] = None,
+                    output_price: Optional[float] = None) -> Dict[str, Any]:
+    """
+    호출 기록 집계
+
+    Args:
+        records: call_record 목록
+        input_price: 입력 토큰 100만 개당 가격 (없으면 비용 계산 안 함)
+        output_price: 출력 토큰 100만 개당 가격
+
+    Returns:
+        {'calls', 'cache_hits', 'cache_misses', 'failed', 'retries',
+         'queue_wait'/'latency'/'elapsed': {'p50', 'p95', 'max', 'total'},
+         'tokens': {'prompt', 'response', 'input', 'output', 'saved_input', 'saved_output'},
+         'estimated_cost'}
+    """
+    called = [r for r in records if not r['cached']]
+    hits = [r for r in records if r['cached']]
+
+    summary = {
+        'calls': len(records),
+        'cache_hits': len(hits),
+        'cache_misses': len(called),
+        'failed': sum(1 for r in records if r['status'] != 'success'),
+        'retries': sum(max(r['attempts'] - 1, 0) for r in called),
+        'queue_wait': _distribution([r['queue_wait'] for r in called]),
+        'latency': _distribution([r['latency'] for r in called]),
+        'elapsed': _distribution([r['elapsed'] for r in called]),
+        'tokens': {
+            'prompt': sum(r['prompt_tokens'] for r in called),
+            'response': sum(r['response_tokens'] for r in called),
+            'input': sum(r['input_tokens'] for r in called),
+            'output': sum(r['output_tokens'] for r in called),
+            'saved_input': sum(r['input_tokens'] for r in hits),
+            'saved_output': sum(r['output_tokens'] for r in hits),
+        },
+        'estimated_cost': None,
+    }
+
+    if input_price is not None or output_price is not None:
+        tokens = summary['tokens']
+        summary['estimated_cost'] = round(
+            (tokens['input'] * (input_price or 0) + tokens['output'] * (output_price or 0)) / 1_000_000, 6)
+
+    return summary
+
+
+class CallLog:
+    """세션/단계별 호출 기록 모음 (실행 리포트)"""
+
+    def __init__(self, executor=None, input_price: Optional[float] = None,
+                 output_price: Optional[float] = None):
+        """
+        Args:
+            executor: chunk_executor.ChunkExecutor (리포트에 동시 호출 수/속도 제한 설정 기록)
+            input_price: 입력 토큰 100만 개당 가격
+            output_price: 출력 토큰 100만 개당 가격
+        """
+        self.executor = executor
+        self.input_price = input_price
+        self.output_price = output_price
+        self.groups = {}    # 세션(또는 아동) → 단계 → [호출 기록]
+
+    def add(self, group: str, stage: str, records: List[Dict[str, Any]]):
+        """
+        호출 기록 추가
+
+        Args:
+            group: 세션 이름 (성장 기록 요약은 아동 이름)
+            stage: 'chunk', 'session_reduce', 'history_reduce' 등
+            records: call_record 목록
+        """
+        self.groups.setdefault(group, {}).setdefault(stage, []).extend(records)
+
+    def summarize(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return summarize_calls(records, self.input_price, self.output_price)
+
+    def report(self) -> Dict[str, Any]:
+        """실행 리포트 (그룹별/단계별 집계 + 전체 집계)"""
+        groups = {}
+        everything = []
+        for group, stages in self.groups.items():
+            records = [r for stage_records in stages.values() for r in stage_records]
+            everything.extend(records)
+            groups[group] = {
+                'stages': {stage: self.summarize(stage_records) for stage, stage_records in stages.items()},
+                'total': self.summarize(records),
+            }
+
+        executor = None
+        if self.executor is not None:
+            executor = {
+                'concurrency': self.executor.concurrency,
+                'rate': self.executor.rate,
+                'timeout': self.executor.timeout,
+                'retries': self.executor.retries,
+            }
+
+        return {
+            'generated_at': datetime.now().isoformat(),
+            'executor': executor,
+            'prices_per_million_tokens': {'input': self.input_price, 'output': self.output_price},
+            'groups': groups,
+            'total': self.summarize(everything),
+        }
+
+    def save(self, path: str) -> Dict[str, Any]:
+        """실행 리포트 JSON 저장"""
+        report = self.report()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return report
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """집계 한 줄 요약 (콘솔 출력용)"""
+    line = (f"호출 {summary['cache_misses']}회 (캐시 {summary['cache_hits']}회, 실패 {summary['failed']}회, "
+            f"재시도 {summary['retries']}회) | 지연 p50 {summary['latency']['p50']:.2f}s "
+            f"p95 {summary['latency']['p95']:.2f}s | 대기 p95 {summary['queue_wait']['p95']:.2f}s | "
+            f"토큰 입력 {summary['tokens']['input']:,} 출력 {summary['tokens']['output']:,}")
+    if summary['estimated_cost'] is not None:
+        line += f" | 비용 {summary['estimated_cost']:.4f}"
+    return line
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='실행 리포트 요약 출력')
+    parser.add_argument('report', help='실행 리포트 JSON (--report로 저장한 파일)')
+    args = parser.parse_args()
+
+    with open(args.report, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+
+    for group, data in report['groups'].items():
+        print(f"📊 {group}")
+        for stage, summary in data['stages'].items():
+            print(f"   {stage:15s} {format_summary(summary)}")
+    print(f"\n📈 전체: {format_summary(report['total'])}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,396 @@
+"""
+청크 분석 동시 실행기
+- 백엔드 인터페이스: prompt → {'text', 'usage'} (ChunkBackend 상속해서 교체 가능)
+  · HTTPBackend : JSON POST ({'prompt', **params} → {'text', 'usage'})
+  · StubServer  : 로컬 스텁 HTTP 서버 (지연/오류율 조절, 테스트용 백엔드)
+- asyncio 동시 실행 (동시 호출 수 상한) + 토큰 버킷 속도 제한
+- 호출별 타임아웃 (타임아웃된 호출도 실제로 끝날 때까지 동시 호출 슬롯 차지), 재시도 가능한 오류(429/5xx/타임아웃/연결 오류)는 지수 백오프 + 지터로 재시도
+- 결과는 입력 순서대로 반환, 실패한 청크는 {'status': 'error', 'error': ...}
+- 호출마다 대기 시간(세마포어 + 속도 제한), 응답 지연, 프롬프트/응답 추정 토큰을 기록 (call_metrics로 집계)
+
+Usage: python chunk_executor.py <세션 경로> [--url URL | --stub] [--concurrency N] [--rate R]
+       [--cache-dir DIR | --no-cache] [--report FILE]
+"""
+
+import json
+import time
+import random
+import asyncio
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from prompt_chunker import estimate_tokens
+from prompt_cache import cache_key
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE = 2.0          # 초당 호출 수
+DEFAULT_TIMEOUT = 60.0      # 호출 1회 타임아웃 (초)
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5       # 첫 재시도 대기 상한 (초), 회차마다 2배
+
+
+class RetryableError(Exception):
+    """다시 시도하면 성공할 수 있는 백엔드 오류 (429, 5xx, 연결 오류)"""
+
+
+class ChunkBackend:
+    """청크 분석 백엔드 인터페이스"""
+
+    # 응답 캐시 키 등에 쓰는 모델 파라미터
+    params: Dict[str, Any] = {}
+
+    async def complete(self, prompt: str) -> Dict[str, Any]:
+        """
+        프롬프트 하나 분석
+
+        Returns:
+            {'text': 응답 텍스트, 'usage': {'input_tokens', 'output_tokens'}}
+
+        실행기 타임아웃으로 취소되면 실제 호출이 끝난 뒤에 취소를 전파해야 합니다
+        (그래야 끝나지 않은 호출이 동시 호출 수 슬롯을 계속 차지함)
+
+        Raises:
+            RetryableError: 재시도 가능한 오류
+        """
+        raise NotImplementedError
+
+
+class HTTPBackend(ChunkBackend):
+    """JSON POST 백엔드 (블로킹 urllib 호출을 스레드에서 실행, 소켓 타임아웃으로 호출 시간 제한)"""
+
+    def __init__(self, url: str, timeout: float = DEFAULT_TIMEOUT, **params):
+        """
+        Args:
+            url: 분석 엔드포인트
+            timeout: 소켓 타임아웃 (초)
+            params: 요청 본문에 함께 보낼 모델 파라미터 (model, max_tokens 등)
+        """
+        self.url = url
+        self.timeout = timeout
+        self.params = params
+
+    def _post(self, prompt: str) -> Dict[str, Any]:
+        body = json.dumps({'prompt': prompt, **self.params}, ensure_ascii=False).encode('utf-8')
+        request = urllib.request.Request(self.url, data=body,
+                                         headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            if e.code == 429 or e.code >= 500:
+                raise RetryableError(f"HTTP {e.code}") from e
+            raise
+        except (urllib.error.URLError, ConnectionError, TimeoutError) as e:
+            raise RetryableError(str(e)) from e
+
+    async def complete(self, prompt: str) -> Dict[str, Any]:
+        future = asyncio.get_running_loop().run_in_executor(None, self._post, prompt)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # 스레드의 urllib 호출은 취소되지 않으므로 소켓 타임아웃으로 끝날 때까지 기다린 뒤 취소 전파
+            await asyncio.wait({future})
+            if not future.cancelled():
+                future.exception()
+            raise
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한 (rate: 초당 보충량, capacity: 최대 연속 호출 수)"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class ChunkExecutor:
+    """청크 프롬프트를 동시에 백엔드로 보내는 실행기"""
+
+    def __init__(self, backend: ChunkBackend, concurrency: int = DEFAULT_CONCURRENCY,
+                 rate: float = DEFAULT_RATE, burst: Optional[float] = None,
+                 timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF, seed: Optional[int] = None):
+        """
+        Args:
+            backend: 분석 백엔드
+            concurrency: 동시 호출 수 상한
+            rate: 초당 호출 수 상한 (재시도 포함)
+            burst: 연속으로 바로 보낼 수 있는 호출 수 (기본: rate)
+            timeout: 호출 1회 타임아웃 (초)
+            retries: 재시도 횟수 (첫 호출 제외)
+            backoff: 첫 재시도 대기 상한 (초). 회차마다 2배, 실제 대기는 0~상한 사이 무작위
+            seed: 지터 난수 시드 (재현용)
+        """
+        self.backend = backend
+        self.concurrency = max(1, concurrency)
+        self.rate = rate
+        self.burst = burst
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._random = random.Random(seed)
+
+    async def _call(self, index: int, prompt: str, bucket: TokenBucket,
+                    semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """
+        청크 하나 실행 (재시도 포함)
+
+        queue_wait는 모든 시도의 세마포어/속도 제한 대기 합 (재시도 백오프 제외),
+        latency는 마지막 시도의 백엔드 응답 시간
+        """
+        started = time.perf_counter()
+        prompt_tokens = estimate_tokens(prompt)
+        queue_wait = 0.0
+        latency = 0.0
+        last_error = ''
+
+        for attempt in range(1, self.retries + 2):
+            queued = time.perf_counter()
+            async with semaphore:
+                await bucket.acquire()
+                call_started = time.perf_counter()
+                queue_wait += call_started - queued
+                try:
+                    response = await asyncio.wait_for(self.backend.complete(prompt), self.timeout)
+                except asyncio.TimeoutError:
+                    last_error = f"타임아웃 ({self.timeout}s)"
+                except RetryableError as e:
+                    last_error = str(e)
+                except Exception as e:
+                    return {'index': index, 'status': 'error', 'error': str(e), 'attempts': attempt,
+                            'queue_wait': queue_wait, 'latency': time.perf_counter() - call_started,
+                            'elapsed': time.perf_counter() - started, 'prompt_tokens': prompt_tokens}
+                else:
+                    text = response.get('text', '')
+                    response_tokens = estimate_tokens(text)
+                    usage = response.get('usage') or {}
+                    return {
+                        'index': index,
+                        'status': 'success',
+                        'text': text,
+                        'usage': {
+                            'input_tokens': usage.get('input_tokens', prompt_tokens),
+                            'output_tokens': usage.get('output_tokens', response_tokens),
+                        },
+                        'attempts': attempt,
+                        'queue_wait': queue_wait,
+                        'latency': time.perf_counter() - call_started,
+                        'elapsed': time.perf_counter() - started,
+                        'prompt_tokens': prompt_tokens,
+                        'response_tokens': response_tokens,
+                    }
+                latency = time.perf_counter() - call_started
+
+            if attempt <= self.retries:
+                # 지수 백오프 + full jitter (세마포어 밖에서 대기)
+                await asyncio.sleep(self._random.uniform(0, self.backoff * 2 ** (attempt - 1)))
+
+        return {'index': index, 'status': 'error', 'error': last_error, 'attempts': self.retries + 1,
+                'queue_wait': queue_wait, 'latency': latency,
+                'elapsed': time.perf_counter() - started, 'prompt_tokens': prompt_tokens}
+
+    async def run(self, prompts: List[str]) -> List[Dict[str, Any]]:
+        """
+        프롬프트 전체 실행
+
+        Returns:
+            입력 순서대로의 결과 리스트
+        """
+        bucket = TokenBucket(self.rate, self.burst)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        return await asyncio.gather(*(
+            self._call(i, prompt, bucket, semaphore) for i, prompt in enumerate(prompts)
+        ))
+
+    def run_sync(self, prompts: List[str]) -> List[Dict[str, Any]]:
+        """이벤트 루프 밖에서 실행"""
+        return asyncio.run(self.run(prompts))
+
+
+def run_cached(executor: ChunkExecutor, prompts: List[str], cache=None) -> List[Dict[str, Any]]:
+    """
+    캐시에 응답이 없는 프롬프트만 실행기로 보내고 결과를 캐시에 저장
+
+    Args:
+        executor: 청크 실행기
+        prompts: 프롬프트 리스트
+        cache: prompt_cache.PromptCache (None이면 전부 호출)
+
+    Returns:
+        입력 순서대로의 결과 리스트 (각 결과에 'cached' 여부 포함)
+    """
+    results = [None] * len(prompts)
+    keys = {}
+    pending = []
+
+    for i, prompt in enumerate(prompts):
+        if cache is not None:
+            keys[i] = cache_key('response', prompt, executor.backend.params)
+            hit = cache.get(keys[i])
+            if hit is not None:
+                results[i] = {'index': i, 'status': 'success', 'text': hit['text'],
+                              'usage': hit['usage'], 'attempts': 0, 'cached': True,
+                              'prompt_tokens': estimate_tokens(prompt),
+                              'response_tokens': estimate_tokens(hit['text'])}
+                continue
+        pending.append(i)
+
+    if pending:
+        for i, result in zip(pending, executor.run_sync([prompts[i] for i in pending])):
+            result['index'] = i
+            result['cached'] = False
+            if result['status'] == 'success' and cache is not None:
+                cache.put(keys[i], {'text': result['text'], 'usage': result['usage']})
+            results[i] = result
+
+    if cache is not None:
+        cache.save()
+    return results
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """스텁 백엔드 요청 처리 (server 속성에서 지연/오류 설정을 읽음)"""
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))).decode('utf-8'))
+        prompt = body.get('prompt', '')
+
+        with server.lock:
+            server.requests += 1
+            fail = server.random.random() < server.error_rate
+
+        time.sleep(server.latency)
+        if fail:
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        lines = [line for line in prompt.splitlines() if line.startswith('[')]
+        child_lines = [line for line in lines if line.startswith('[아이]')]
+        text = f"[stub] 발화 {len(lines)}개 (아이 {len(child_lines)}개)"
+        if child_lines:
+            text += f" · 첫 아이 발화: {child_lines[0][5:].strip()}"
+
+        payload = json.dumps({
+            'text': text,
+            'usage': {'input_tokens': estimate_tokens(prompt), 'output_tokens': estimate_tokens(text)},
+        }, ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """
+    로컬 스텁 HTTP 백엔드 (with 문으로 백그라운드 스레드에서 실행)
+
+    with StubServer(latency=0.2, error_rate=0.1) as stub:
+        executor = ChunkExecutor(HTTPBackend(stub.url))
+    """
+
+    def __init__(self, latency: float = 0.1, error_rate: float = 0.0, seed: int = 0, port: int = 0):
+        """
+        Args:
+            latency: 응답 지연 (초)
+            error_rate: 503을 돌려줄 확률 (재시도 테스트용)
+            seed: 오류 난수 시드
+            port: 포트 (0이면 빈 포트 자동 선택)
+        """
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), _StubHandler)
+        self.server.latency = latency
+        self.server.error_rate = error_rate
+        self.server.random = random.Random(seed)
+        self.server.lock = threading.Lock()
+        self.server.requests = 0
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/analyze"
+        self._thread = None
+
+    @property
+    def requests(self) -> int:
+        """받은 요청 수 (재시도 포함)"""
+        return self.server.requests
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+        self._thread.join()
+
+
+def main():
+    import argparse
+    from contextual_analysis import ContextualDialogueAnalyzer
+    from prompt_cache import PromptCache, DEFAULT_CACHE_DIR
+    from call_metrics import CallLog
+
+    parser = argparse.ArgumentParser(description='맥락 분석 청크 동시 실행')
+    parser.add_argument('session', help='세션 폴더 (vtt/ 포함)')
+    parser.add_argument('--url', help='분석 백엔드 URL')
+    parser.add_argument('--stub', action='store_true', help='로컬 스텁 서버를 백엔드로 사용')
+    parser.add_argument('--output-dir', default='contextual_prompts', help='결과 저장 폴더')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='동시 호출 수')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='초당 호출 수 상한')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='호출 1회 타임아웃 (초)')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES, help='재시도 횟수')
+    parser.add_argument('--keep-ratio', type=float, help='구간별로 남길 핵심 발화 토큰 비율 (예: 0.5)')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='프롬프트/응답 캐시 폴더')
+    parser.add_argument('--no-cache', action='store_true', help='캐시 없이 모든 청크 호출')
+    parser.add_argument('--report', help='호출 지연/비용 실행 리포트 JSON 경로')
+    parser.add_argument('--input-price', type=float, help='입력 토큰 100만 개당 가격 (예상 비용 계산)')
+    parser.add_argument('--output-price', type=float, help='출력 토큰 100만 개당 가격')
+    args = parser.parse_args()
+
+    if not args.url and not args.stub:
+        parser.error('--url 또는 --stub 중 하나가 필요합니다')
+
+    cache = None if args.no_cache else PromptCache(args.cache_dir)
+    analyzer = ContextualDialogueAnalyzer(args.session, cache, args.keep_ratio)
+
+    def run(url):
+        executor = ChunkExecutor(HTTPBackend(url, args.timeout), args.concurrency, args.rate,
+                                 timeout=args.timeout, retries=args.retries)
+        call_log = CallLog(executor, args.input_price, args.output_price)
+        analyzer.run_chunk_analysis(executor, args.output_dir, call_log=call_log)
+        if args.report:
+            call_log.save(args.report)
+            print(f"📁 실행 리포트: {args.report}")
+
+    if args.stub:
+        with StubServer() as stub:
+            run(stub.url)
+    else:
+        run(args.url)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""
+통합 분석 실행
+- 세션 하나의 VTT를 한 번만 읽고 파싱해(vtt_source.VTTSource) 여러 분석 형식을 함께 생성
+  · basic    : analyze_play_session.py → {세션}_analysis.json
+  · detailed : analyze_metrics.py      → {세션}_detailed_analysis.json
+  · enhanced : enhanced_analysis.py    → {세션}_enhanced_analysis.json
+- 분석기마다 기존 파일 선택 순서(VTT_PATTERNS)로 고른 파일의 발화 목록을 받고 지표 계산은 그대로 사용하므로
+  결과 파일은 개별 실행과 동일 (UI 호환). 같은 파일은 한 번만 읽고, 같은 파일 묶음은 한 번만 파싱
+- 필요한 형식만 골라서 생성 가능 (--formats basic,detailed)
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterable
+
+import analyze_play_session
+import analyze_metrics
+import enhanced_analysis
+from corpus import append_to_corpus
+from vtt_source import FILE_PATTERNS, VTTSource
+
+
+def _run_basic(session_dir: Path, source: VTTSource) -> Dict:
+    """analyze_play_session 기본 분석"""
+    analyzer = analyze_play_session.PlaySessionAnalyzer(session_dir, source=source)
+    return analyzer.generate_full_analysis()
+
+
+def _run_detailed(session_dir: Path, source: VTTSource) -> Dict:
+    """analyze_metrics 상세 분석"""
+    analyzer = analyze_metrics.PlaySessionAnalyzer(str(session_dir), source=source)
+    return analyzer.analyze_all()
+
+
+def _run_enhanced(session_dir: Path, source: VTTSource) -> Dict:
+    """enhanced_analysis 분석 (report_generator 입력 형식)"""
+    analyzer = enhanced_analysis.PlaySessionAnalyzer(str(session_dir), source=source)
+    analyzer.parse_vtt_files()
+    analyzer.load_ai_annotations()
+    analyzer.calculate_metrics()
+    return analyzer.build_result()
+
+
+# 형식 이름 → (분석 함수, 파일 접미사, 코퍼스 kind, VTT 파일 선택 순서)
+FORMATS = {
+    'basic': (_run_basic, '_analysis.json', 'analysis', analyze_play_session.VTT_PATTERNS),
+    'detailed': (_run_detailed, '_detailed_analysis.json', 'detailed', analyze_metrics.VTT_PATTERNS),
+    'enhanced': (_run_enhanced, '_enhanced_analysis.json', 'enhanced', FILE_PATTERNS),
+}
+
+
+def analyze_combined(session_dir, output_dir="analysis_results", formats: Iterable[str] = None,
+                     corpus: str = None, store: str = None) -> Dict[str, Path]:
+    """
+    세션 하나를 한 번 읽어 요청한 형식의 분석 파일 생성
+
+    Args:
+        session_dir: 세션 디렉토리
+        output_dir: 분석 결과 폴더
+        formats: 생성할 형식 목록 (기본: 전부)
+        corpus: 분석 결과 코퍼스(JSONL) 경로. 지정하면 형식별 kind로 함께 추가
+        store: 세션 지표 저장소(SQLite) 경로. 지정하면 형식별 지표를 함께 추가
+
+    Returns:
+        {형식: 저장된 파일 경로}
+    """
+    session_dir = Path(session_dir)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    formats = list(formats) if formats else list(FORMATS)
+    unknown = [kind for kind in formats if kind not in FORMATS]
+    if unknown:
+        raise ValueError(f"알 수 없는 분석 형식: {', '.join(unknown)} (가능: {', '.join(FORMATS)})")
+
+    # 분석 결과를 쓰기 전에 형식별로 한 번씩 파싱 (VTT가 없으면 여기서 FileNotFoundError)
+    source = VTTSource(session_dir)
+    for kind in formats:
+        source.cues(FORMATS[kind][3])
+    saved = {}
+
+    for kind in formats:
+        run, suffix, corpus_kind, _ = FORMATS[kind]
+        result = run(session_dir, source)
+
+        output_file = output_dir / f"{session_dir.name}{suffix}"
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        append_to_corpus(corpus, session_dir.name, corpus_kind, result)
+        if store:
+            from metrics_store import append_to_store
+            append_to_store(store, session_dir.name, result)
+
+        saved[kind] = output_file
+        print(f"💾 {kind} 분석 저장: {output_file}")
+
+    print(f"📂 VTT 파일 {source.reads}개 읽음, 파일 묶음 {source.parses}개 파싱 ({len(formats)}개 형식 공유)")
+    return saved
+
+
+def main():
+    """
+    Usage: python combined_analysis.py <session_dir> [<session_dir> ...]
+                                       [--formats basic,detailed,enhanced] [--output-dir DIR] [--corpus PATH]
+                                       [--store PATH]
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description='세션 VTT를 한 번 읽어 여러 분석 형식 생성')
+    parser.add_argument('sessions', nargs='+', help='세션 디렉토리')
+    parser.add_argument('--formats', default=','.join(FORMATS),
+                        help=f"생성할 형식 (쉼표 구분, 기본: {','.join(FORMATS)})")
+    parser.add_argument('--output-dir', default='analysis_results', help='분석 결과 폴더')
+    parser.add_argument('--corpus', default=None, help='분석 결과 코퍼스(JSONL) 경로')
+    parser.add_argument('--store', default=None, help='세션 지표를 추가할 SQLite 저장소 경로')
+    args = parser.parse_args()
+
+    formats = [kind.strip() for kind in args.formats.split(',') if kind.strip()]
+
+    failed = 0
+    for session_dir in args.sessions:
+        try:
+            analyze_combined(session_dir, args.output_dir, formats, corpus=args.corpus, store=args.store)
+        except Exception as e:
+            failed += 1
+            print(f"❌ 오류 발생 ({session_dir}): {str(e)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
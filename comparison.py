@@ -0,0 +1,227 @@
+"""
+세션 비교 통계 (스트리밍 집계)
+- 분석 결과에서 비교에 필요한 필드만 뽑아 한 행으로 변환
+- 전체/그룹별 평균·최소·최대·표준편차를 온라인(Welford)으로 누적
+- 지표별 상위 3명은 크기 3짜리 힙으로 유지
+- 세션 수와 무관하게 메모리 일정 (pandas 불필요)
+"""
+
+import csv
+import heapq
+import math
+from typing import Any, Dict, List
+
+
+# CSV 컬럼 순서
+COLUMNS = [
+    '세션명', '날짜', '선생님', '아동', '나이',
+    '아동발화비율(%)', '아동발화횟수', '평균발화길이',
+    '긍정비율(%)', '부정비율(%)', '고유단어수', '어휘다양도(%)',
+    '문제해결비율(%)', '총턴수', '턴균형도'
+]
+
+# 전체 통계(평균/최소/최대/표준편차)를 계산하는 지표
+STAT_COLUMNS = ['아동발화비율(%)', '평균발화길이', '긍정비율(%)', '부정비율(%)', '어휘다양도(%)', '문제해결비율(%)']
+
+# 상위 3명을 뽑는 지표
+TOP_COLUMNS = ['아동발화비율(%)', '어휘다양도(%)', '문제해결비율(%)']
+
+# 나이별/선생님별 비교 지표
+GROUP_COLUMNS = ['아동발화비율(%)', '평균발화길이', '긍정비율(%)', '어휘다양도(%)', '문제해결비율(%)']
+
+
+def extract_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    분석 결과(dict)에서 비교용 한 행 추출
+
+    Args:
+        data: *_analysis.json 내용
+
+    Returns:
+        COLUMNS 키를 가진 dict
+    """
+    meta = data['meta_info']
+    speech_ratio = data['speech_ratio']
+    speech_amount = data['child_speech_amount']
+    emotion = data['emotion_analysis']
+    topics = data['topic_keywords']
+    problem_solving = data['problem_solving']
+    turn_taking = data['turn_taking']
+
+    return {
+        '세션명': meta['session_name'],
+        '날짜': meta.get('date', 'N/A'),
+        '선생님': meta.get('teacher_name', 'N/A'),
+        '아동': meta.get('child_name', 'N/A'),
+        '나이': meta.get('child_age', 'N/A'),
+        '아동발화비율(%)': round(speech_ratio['child_speech_ratio'], 1),
+        '아동발화횟수': speech_ratio['child_utterance_count'],
+        '평균발화길이': round(speech_amount['avg_utterance_length'], 1),
+        '긍정비율(%)': round(emotion['positive_ratio'], 1),
+        '부정비율(%)': round(emotion['negative_ratio'], 1),
+        '고유단어수': topics['unique_words'],
+        '어휘다양도(%)': round(topics['unique_words'] / topics['total_words'] * 100, 1),
+        '문제해결비율(%)': round(problem_solving['problem_solving_ratio'], 1),
+        '총턴수': turn_taking['total_turns'],
+        '턴균형도': round(turn_taking['turn_taking_balance'], 2)
+    }
+
+
+class RunningStats:
+    """온라인 평균/분산/최소/최대 (Welford 알고리즘)"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+        self.min_label = None
+        self.max_label = None
+
+    def add(self, value: float, label: Any = None):
+        """값 하나 누적 (label: 최소/최대일 때 함께 보여줄 이름)"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        # 같은 값이면 먼저 나온 것을 유지
+        if self.min is None or value < self.min:
+            self.min, self.min_label = value, label
+        if self.max is None or value > self.max:
+            self.max, self.max_label = value, label
+
+    @property
+    def std(self) -> float:
+        """표본 표준편차 (n-1). 값이 2개 미만이면 nan"""
+        if self.count < 2:
+            return math.nan
+        return math.sqrt(self._m2 / (self.count - 1))
+
+
+class TopK:
+    """상위 k개 유지 (최소 힙)"""
+
+    def __init__(self, k: int = 3):
+        self.k = k
+        self._heap = []
+        self._seq = 0
+
+    def add(self, value: float, item: Any):
+        # 같은 값이면 먼저 나온 항목이 우선 (-seq가 클수록 먼저 들어온 것)
+        entry = (value, -self._seq, item)
+        self._seq += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[Any]:
+        """값 내림차순 (value, item) 목록"""
+        return [(value, item) for value, _, item in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+
+class ComparisonAggregator:
+    """세션 행을 하나씩 받아 비교 통계를 누적"""
+
+    def __init__(self):
+        self.count = 0
+        self.date_min = None
+        self.date_max = None
+        self.teachers = set()
+        self.children = set()
+        self.stats = {col: RunningStats() for col in STAT_COLUMNS}
+        self.top = {col: TopK(3) for col in TOP_COLUMNS}
+        # {그룹 기준: {그룹 값: {지표: RunningStats}}}
+        self.groups = {'나이': {}, '선생님': {}}
+
+    def add(self, row: Dict[str, Any]):
+        """extract_row() 결과 한 행 누적"""
+        self.count += 1
+
+        date = row['날짜']
+        if self.date_min is None or date < self.date_min:
+            self.date_min = date
+        if self.date_max is None or date > self.date_max:
+            self.date_max = date
+
+        self.teachers.add(row['선생님'])
+        self.children.add(row['아동'])
+
+        for col in STAT_COLUMNS:
+            self.stats[col].add(row[col], row['아동'])
+
+        for col in TOP_COLUMNS:
+            self.top[col].add(row[col], (row['아동'], row['나이']))
+
+        for key, groups in self.groups.items():
+            group = groups.setdefault(row[key], {col: RunningStats() for col in GROUP_COLUMNS})
+            for col in GROUP_COLUMNS:
+                group[col].add(row[col])
+
+    def group_table(self, key: str, with_count: bool = False) -> str:
+        """
+        그룹별 평균 표 (그룹 값 문자열 오름차순, meta.json의 숫자 나이도 섞일 수 있음)
+
+        Args:
+            key: '나이' 또는 '선생님'
+            with_count: 세션수 컬럼 포함 여부
+        """
+        groups = self.groups[key]
+        header = list(GROUP_COLUMNS)
+        if with_count:
+            header = ['평균아동발화비율', '평균발화길이', '평균긍정비율', '평균어휘다양도', '평균문제해결비율', '세션수']
+
+        rows = []
+        for name in sorted(groups, key=str):
+            group = groups[name]
+            cells = [f"{round(group[col].mean, 1)}" for col in GROUP_COLUMNS]
+            if with_count:
+                cells.append(str(group[GROUP_COLUMNS[0]].count))
+            rows.append((str(name), cells))
+
+        return format_table(key, header, rows)
+
+
+def format_table(index_name: str, header: List[str], rows: List) -> str:
+    """
+    간단한 텍스트 표 (인덱스 왼쪽 정렬, 값 오른쪽 정렬)
+
+    Args:
+        index_name: 인덱스 컬럼 이름
+        header: 값 컬럼 이름 목록
+        rows: (인덱스, [값 문자열...]) 목록
+    """
+    index_width = max([len(index_name)] + [len(name) for name, _ in rows])
+    widths = [
+        max([len(col)] + [len(cells[i]) for _, cells in rows])
+        for i, col in enumerate(header)
+    ]
+
+    lines = [' ' * index_width + ''.join(f"  {col:>{w}}" for col, w in zip(header, widths)),
+             index_name]
+    for name, cells in rows:
+        lines.append(f"{name:<{index_width}}" + ''.join(f"  {cell:>{w}}" for cell, w in zip(cells, widths)))
+    return '\n'.join(lines)
+
+
+class ComparisonCSVWriter:
+    """비교 행을 CSV로 한 줄씩 기록 (엑셀 호환 utf-8-sig)"""
+
+    def __init__(self, path):
+        self._file = open(path, 'w', encoding='utf-8-sig', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=COLUMNS, lineterminator='\n')
+        self._writer.writeheader()
+
+    def write(self, row: Dict[str, Any]):
+        self._writer.writerow(row)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -3,24 +3,41 @@
 - VTT 파일의 의미적 분석
 - AI 기반 대화 내용 요약 및 발달적 순간 추출
 - 계층적 요약 (청크 → 전체)
+- 프롬프트는 토큰 예산 단위로 분할 (prompt_chunker, 청크 경계는 발화 일부를 겹쳐서 맥락 유지)
+- 캐시를 주면 프롬프트와 모델 응답을 내용 해시로 재사용 (대화가 바뀐 청크만 다시 호출)
+- keep_ratio를 주면 10분 구간마다 정보량이 높은 발화만 남겨 프롬프트를 줄임 (salience)
+- 묶음 모드: 청크별 .txt 대신 배치 전체를 JSONL 하나(+ 오프셋 인덱스, 선택적으로 gzip)로 내보냄 (corpus)
+- 백엔드 호출마다 대기/지연/토큰/캐시 적중을 기록해 p50/p95와 합계를 요약 파일에 남김 (call_metrics)
 """
 
 import os
 import json
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from prompt_chunker import (
+    estimate_tokens, pack_by_tokens, LINE_OVERHEAD_TOKENS,
+    DEFAULT_MAX_TOKENS, DEFAULT_OVERLAP_TOKENS,
+)
+from prompt_cache import cache_key
+from cue_dedup import CueDeduplicator, file_offset, timestamp_seconds
+
 
 class ContextualDialogueAnalyzer:
     """맥락 기반 대화 분석기"""
     
-    def __init__(self, session_path: str):
+    def __init__(self, session_path: str, cache=None, keep_ratio: Optional[float] = None):
         """
         Args:
             session_path: 세션 폴더 경로
+            cache: prompt_cache.PromptCache (None이면 캐시 없이 매번 생성/호출)
+            keep_ratio: 구간별로 남길 발화 토큰 비율 (None이면 모든 발화 사용)
         """
         self.session_path = session_path
+        self.cache = cache
+        self.keep_ratio = keep_ratio
+        self._prompt_layout = None
         self.session_name = os.path.basename(session_path)
         self.vtt_path = os.path.join(session_path, 'vtt')
         
@@ -92,6 +109,7 @@ class ContextualDialogueAnalyzer:
         
         # 청크로 그룹화
         chunks = []
+        dedup = CueDeduplicator()
         current_chunk = {
             'start_min': 0,
             'end_min': chunk_minutes,
@@ -105,8 +123,14 @@ class ContextualDialogueAnalyzer:
             with open(filepath, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            # 대화 추출
-            dialogues = self._parse_vtt_content(content)
+            # 대화 추출 (파일 경계를 넘는 중복 큐 제외)
+            dialogues = [
+                d for d in self._parse_vtt_content(content, vtt['start_min'] * 60, vtt['end_min'] * 60)
+                if not dedup.is_duplicate(d['start'], d['speaker'], d['text'])
+            ]
+            for d in dialogues:
+                d['start_min'] = vtt['start_min']
+                d['end_min'] = vtt['end_min']
             
             # 청크에 추가
             if vtt['start_min'] < current_chunk['end_min']:
@@ -125,13 +149,65 @@ class ContextualDialogueAnalyzer:
         if current_chunk['dialogues']:
             chunks.append(current_chunk)
         
-        print(f"✅ {len(selected_files)}개 파일을 {len(chunks)}개 청크로 그룹화")
+        print(f"✅ {len(selected_files)}개 파일을 {len(chunks)}개 청크로 그룹화 (중복 큐 {dedup.dropped}개 제거)")
+        
+        return chunks
+    
+    def load_token_chunks(self, max_tokens: int = DEFAULT_MAX_TOKENS,
+                          overlap_tokens: int = DEFAULT_OVERLAP_TOKENS) -> List[Dict[str, Any]]:
+        """
+        세션 전체 발화를 프롬프트 토큰 예산 단위 청크로 분할
+        (keep_ratio가 없으면 발화를 버리지 않음, 있으면 10분 구간마다 핵심 발화만 선택)
+        
+        Args:
+            max_tokens: 프롬프트 하나의 토큰 예산 (안내문 포함, 추정치)
+            overlap_tokens: 다음 청크가 앞 청크 끝 발화를 다시 포함할 토큰 수
+        
+        Returns:
+            청크 리스트 (start_min, end_min, dialogues, overlap, token_estimate)
+        """
+        windows = self.load_vtt_files()
+        sampled = self.keep_ratio is not None
+        if sampled:
+            from salience import sample_salient
+            total = sum(len(w['dialogues']) for w in windows)
+            dialogues = [d for w in windows for d in sample_salient(w['dialogues'], self.keep_ratio)]
+            print(f"✂️  핵심 발화 선택: {total}개 → {len(dialogues)}개 (토큰 {self.keep_ratio:.0%})")
+        else:
+            dialogues = [d for w in windows for d in w['dialogues']]
+        
+        # 안내문 등 대화 외 고정 비용 (겹침/발췌 안내 줄 포함해서 넉넉히)
+        overhead = estimate_tokens(self.create_chunk_prompt(
+            {'start_min': 0, 'end_min': 0, 'dialogues': [], 'overlap': 1, 'sampled': True}
+        ))
+        budget = max_tokens - overhead
+        if budget <= 0:
+            raise ValueError(f"max_tokens({max_tokens})가 프롬프트 고정 비용({overhead})보다 작습니다")
+        
+        costs = [estimate_tokens(d['text']) + LINE_OVERHEAD_TOKENS for d in dialogues]
+        
+        chunks = []
+        previous_end = 0
+        for start, end in pack_by_tokens(costs, budget, overlap_tokens):
+            chunks.append({
+                'start_min': dialogues[start]['start_min'],
+                'end_min': dialogues[end - 1]['end_min'],
+                'dialogues': dialogues[start:end],
+                'overlap': max(0, previous_end - start),
+                'sampled': sampled,
+                'token_estimate': overhead + sum(costs[start:end]),
+            })
+            previous_end = end
+        
+        print(f"✅ 발화 {len(dialogues)}개를 {len(chunks)}개 청크로 분할 (예산 {max_tokens}토큰, 겹침 {overlap_tokens}토큰)")
         
         return chunks
     
-    def _parse_vtt_content(self, content: str) -> List[Dict[str, Any]]:
-        """VTT 내용 파싱"""
+    def _parse_vtt_content(self, content: str, segment_start: float = 0.0,
+                           segment_end: float = 0.0) -> List[Dict[str, Any]]:
+        """VTT 내용 파싱 (start: 세션 기준 시작 초, segment_start/end는 파일명의 구간 초)"""
         dialogues = []
+        offset = None
         
         pattern = r'(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}\.\d{3})\s*\n\[(.*?)\]\s*(.*?)(?=\n\n|\Z)'
         matches = re.finditer(pattern, content, re.DOTALL)
@@ -142,7 +218,12 @@ class ContextualDialogueAnalyzer:
             
             speaker_type = 'teacher' if '선생님' in speaker or '교사' in speaker else 'child'
             
+            # 파일 기준/세션 기준 시간 여부는 파일 첫 큐로 한 번만 판단
+            if offset is None:
+                offset = file_offset(segment_start, segment_end, timestamp_seconds(match.group(1)))
+            
             dialogues.append({
+                'start': timestamp_seconds(match.group(1), offset),
                 'speaker': speaker,
                 'speaker_type': speaker_type,
                 'text': text
@@ -158,11 +239,16 @@ class ContextualDialogueAnalyzer:
             speaker_label = "선생님" if d['speaker_type'] == 'teacher' else "아이"
             dialogues_text.append(f"[{speaker_label}] {d['text']}")
         
+        if chunk.get('overlap'):
+            dialogues_text.insert(0, f"(앞의 {chunk['overlap']}개 발화는 이전 구간과 겹치는 맥락입니다)")
+        if chunk.get('sampled'):
+            dialogues_text.insert(0, "(정보량이 높은 발화만 시간 순서대로 발췌했습니다)")
+        
         prompt = f"""다음은 {self.metadata['teacher']} 선생님과 {self.metadata['child']} 아동({self.metadata['age']})의 
 {chunk['start_min']}-{chunk['end_min']}분 구간 놀이 대화입니다.
 
 # 대화 내용
-{chr(10).join(dialogues_text[:200])}  # 최대 200개 발화만
+{chr(10).join(dialogues_text)}
 
 # 분석 요청
 다음 관점에서 이 구간의 대화를 분석해주세요:
@@ -179,39 +265,76 @@ class ContextualDialogueAnalyzer:
         
         return prompt
     
+    def _cached_prompt(self, chunk: Dict[str, Any]) -> str:
+        """캐시에 같은 청크(대화 + 프롬프트 양식)의 프롬프트가 있으면 재사용"""
+        if self.cache is None:
+            return self.create_chunk_prompt(chunk)
+        
+        # 프롬프트 양식/메타데이터가 바뀌면 키도 바뀌도록 빈 청크 프롬프트를 키에 포함
+        if self._prompt_layout is None:
+            self._prompt_layout = self.create_chunk_prompt(
+                {'start_min': 0, 'end_min': 0, 'dialogues': [], 'overlap': 1, 'sampled': True}
+            )
+        key = cache_key('prompt', {
+            'layout': self._prompt_layout,
+            'range': [chunk['start_min'], chunk['end_min']],
+            'overlap': chunk.get('overlap', 0),
+            'sampled': chunk.get('sampled', False),
+            'dialogues': [[d['speaker_type'], d['text']] for d in chunk['dialogues']],
+        })
+        
+        prompt = self.cache.get(key)
+        if prompt is None:
+            prompt = self.create_chunk_prompt(chunk)
+            self.cache.put(key, prompt)
+        return prompt
+    
     def analyze_chunk_with_ai(self, chunk: Dict[str, Any]) -> Dict[str, Any]:
         """
-        청크를 AI로 분석 (실제로는 API 호출)
+        청크 분석 요청 구성 (프롬프트 + 메타 정보)
         
-        현재는 프롬프트만 생성하고, 실제 API 호출은 별도 구현 필요
+        실제 호출은 run_chunk_analysis에서 chunk_executor로 여러 청크를 동시에 실행
         """
-        prompt = self.create_chunk_prompt(chunk)
+        prompt = self._cached_prompt(chunk)
         
-        # TODO: 실제 Claude API 호출
-        # response = anthropic.messages.create(...)
-        
-        # 지금은 구조만 반환
         return {
             'time_range': f"{chunk['start_min']}-{chunk['end_min']}분",
             'prompt': prompt,
             'dialogue_count': len(chunk['dialogues']),
-            # 'ai_summary': response.content  # 실제 API 응답
+            'overlap_count': chunk.get('overlap', 0),
+            'token_estimate': estimate_tokens(prompt),
         }
     
-    def generate_prompts_for_manual_analysis(self, output_dir: str = 'contextual_prompts'):
+    def generate_prompts_for_manual_analysis(self, output_dir: str = 'contextual_prompts',
+                                             max_tokens: int = DEFAULT_MAX_TOKENS,
+                                             overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+                                             bundle_path: Optional[str] = None):
         """
         수동 분석을 위한 프롬프트 파일 생성
         (API 키 없이도 사용 가능하도록)
+        
+        Args:
+            output_dir: 프롬프트 저장 폴더
+            max_tokens: 프롬프트 하나의 토큰 예산
+            overlap_tokens: 청크 사이에 겹치는 토큰 수
+            bundle_path: 묶음 JSONL 경로 (.gz면 압축). 지정하면 청크별 .txt 대신 이 파일에 추가하고
+                         _all_prompts.json에는 프롬프트 본문을 중복 저장하지 않음.
+                         여러 세션이 같은 묶음에 추가할 수 있음 (배치 하나당 묶음 하나)
         """
         os.makedirs(output_dir, exist_ok=True)
         
-        chunks = self.load_vtt_files(chunk_minutes=10)
+        chunks = self.load_token_chunks(max_tokens, overlap_tokens)
+        prompts = [self.analyze_chunk_with_ai(chunk) for chunk in chunks]
         
-        prompts = []
-        for i, chunk in enumerate(chunks, 1):
-            analysis = self.analyze_chunk_with_ai(chunk)
-            prompts.append(analysis)
-            
+        if bundle_path:
+            self._append_prompt_bundle(bundle_path, prompts)
+            self._save_prompt_summary(output_dir, prompts, max_tokens, overlap_tokens,
+                                      bundle_path=bundle_path)
+            print(f"\n✅ {len(prompts)}개 청크 프롬프트를 묶음에 추가")
+            print(f"📦 묶음 파일: {bundle_path} (인덱스: {bundle_path}.idx)")
+            return prompts
+        
+        for i, analysis in enumerate(prompts, 1):
             # 개별 프롬프트 파일 저장
             prompt_file = os.path.join(
                 output_dir, 
@@ -221,17 +344,11 @@ class ContextualDialogueAnalyzer:
             with open(prompt_file, 'w', encoding='utf-8') as f:
                 f.write(analysis['prompt'])
                 f.write("\n\n" + "="*70)
-                f.write(f"\n발화 수: {analysis['dialogue_count']}개")
+                f.write(f"\n발화 수: {analysis['dialogue_count']}개 (겹침 {analysis['overlap_count']}개)")
+                f.write(f"\n추정 토큰: {analysis['token_estimate']}")
         
         # 통합 요약본
-        summary_file = os.path.join(output_dir, f"{self.session_name}_all_prompts.json")
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'session': self.session_name,
-                'metadata': self.metadata,
-                'total_chunks': len(prompts),
-                'prompts': prompts
-            }, f, ensure_ascii=False, indent=2)
+        self._save_prompt_summary(output_dir, prompts, max_tokens, overlap_tokens)
         
         print(f"\n✅ {len(prompts)}개 청크 프롬프트 생성 완료")
         print(f"📁 출력 폴더: {output_dir}")
@@ -241,17 +358,141 @@ class ContextualDialogueAnalyzer:
         print(f"   3. 모든 요약을 통합하여 최종 분석")
         
         return prompts
+    
+    def _append_prompt_bundle(self, bundle_path: str, prompts: List[Dict[str, Any]]):
+        """
+        청크 프롬프트를 묶음 JSONL에 추가
+        
+        레코드: {'session': '<세션>_chunkNN', 'kind': 'prompt', 'data': {'session', 'chunk', 'prompt', ...}}
+        ('session' 값은 배치 추론 결과를 되돌려 붙일 때 쓰는 요청 ID, 개별 파일 모드의 파일명 앞부분과 같음)
+        """
+        from corpus import CorpusWriter
+        
+        CorpusWriter(bundle_path).append_many([
+            (f"{self.session_name}_chunk{i:02d}", 'prompt',
+             {'session': self.session_name, 'chunk': i, **analysis})
+            for i, analysis in enumerate(prompts, 1)
+        ])
+    
+    def _save_prompt_summary(self, output_dir: str, prompts: List[Dict[str, Any]],
+                             max_tokens: int, overlap_tokens: int,
+                             call_metrics: Optional[Dict[str, Any]] = None,
+                             bundle_path: Optional[str] = None) -> str:
+        """
+        <세션>_all_prompts.json 저장 (백엔드로 분석했으면 호출 집계 포함,
+        묶음으로 내보냈으면 프롬프트 본문 대신 묶음 경로)
+        
+        Returns:
+            저장된 파일 경로
+        """
+        summary = {
+            'session': self.session_name,
+            'metadata': self.metadata,
+            'total_chunks': len(prompts),
+            'max_tokens': max_tokens,
+            'overlap_tokens': overlap_tokens,
+            'total_token_estimate': sum(p['token_estimate'] for p in prompts),
+        }
+        if call_metrics is not None:
+            summary['call_metrics'] = call_metrics
+        if bundle_path:
+            summary['bundle'] = str(bundle_path)
+            prompts = [{k: v for k, v in p.items() if k != 'prompt'} for p in prompts]
+        summary['prompts'] = prompts
+        
+        summary_file = os.path.join(output_dir, f"{self.session_name}_all_prompts.json")
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        return summary_file
+    
+    def run_chunk_analysis(self, executor, output_dir: str = 'contextual_prompts',
+                           max_tokens: int = DEFAULT_MAX_TOKENS,
+                           overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+                           call_log=None) -> List[Dict[str, Any]]:
+        """
+        모든 청크를 백엔드로 동시에 분석하고 청크별 요약 저장
+        
+        Args:
+            executor: chunk_executor.ChunkExecutor
+            output_dir: 결과 저장 폴더
+            max_tokens: 프롬프트 하나의 토큰 예산
+            overlap_tokens: 청크 사이에 겹치는 토큰 수
+            call_log: call_metrics.CallLog (여러 세션의 호출 기록을 실행 리포트로 모을 때)
+        
+        Returns:
+            청크별 분석 결과 (ai_summary 또는 error 포함)
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        
+        chunks = self.load_token_chunks(max_tokens, overlap_tokens)
+        analyses = [self.analyze_chunk_with_ai(chunk) for chunk in chunks]
+        
+        from chunk_executor import run_cached
+        from call_metrics import call_record, summarize_calls, format_summary
+        
+        print(f"🚀 {len(analyses)}개 청크 분석 중 (동시 {executor.concurrency}개, 초당 {executor.rate}회)")
+        started = datetime.now()
+        # 캐시에 응답이 있는 청크는 호출하지 않음
+        results = run_cached(executor, [a['prompt'] for a in analyses], self.cache)
+        elapsed = (datetime.now() - started).total_seconds()
+        
+        records = [call_record(result) for result in results]
+        if call_log is not None:
+            call_log.add(self.session_name, 'chunk', records)
+            call_metrics = call_log.summarize(records)
+        else:
+            call_metrics = summarize_calls(records)
+        
+        for analysis, result, record in zip(analyses, results, records):
+            analysis['status'] = result['status']
+            analysis['attempts'] = result['attempts']
+            analysis['cached'] = result['cached']
+            analysis['call'] = record
+            if result['status'] == 'success':
+                analysis['ai_summary'] = result['text']
+                analysis['usage'] = result['usage']
+                if 'latency' in result:
+                    analysis['latency'] = round(result['latency'], 3)
+            else:
+                analysis['error'] = result['error']
+        
+        self.chunk_summaries = analyses
+        
+        summary_file = os.path.join(output_dir, f"{self.session_name}_chunk_summaries.json")
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'session': self.session_name,
+                'metadata': self.metadata,
+                'total_chunks': len(analyses),
+                'failed_chunks': sum(1 for a in analyses if a['status'] != 'success'),
+                'elapsed_seconds': round(elapsed, 2),
+                'call_metrics': call_metrics,
+                'chunks': [{k: v for k, v in a.items() if k != 'prompt'} for a in analyses],
+            }, f, ensure_ascii=False, indent=2)
+        self._save_prompt_summary(output_dir, analyses, max_tokens, overlap_tokens, call_metrics)
+        
+        failed = sum(1 for a in analyses if a['status'] != 'success')
+        cached = sum(1 for a in analyses if a['cached'])
+        print(f"✅ {len(analyses) - failed}개 성공 (캐시 {cached}개), {failed}개 실패 ({elapsed:.1f}초)")
+        print(f"⏱️  {format_summary(call_metrics)}")
+        print(f"📁 저장: {summary_file}")
+        
+        return analyses
 
 
-def analyze_session_contextually(session_path: str, output_dir: str = 'contextual_prompts'):
-    """세션의 맥락적 분석 프롬프트 생성"""
+def analyze_session_contextually(session_path: str, output_dir: str = 'contextual_prompts',
+                                 max_tokens: int = DEFAULT_MAX_TOKENS,
+                                 overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+                                 keep_ratio: Optional[float] = None,
+                                 bundle_path: Optional[str] = None):
+    """세션의 맥락적 분석 프롬프트 생성 (bundle_path: 청크별 파일 대신 묶음 JSONL에 추가)"""
     
     print(f"\n{'='*70}")
     print(f"🎯 맥락 기반 분석 시작: {os.path.basename(session_path)}")
     print(f"{'='*70}\n")
     
-    analyzer = ContextualDialogueAnalyzer(session_path)
-    prompts = analyzer.generate_prompts_for_manual_analysis(output_dir)
+    analyzer = ContextualDialogueAnalyzer(session_path, keep_ratio=keep_ratio)
+    prompts = analyzer.generate_prompts_for_manual_analysis(output_dir, max_tokens, overlap_tokens, bundle_path)
     
     print(f"\n{'='*70}")
     print(f"✅ 완료!")
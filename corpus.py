@@ -0,0 +1,160 @@
+"""
+분석 결과 코퍼스 (JSON Lines + 오프셋 인덱스)
+- 세션별 분석 결과를 한 줄짜리 compact JSON으로 하나의 .jsonl 파일에 추가
+- <코퍼스>.idx 인덱스에 (세션, 종류, 오프셋, 길이)를 기록해 특정 세션으로 바로 seek
+- 여러 프로세스가 같은 코퍼스에 동시에 추가해도 안전 (파일 잠금)
+- .gz 경로면 레코드마다 독립된 gzip 멤버로 압축 → 파일 전체는 그대로 gzip 스트림(JSONL)으로 읽히고,
+  인덱스의 (오프셋, 길이)로 멤버 하나만 바로 풀 수 있음
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: 잠금 없이 동작
+    fcntl = None
+
+
+def _index_path(path) -> Path:
+    return Path(str(path) + '.idx')
+
+
+def _is_compressed(path) -> bool:
+    return str(path).endswith('.gz')
+
+
+def _decode(raw: bytes, compressed: bool) -> Dict[str, Any]:
+    """레코드 바이트 (압축이면 gzip 멤버 하나) → 레코드"""
+    if compressed:
+        import gzip
+        raw = gzip.decompress(raw)
+    return json.loads(raw)
+
+
+class CorpusWriter:
+    """코퍼스 추가 기록기"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.index_path = _index_path(self.path)
+        self.compressed = _is_compressed(self.path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _encode(self, session: str, kind: str, data: Dict[str, Any]) -> bytes:
+        record = {'session': session, 'kind': kind, 'data': data}
+        line = (json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+        if self.compressed:
+            import gzip
+            # mtime 고정: 같은 레코드는 같은 바이트 (동기화 시 변경 없음으로 보이도록)
+            line = gzip.compress(line, mtime=0)
+        return line
+
+    def append(self, session: str, kind: str, data: Dict[str, Any]) -> Tuple[int, int]:
+        """
+        세션 결과 한 건 추가
+
+        Args:
+            session: 세션 이름
+            kind: 결과 종류 ('analysis', 'detailed', 'enhanced' 등)
+            data: 분석 결과 dict
+
+        Returns:
+            (offset, length) - 코퍼스 파일 내 바이트 위치
+        """
+        return self.append_many([(session, kind, data)])[0]
+
+    def append_many(self, records: List[Tuple[str, str, Dict[str, Any]]]) -> List[Tuple[int, int]]:
+        """
+        여러 건을 잠금 한 번으로 연속 추가 (묶음 내보내기용)
+
+        Args:
+            records: [(session, kind, data), ...]
+
+        Returns:
+            레코드별 (offset, length)
+        """
+        lines = [(session, kind, self._encode(session, kind, data)) for session, kind, data in records]
+        positions = []
+
+        with open(self.path, 'ab') as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(b''.join(line for _, _, line in lines))
+                f.flush()
+                with open(self.index_path, 'a', encoding='utf-8') as idx:
+                    for session, kind, line in lines:
+                        idx.write(f"{session}\t{kind}\t{offset}\t{len(line)}\n")
+                        positions.append((offset, len(line)))
+                        offset += len(line)
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+        return positions
+
+
+def append_to_corpus(corpus_path: Optional[str], session: str, kind: str, data: Dict[str, Any]):
+    """corpus_path가 지정된 경우에만 결과 추가 (선택 기능 연결용)"""
+    if corpus_path:
+        CorpusWriter(corpus_path).append(session, kind, data)
+
+
+class CorpusReader:
+    """코퍼스 조회기 - 인덱스로 세션 결과를 바로 읽음"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.index_path = _index_path(self.path)
+        self.compressed = _is_compressed(self.path)
+        self.index = self._load_index()
+
+    def _load_index(self) -> Dict[Tuple[str, str], Tuple[int, int]]:
+        """인덱스 로드 (같은 세션이 여러 번 기록되면 마지막 것이 유효)"""
+        index = {}
+        if not self.index_path.exists():
+            return index
+
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.rstrip('\n').split('\t')
+                if len(parts) == 4:
+                    session, kind, offset, length = parts
+                    index[(session, kind)] = (int(offset), int(length))
+        return index
+
+    def sessions(self, kind: Optional[str] = None) -> List[str]:
+        """기록된 세션 이름 목록"""
+        return sorted({s for s, k in self.index if kind is None or k == kind})
+
+    def get(self, session: str, kind: str = 'analysis') -> Optional[Dict[str, Any]]:
+        """세션 결과 하나를 seek로 바로 읽기"""
+        entry = self.index.get((session, kind))
+        if entry is None:
+            return None
+
+        offset, length = entry
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return _decode(f.read(length), self.compressed)['data']
+
+    def iter_records(self, kind: Optional[str] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        세션별 최신 결과를 파일 순서대로 순회 ((session, data) 튜플)
+
+        파일 하나를 앞에서부터 읽으므로 세션 수와 무관하게 파일 열기는 한 번입니다.
+        """
+        entries = sorted(
+            (offset, length, session)
+            for (session, k), (offset, length) in self.index.items()
+            if kind is None or k == kind
+        )
+
+        with open(self.path, 'rb') as f:
+            for offset, length, session in entries:
+                f.seek(offset)
+                yield session, _decode(f.read(length), self.compressed)['data']
@@ -0,0 +1,109 @@
+"""
+VTT 중복 큐 제거 (수집 단계)
+- 겹치는 구간 VTT나 같은 발화가 두 번 기록된 큐가 합쳐지면 같은 발화가 두 번 들어옴
+  → 발화 수/단어 수가 부풀고 프롬프트 토큰도 두 배
+- 키: (화자, 정규화 텍스트). 세션 기준 시작 시간 차이가 tolerance 이하인 같은 키는 중복
+  (실제로 같은 말을 반복하면 앞 발화가 끝난 뒤에 시작하므로 시작 시간이 떨어져 있음)
+- 최근 horizon 초 안의 큐만 해시에 유지하는 슬라이딩 윈도우 → 세션 길이와 무관하게 메모리 일정,
+  파일 경계를 넘어 순서가 조금 뒤섞여도 비교 가능
+"""
+
+import re
+from collections import deque
+from typing import Any, Dict
+
+# 시작 시간 차이가 이 값(초) 이하이면 같은 큐
+DEFAULT_TOLERANCE = 0.5
+
+# 해시에 유지할 시간 범위 (초, 2분 단위 파일 하나)
+DEFAULT_HORIZON = 120.0
+
+# 비교에서 무시할 공백/문장부호
+_IGNORED_RE = re.compile(r'[\s.,!?~…·\'"“”‘’()\[\]-]+')
+
+
+def normalize_text(text: str) -> str:
+    """비교용 텍스트 (공백/문장부호 제거, 소문자)"""
+    return _IGNORED_RE.sub('', text).lower()
+
+
+def timestamp_seconds(timestamp: str, offset: float = 0.0) -> float:
+    """
+    VTT 타임스탬프 (HH:MM:SS.mmm) → 세션 기준 초
+
+    Args:
+        timestamp: VTT 타임스탬프
+        offset: 파일 오프셋 (초, file_offset으로 파일마다 한 번 정한 값)
+    """
+    h, m, s = timestamp.split(':')
+    return int(h) * 3600 + int(m) * 60 + float(s) + offset
+
+
+def file_offset(segment_start: float, segment_end: float, first_start: float) -> float:
+    """
+    2분 단위 파일 하나의 시간 오프셋 (초, 파일 단위로 한 번 결정)
+
+    파일마다 시간이 0부터 다시 시작하면 구간 시작을 더하고, 이미 세션 기준이면 0.
+    큐마다 판단하면 세션 기준 파일에서 구간 시작보다 조금 앞선 겹침 큐(예: 010-012분 파일의
+    00:09:59.800)까지 밀려나므로, 파일 첫 큐가 구간 길이의 절반보다 더 앞서 있을 때만 파일 기준으로 봄
+
+    Args:
+        segment_start: 파일명의 구간 시작 (초)
+        segment_end: 파일명의 구간 끝 (초)
+        first_start: 파일 첫 큐의 시작 (파일에 적힌 그대로, 초)
+    """
+    if first_start < segment_start - (segment_end - segment_start) / 2:
+        return float(segment_start)
+    return 0.0
+
+
+class CueDeduplicator:
+    """슬라이딩 윈도우 해시 기반 중복 큐 판별기 (세션 하나당 하나)"""
+
+    def __init__(self, tolerance: float = DEFAULT_TOLERANCE, horizon: float = DEFAULT_HORIZON):
+        """
+        Args:
+            tolerance: 같은 큐로 볼 시작 시간 차이 (초)
+            horizon: 해시에 유지할 시간 범위 (초)
+        """
+        self.tolerance = tolerance
+        self.horizon = horizon
+        self._starts = {}        # (화자, 정규화 텍스트) → [시작 초...]
+        self._window = deque()   # (시작 초, 키) 들어온 순서
+        self._latest = float('-inf')
+        self.kept = 0
+        self.dropped = 0
+
+    def is_duplicate(self, start: float, speaker: str, text: str) -> bool:
+        """
+        큐 하나 판별 (중복이 아니면 윈도우에 기록)
+
+        Args:
+            start: 세션 기준 시작 초
+            speaker: 화자
+            text: 발화 텍스트
+        """
+        self._latest = max(self._latest, start)
+        while self._window and self._window[0][0] < self._latest - self.horizon:
+            old_start, old_key = self._window.popleft()
+            starts = self._starts[old_key]
+            starts.remove(old_start)
+            if not starts:
+                del self._starts[old_key]
+
+        key = (speaker, normalize_text(text))
+        starts = self._starts.get(key)
+        if starts is not None and any(abs(start - s) <= self.tolerance for s in starts):
+            self.dropped += 1
+            return True
+
+        if starts is None:
+            self._starts[key] = [start]
+        else:
+            starts.append(start)
+        self._window.append((start, key))
+        self.kept += 1
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        return {'kept': self.kept, 'dropped': self.dropped}
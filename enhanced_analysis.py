@@ -0,0 +1,405 @@
+"""
+놀이 세션 분석 엔진 (enhanced)
+- VTT 파일 파싱 (화자 구분, 2분 단위 파일의 시간 보정, 중복 큐 제거)
+- 8개 핵심 지표 + 10분 단위 시간대별 분석을 발화 한 번 순회로 계산
+- TF-IDF 에피소드 클러스터링으로 발달 영역별 핵심 에피소드 선택 (episode_clustering, 모델 호출 없음)
+- ai_response/의 구간별 AI 분석 결과를 발화 시간축에 맞춰 주석으로 첨부 (있는 경우)
+- 결과: {세션}_enhanced_analysis.json (report_generator.py 입력 형식)
+"""
+
+import os
+import re
+import json
+import heapq
+from pathlib import Path
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Any, List, Tuple
+
+from corpus import append_to_corpus
+from vtt_source import VTTSource
+
+
+# 주제 추출용 단어 (한글 2자 이상)
+WORD_RE = re.compile(r'[가-힣]{2,}')
+
+# 시간대별 분석 구간 (초)
+TIME_SEGMENT_SECONDS = 600
+
+# 대화 발췌 (발달 영역별 기준 발화 앞 1개 ~ 뒤 2개)
+DIALOGUE_BEFORE = 1
+DIALOGUE_AFTER = 2
+
+# 키워드 사전 (salience의 발화 점수에도 사용)
+POSITIVE_WORDS = ['좋아', '재밌', '신나', '신기', '멋지', '우와', '예쁘', '행복',
+                  '즐거', '웃', '고마워', '사랑', '최고', '대박']
+NEGATIVE_WORDS = ['싫어', '안돼', '아니', '슬퍼', '무서', '아파', '힘들', '짜증',
+                  '화나', '미워', '속상', '싫']
+PROBLEM_SOLVING_WORDS = ['어떻게', '왜', '방법', '생각', '해결', '찾', '만들',
+                         '해볼까', '할까', '하면', '이렇게', '그러면', '그럼']
+
+
+def _keyword_re(words: List[str]):
+    """키워드 목록 → 하나의 정규식 (긴 키워드 우선)"""
+    return re.compile('|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True)))
+
+
+def _mmss(seconds: float) -> str:
+    """초 → MM:SS"""
+    return f"{int(seconds // 60):02d}:{int(seconds % 60):02d}"
+
+
+class PlaySessionAnalyzer:
+    """놀이 세션 분석기 (enhanced 형식)"""
+
+    def __init__(self, session_path: str, source=None):
+        """
+        Args:
+            session_path: 세션 폴더 경로 (vtt/ 포함)
+            source: 공유 VTT 소스 (vtt_source.VTTSource). 지정하면 다른 분석기와 파싱 결과 공유
+        """
+        self.session_path = Path(session_path)
+        self.session_name = self.session_path.name
+        self.vtt_dir = self.session_path / "vtt"
+        self.ai_response_dir = self.session_path / "ai_response"
+        self.source = source if source is not None else VTTSource(self.session_path)
+
+        self.metadata = self._parse_session_name()
+        self.utterances = []  # (is_child, start, end, text)
+        self.dropped_cues = 0
+        self.ai_annotations = []
+        self.analysis_results = {}
+        self.result = None
+
+        # 키워드 사전
+        self.positive_words = list(POSITIVE_WORDS)
+        self.negative_words = list(NEGATIVE_WORDS)
+        self.problem_solving_words = list(PROBLEM_SOLVING_WORDS)
+        self.topic_words = {
+            '놀이': ['놀이', '놀자', '게임', '블록', '레고', '인형', '장난감', '만들'],
+            '가족': ['엄마', '아빠', '할머니', '할아버지', '언니', '오빠', '누나', '형', '동생'],
+            '감정': ['좋아', '싫어', '무서', '슬퍼', '화나', '기뻐', '재밌'],
+            '일상': ['밥', '먹', '자', '학교', '유치원', '어린이집', '집'],
+            '질문': ['왜', '어떻게', '뭐', '무엇', '어디', '누가', '언제'],
+        }
+        self.stopwords = {'이거', '저거', '그거', '이게', '저게', '그게', '있어', '없어',
+                          '이렇게', '저렇게', '그렇게', '선생님'}
+
+        self._positive_re = _keyword_re(self.positive_words)
+        self._negative_re = _keyword_re(self.negative_words)
+        self._problem_re = _keyword_re(self.problem_solving_words)
+        self._topic_res = [(topic, _keyword_re(words)) for topic, words in self.topic_words.items()]
+
+    def _parse_session_name(self) -> Dict[str, str]:
+        """세션명에서 메타데이터 추출 (예: 20251017-이민정교사-김준우-만4세-02_00_48-65kbps_mono)"""
+        parts = self.session_name.split('-')
+        teacher = parts[1] if len(parts) > 1 else ''
+        if teacher.endswith('교사'):
+            teacher = teacher[:-len('교사')]
+
+        return {
+            'date': parts[0] if parts else '',
+            'teacher': teacher,
+            'child': parts[2] if len(parts) > 2 else '',
+            'age': parts[3] if len(parts) > 3 else '',
+            'duration': parts[4] if len(parts) > 4 else '',
+        }
+
+    def parse_vtt_files(self) -> List[Tuple[bool, float, float, str]]:
+        """
+        VTT 파일 파싱 (파일 선택/세션 기준 시간/중복 큐 제거는 vtt_source.VTTSource.cues)
+
+        Returns:
+            (아동 여부, 시작 초, 종료 초, 텍스트) 목록
+        """
+        self.utterances = self.source.utterances()
+        self.dropped_cues = self.source.dropped
+        return self.utterances
+
+    def load_ai_annotations(self) -> List[Dict[str, Any]]:
+        """
+        ai_response/의 구간별 AI 분석 결과를 발화 시간축에 정렬 (parse_vtt_files 다음에 호출)
+
+        Returns:
+            구간 주석 목록 (ai_response_loader.align_annotations 형식, 폴더가 없으면 빈 목록)
+        """
+        from ai_response_loader import load_ai_responses, align_annotations
+
+        responses = load_ai_responses(self.ai_response_dir)
+        for r in responses:
+            if r['status'] != 'success':
+                print(f"⚠️  AI 응답 건너뜀: {r['source']} - {r['error']}")
+        self.ai_annotations = align_annotations(responses, self.utterances)
+        return self.ai_annotations
+
+    def _classify_topic(self, text: str) -> str:
+        """발화 주제 분류 (첫 번째로 맞는 주제, 없으면 기타)"""
+        for topic, pattern in self._topic_res:
+            if pattern.search(text):
+                return topic
+        return '기타'
+
+    def calculate_metrics(self) -> Dict[str, Any]:
+        """
+        전체 지표 계산 (발화 목록 한 번 순회)
+
+        numpy 벡터화 대신 순수 파이썬 단일 순회: 발화당 작업 대부분이 키워드 정규식이라 배열화할
+        수 있는 수치 집계는 일부이고, 세션당 지표 계산이 수 ms인 데 비해 numpy import가 약 100ms
+        (python benchmark_analyzers.py <세션> --stages). numpy는 레포트 단계에서만 필요합니다.
+
+        Returns:
+            metrics dict (enhanced_analysis.json의 'metrics')
+        """
+        counts = [0, 0]          # [교사, 아동] 발화 수
+        words = [0, 0]           # [교사, 아동] 단어 수
+        durations = [0.0, 0.0]   # [교사, 아동] 말하기 시간
+        problem_counts = [0, 0]
+        problem_examples = ([], [])
+        positive_utterances = negative_utterances = 0
+        child_texts = []
+        topic_distribution = Counter()
+        buckets = {}             # 10분 구간 → [전체, 아동, 교사]
+        session_end = 0.0
+
+        # 주제 지속도: 주제가 있는 발화끼리 같은 주제가 이어진 길이 (기타는 현재 주제를 유지)
+        current_topic = None
+        run_lengths = []
+        run_length = 0
+
+        # 대화 발췌 기준 발화 위치: 언어(가장 긴 아동 발화), 인지(첫 문제해결, 없으면 첫 질문),
+        # 사회정서(첫 정서 표현)
+        anchors = {}
+        longest_words = 0
+        first_question = None
+
+        for index, (is_child, start, end, text) in enumerate(self.utterances):
+            who = 1 if is_child else 0
+            n_words = len(text.split())
+            counts[who] += 1
+            words[who] += n_words
+            durations[who] += max(end - start, 0.0)
+            session_end = max(session_end, end)
+
+            bucket = buckets.setdefault(int(start // TIME_SEGMENT_SECONDS), [0, 0, 0])
+            bucket[0] += 1
+            bucket[1 if is_child else 2] += 1
+
+            if self._problem_re.search(text):
+                problem_counts[who] += 1
+                if len(problem_examples[who]) < 5:
+                    problem_examples[who].append(text)
+                if is_child and '인지발달' not in anchors:
+                    anchors['인지발달'] = index
+
+            topic = self._classify_topic(text)
+            topic_distribution[topic] += 1
+            if topic == '기타' or topic == current_topic:
+                run_length += 1
+            else:
+                if current_topic is not None:
+                    run_lengths.append(run_length)
+                current_topic = topic
+                run_length = 1
+
+            if is_child:
+                child_texts.append(text)
+                if first_question is None and '?' in text:
+                    first_question = index
+                if n_words > longest_words:
+                    longest_words = n_words
+                    anchors['언어발달'] = index
+                emotional = False
+                if self._positive_re.search(text):
+                    positive_utterances += 1
+                    emotional = True
+                if self._negative_re.search(text):
+                    negative_utterances += 1
+                    emotional = True
+                if emotional and '사회정서발달' not in anchors:
+                    anchors['사회정서발달'] = index
+
+        if current_topic is not None:
+            run_lengths.append(run_length)
+        if '인지발달' not in anchors and first_question is not None:
+            anchors['인지발달'] = first_question
+
+        # 키워드/단어 빈도는 아동 발화를 합친 텍스트에서 한 번에 셈
+        child_text = '\n'.join(child_texts)
+        positive_kw = Counter(self._positive_re.findall(child_text))
+        negative_kw = Counter(self._negative_re.findall(child_text))
+        topic_counter = Counter(w for w in WORD_RE.findall(child_text) if w not in self.stopwords)
+
+        total = counts[0] + counts[1]
+        child_count, teacher_count = counts[1], counts[0]
+        total_switches = max(len(run_lengths) - 1, 0)
+        minutes = session_end / 60
+
+        self.analysis_results = {
+            'child_utterance_ratio': child_count / total if total > 0 else 0,
+            'child_utterance_count': child_count,
+            'teacher_utterance_count': teacher_count,
+            'total_utterance_count': total,
+            'child_word_count': words[1],
+            'teacher_word_count': words[0],
+            'child_avg_words_per_utterance': words[1] / child_count if child_count > 0 else 0,
+            'child_speaking_duration': round(durations[1], 3),
+            'teacher_speaking_duration': round(durations[0], 3),
+            'total_session_duration': round(session_end, 3),
+            'child_speaking_ratio': durations[1] / session_end if session_end > 0 else 0,
+            'topic_persistence': sum(run_lengths) / len(run_lengths) if run_lengths else 0,
+            'context_switches': {
+                'total_switches': total_switches,
+                'switches_per_minute': total_switches / minutes if minutes > 0 else 0,
+                'topic_distribution': dict(topic_distribution),
+            },
+            'problem_solving_utterances': {
+                'child_count': problem_counts[1],
+                'teacher_count': problem_counts[0],
+                'child_examples': problem_examples[1],
+                'teacher_examples': problem_examples[0],
+            },
+            'positive_utterances': positive_utterances,
+            'negative_utterances': negative_utterances,
+            'positive_negative_ratio': (positive_utterances / negative_utterances
+                                        if negative_utterances > 0 else float(positive_utterances)),
+            'emotion_keywords': {
+                'positive': [list(item) for item in positive_kw.most_common(10)],
+                'negative': [list(item) for item in negative_kw.most_common(10)],
+            },
+            'main_topics': [list(item) for item in topic_counter.most_common(20)],
+            'time_segments': self._build_time_segments(buckets),
+            'dialogue_samples': self._build_dialogue_samples(anchors),
+            'core_episodes': self._build_core_episodes(),
+            'notable_child_utterances': heapq.nlargest(5, child_texts, key=len),
+            'dropped_duplicate_cues': self.dropped_cues,
+            'ai_annotations': self.ai_annotations,
+        }
+
+        return self.analysis_results
+
+    def _build_time_segments(self, buckets: Dict[int, List[int]]) -> List[Dict[str, Any]]:
+        """10분 단위 시간대별 발화 통계"""
+        segments = []
+        for index in sorted(buckets):
+            total, child, teacher = buckets[index]
+            segments.append({
+                'segment_number': index + 1,
+                'start_time': _mmss(index * TIME_SEGMENT_SECONDS),
+                'end_time': _mmss((index + 1) * TIME_SEGMENT_SECONDS),
+                'total_utterances': total,
+                'child_utterances': child,
+                'teacher_utterances': teacher,
+                'child_ratio': child / total if total > 0 else 0,
+            })
+        return segments
+
+    def _build_dialogue_samples(self, anchors: Dict[str, int]) -> List[Dict[str, Any]]:
+        """발달 영역별 대화 발췌 (기준 발화 전후 몇 줄)"""
+        samples = []
+        for area in ('언어발달', '인지발달', '사회정서발달'):
+            if area not in anchors:
+                continue
+            index = anchors[area]
+            excerpt = self.utterances[max(index - DIALOGUE_BEFORE, 0):index + DIALOGUE_AFTER + 1]
+            samples.append({
+                'area': area,
+                'time_range': f"{_mmss(excerpt[0][1])}-{_mmss(excerpt[-1][2])}",
+                'dialogue': [
+                    {'speaker': 'child' if is_child else 'teacher', 'text': text}
+                    for is_child, _, _, text in excerpt
+                ],
+            })
+        return samples
+
+    def _build_core_episodes(self) -> List[Dict[str, Any]]:
+        """발달 영역별 핵심 에피소드 발췌 (episode_clustering, VTT 소스에서 세션당 1회)"""
+        return self.source.core_episodes()
+
+    def build_result(self) -> Dict[str, Any]:
+        """저장할 전체 결과 (metadata + metrics + timestamp)"""
+        return {
+            'metadata': self.metadata,
+            'metrics': self.analysis_results,
+            'timestamp': datetime.now().isoformat(),
+        }
+
+    def save_analysis_results(self, output_dir: str = 'analysis_results') -> str:
+        """
+        분석 결과 JSON 저장
+
+        Returns:
+            저장된 파일 경로
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        output_file = os.path.join(output_dir, f"{self.session_name}_enhanced_analysis.json")
+
+        self.result = self.build_result()
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(self.result, f, ensure_ascii=False, indent=2)
+
+        return output_file
+
+
+def analyze_session(session_path: str, output_dir: str = 'analysis_results', corpus_path: str = None,
+                    store_path: str = None):
+    """
+    세션 하나 분석 후 저장
+
+    Args:
+        session_path: 세션 폴더 경로
+        output_dir: 분석 결과 폴더
+        corpus_path: 분석 결과 코퍼스(JSONL) 경로. 지정하면 'enhanced' kind로 함께 추가
+        store_path: 세션 지표 저장소(SQLite) 경로. 지정하면 수치 지표를 함께 추가
+
+    Returns:
+        (analyzer, analysis_file)
+    """
+    analyzer = PlaySessionAnalyzer(session_path)
+    analyzer.parse_vtt_files()
+    print(f"📄 발화 {len(analyzer.utterances)}개 파싱 (중복 큐 {analyzer.dropped_cues}개 제거)")
+    if analyzer.load_ai_annotations():
+        print(f"🤖 AI 구간 분석 {len(analyzer.ai_annotations)}개 정렬")
+
+    analyzer.calculate_metrics()
+    analysis_file = analyzer.save_analysis_results(output_dir)
+    append_to_corpus(corpus_path, analyzer.session_name, 'enhanced', analyzer.result)
+    if store_path:
+        from metrics_store import append_to_store
+        append_to_store(store_path, analyzer.session_name, analyzer.result)
+    print(f"💾 분석 결과 저장: {analysis_file}")
+
+    return analyzer, analysis_file
+
+
+def main():
+    """분석만 실행 (레포트 생성 제외)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='놀이 세션 분석 (enhanced)')
+    parser.add_argument('sessions', nargs='*',
+                        default=['/Users/healin/Downloads/develop/care-intell/raw_data/20251017-이민정교사-김준우-만4세-02_00_48-65kbps_mono'],
+                        help='세션 폴더 경로')
+    parser.add_argument('--output-dir', default='analysis_results', help='분석 결과 폴더')
+    parser.add_argument('--corpus', default=None, help='분석 결과 코퍼스(JSONL) 경로')
+    parser.add_argument('--store', default=None, help='세션 지표를 추가할 SQLite 저장소 경로')
+    args = parser.parse_args()
+
+    failed = 0
+    for session_path in args.sessions:
+        try:
+            analyzer, _ = analyze_session(session_path, args.output_dir, args.corpus, args.store)
+        except FileNotFoundError as e:
+            print(f"❌ {e}")
+            failed += 1
+            continue
+        m = analyzer.analysis_results
+        print(f"  • 아동 발화 비율: {m['child_utterance_ratio']:.1%}")
+        print(f"  • 평균 발화 길이: {m['child_avg_words_per_utterance']:.1f} 단어")
+        print(f"  • 주제 지속도: {m['topic_persistence']:.2f}")
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
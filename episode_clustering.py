@@ -0,0 +1,322 @@
+"""
+모델 호출 없이 핵심 에피소드 고르기 (TF-IDF 에피소드 클러스터링)
+- 발화를 1분 창으로 묶고 창마다 글자 n-gram(2~3자) TF-IDF 희소 벡터를 만듦
+- 이웃한 창끼리만 비교: 현재 에피소드 중심 벡터와의 코사인 유사도가 기준 이상이면 이어 붙이고,
+  아니면 새 에피소드 시작 (같은 놀이가 이어지는 동안 같은 글자 조각이 반복되는 점을 이용)
+- 에피소드별로 발달 영역 점수 계산 (salience의 키워드 사전/가중치)
+  · 언어발달: 아동 발화 길이
+  · 인지발달: 문제해결 단어 + 질문
+  · 사회정서발달: 정서 단어
+- 영역별 최고 에피소드 → 부모용 레포트 core_episodes,
+  점수 순위 → 모델에 보낼 만한 구간을 고르는 사전 필터 (rank_episodes)
+- 희소 벡터는 dict (0이 아닌 n-gram만 저장). 이웃 창끼리만 비교하고 에피소드 중심은 합 벡터와
+  제곱 노름을 누적해서 갱신하므로 전체 비용이 0이 아닌 원소 수에 비례 → 2시간 세션도 1초 이내
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Sequence, Tuple
+
+from enhanced_analysis import DIALOGUE_BEFORE, DIALOGUE_AFTER, _mmss
+from salience import (
+    PROBLEM_RE, EMOTION_RE, HANGUL_RE,
+    PROBLEM_WEIGHT, EMOTION_WEIGHT, QUESTION_WEIGHT, LENGTH_WEIGHT, FULL_LENGTH_SYLLABLES,
+)
+
+# 창 길이 (초)
+WINDOW_SECONDS = 60
+
+# 글자 n-gram 길이
+NGRAM_SIZES = (2, 3)
+
+# 현재 에피소드에 이어 붙일 최소 코사인 유사도
+SIMILARITY_THRESHOLD = 0.15
+
+# 에피소드 하나의 최대 창 수 (한 놀이가 길게 이어져도 발췌할 장면이 묻히지 않도록)
+MAX_EPISODE_WINDOWS = 10
+
+# 영역별로 남길 기준 발화 후보 수 (다른 영역과 발췌가 겹치면 다음 후보 사용)
+ANCHOR_CANDIDATES = 3
+
+# 발췌 최소 줄 수 (부모용 JSON 스키마 dialogue_excerpt minItems)
+MIN_EXCERPT_LINES = 3
+
+AREAS = ('언어발달', '인지발달', '사회정서발달')
+
+TOKEN_RE = re.compile(r'[가-힣a-z0-9]+')
+
+# (아동 여부, 시작 초, 종료 초, 텍스트) - enhanced_analysis.PlaySessionAnalyzer.utterances
+Utterance = Tuple[bool, float, float, str]
+
+
+def char_ngrams(text: str) -> Counter:
+    """어절 안의 글자 n-gram 빈도 (어절 경계를 넘는 조각은 만들지 않음)"""
+    grams = Counter()
+    for token in TOKEN_RE.findall(text.lower()):
+        for n in NGRAM_SIZES:
+            for i in range(len(token) - n + 1):
+                grams[token[i:i + n]] += 1
+    return grams
+
+
+def build_windows(utterances: Sequence[Utterance],
+                  window_seconds: float = WINDOW_SECONDS) -> List[Tuple[int, int]]:
+    """
+    발화를 시간 창으로 묶기 (발화가 없는 창은 건너뜀)
+
+    Returns:
+        창별 발화 범위 [(첫 발화, 마지막 발화 + 1), ...]
+    """
+    windows = []
+    current = None
+    for index, (_, start, _, _) in enumerate(utterances):
+        key = int(start // window_seconds)
+        if key != current:
+            windows.append([index, index + 1])
+            current = key
+        else:
+            windows[-1][1] = index + 1
+    return [tuple(w) for w in windows]
+
+
+def tfidf_vectors(docs: List[Counter]) -> List[Dict[str, float]]:
+    """
+    문서별 n-gram 빈도 → L2 정규화된 TF-IDF 희소 벡터
+
+    tf는 1 + log(빈도) (반복 추임새가 벡터를 독차지하지 않도록), idf는 평활화한 log((1 + N) / (1 + df)) + 1
+    """
+    df = Counter()
+    for doc in docs:
+        df.update(doc.keys())
+    n_docs = len(docs)
+    idf = {gram: math.log((1 + n_docs) / (1 + count)) + 1 for gram, count in df.items()}
+
+    vectors = []
+    for doc in docs:
+        vector = {gram: (1 + math.log(tf)) * idf[gram] for gram, tf in doc.items()}
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        if norm > 0:
+            vector = {gram: w / norm for gram, w in vector.items()}
+        vectors.append(vector)
+    return vectors
+
+
+def _dot(small: Dict[str, float], large: Dict[str, float]) -> float:
+    if len(small) > len(large):
+        small, large = large, small
+    return sum(w * large.get(gram, 0.0) for gram, w in small.items())
+
+
+def cluster_windows(vectors: List[Dict[str, float]], threshold: float = SIMILARITY_THRESHOLD,
+                    max_windows: int = MAX_EPISODE_WINDOWS) -> List[Tuple[int, int]]:
+    """
+    이웃한 창을 에피소드로 묶기
+
+    Returns:
+        에피소드별 창 범위 [(첫 창, 마지막 창 + 1), ...]
+    """
+    groups = []
+    centroid = {}       # 현재 에피소드 창 벡터의 합
+    norm_sq = 0.0       # |centroid|^2
+    first = 0
+
+    for index, vector in enumerate(vectors):
+        if index > first:
+            dot = _dot(vector, centroid)
+            similarity = dot / math.sqrt(norm_sq) if norm_sq > 0 else 0.0
+            if similarity >= threshold and index - first < max_windows:
+                for gram, w in vector.items():
+                    centroid[gram] = centroid.get(gram, 0.0) + w
+                norm_sq += 2 * dot + sum(w * w for w in vector.values())
+                continue
+            groups.append((first, index))
+            first = index
+
+        centroid = dict(vector)
+        norm_sq = sum(w * w for w in vector.values())
+
+    if vectors:
+        groups.append((first, len(vectors)))
+    return groups
+
+
+def _score_episode(utterances: Sequence[Utterance], first: int, last: int) -> Dict[str, Any]:
+    """에피소드의 영역별 점수와 영역별 기준 발화 후보 (신호가 강한 아동 발화 순)"""
+    signals = {area: 0.0 for area in AREAS}
+    ranks = {area: [] for area in AREAS}
+
+    for index in range(first, last):
+        is_child, _, _, text = utterances[index]
+        if not is_child:
+            continue
+
+        length = LENGTH_WEIGHT * min(1.0, len(HANGUL_RE.findall(text)) / FULL_LENGTH_SYLLABLES)
+        cognitive = (PROBLEM_WEIGHT if PROBLEM_RE.search(text) else 0.0) + \
+                    (QUESTION_WEIGHT if '?' in text else 0.0)
+        emotion = EMOTION_WEIGHT if EMOTION_RE.search(text) else 0.0
+
+        for area, signal in (('언어발달', length), ('인지발달', cognitive), ('사회정서발달', emotion)):
+            if signal <= 0:
+                continue
+            signals[area] += signal
+            # 같은 신호면 긴 발화, 그다음 앞선 발화 순 (발췌가 더 많은 내용을 담도록)
+            ranks[area].append((signal, length, -index))
+
+    anchors = {area: [-rank[2] for rank in heapq.nlargest(ANCHOR_CANDIDATES, ranks[area])]
+               for area in AREAS if ranks[area]}
+
+    # 긴 에피소드가 발화 수만으로 이기지 않도록 sqrt(발화 수)로 나눔
+    scale = math.sqrt(last - first)
+    area_scores = {area: signals[area] / scale for area in AREAS}
+    return {'area_scores': area_scores, 'score': sum(area_scores.values()), 'anchors': anchors}
+
+
+def find_episodes(utterances: Sequence[Utterance], window_seconds: float = WINDOW_SECONDS,
+                  threshold: float = SIMILARITY_THRESHOLD,
+                  max_windows: int = MAX_EPISODE_WINDOWS) -> List[Dict[str, Any]]:
+    """
+    발화 목록 → 에피소드 목록 (시간 순)
+
+    Args:
+        utterances: (아동 여부, 시작 초, 종료 초, 텍스트) 목록 (시작 시간 순)
+        window_seconds: 창 길이 (초)
+        threshold: 에피소드에 이어 붙일 최소 코사인 유사도
+        max_windows: 에피소드 하나의 최대 창 수
+
+    Returns:
+        [{'time_range', 'utterance_range': [첫 발화, 마지막 발화 + 1], 'utterance_count',
+          'child_utterance_count', 'area_scores', 'score', 'anchors': {영역: [기준 발화 후보...]}}, ...]
+    """
+    windows = build_windows(utterances, window_seconds)
+    docs = []
+    for first, last in windows:
+        grams = Counter()
+        for _, _, _, text in utterances[first:last]:
+            grams.update(char_ngrams(text))
+        docs.append(grams)
+
+    episodes = []
+    for first_window, last_window in cluster_windows(tfidf_vectors(docs), threshold, max_windows):
+        first = windows[first_window][0]
+        last = windows[last_window - 1][1]
+        episode = {
+            'time_range': f"{_mmss(utterances[first][1])}-{_mmss(utterances[last - 1][2])}",
+            'utterance_range': [first, last],
+            'utterance_count': last - first,
+            'child_utterance_count': sum(1 for u in utterances[first:last] if u[0]),
+        }
+        episode.update(_score_episode(utterances, first, last))
+        episodes.append(episode)
+
+    return episodes
+
+
+def rank_episodes(episodes: List[Dict[str, Any]], top_k: int = None) -> List[Dict[str, Any]]:
+    """점수 순 에피소드 (모델에 보낼 구간 사전 필터, top_k가 없으면 전체)"""
+    ranked = sorted(episodes, key=lambda e: (-e['score'], e['utterance_range'][0]))
+    return ranked if top_k is None else ranked[:top_k]
+
+
+def _clip_range(anchor: int, first: int, last: int) -> Tuple[int, int]:
+    """기준 발화 전후 발췌 범위를 [first, last) 안으로 (끝에 걸리면 앞쪽으로 채움)"""
+    size = DIALOGUE_BEFORE + DIALOGUE_AFTER + 1
+    start = max(anchor - DIALOGUE_BEFORE, first)
+    end = min(start + size, last)
+    return max(min(start, end - size), first), end
+
+
+def _excerpt_range(anchor: int, first: int, last: int, total: int) -> Tuple[int, int]:
+    """
+    기준 발화 전후 발췌 범위
+
+    에피소드 안에서 자르되, 발화가 1~2개뿐인 짧은 에피소드라 MIN_EXCERPT_LINES에 못 미치면
+    에피소드 경계를 넘어 세션 전체(total) 안에서 앞뒤 발화로 채움
+    """
+    start, end = _clip_range(anchor, first, last)
+    if end - start < MIN_EXCERPT_LINES:
+        start, end = _clip_range(anchor, 0, total)
+    return start, end
+
+
+def core_episodes(utterances: Sequence[Utterance],
+                  episodes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    발달 영역별 핵심 에피소드 하나씩 (가능하면 서로 다른 에피소드, 발췌끼리는 겹치지 않게)
+
+    Returns:
+        [{'area', 'time_range' (발췌), 'episode_time_range', 'score', 'dialogue': [{'speaker', 'text'}]}, ...]
+        (enhanced_analysis의 dialogue_samples와 같은 형식 + 에피소드 정보)
+    """
+    used_episodes = set()
+    used_ranges = []
+    samples = []
+
+    for area in AREAS:
+        ranked = sorted((i for i, e in enumerate(episodes) if area in e['anchors']),
+                        key=lambda i: (-episodes[i]['area_scores'][area], i))
+        # (에피소드, 발췌 범위) 후보: 앞쪽일수록 점수가 높음
+        options = [(i, _excerpt_range(anchor, *episodes[i]['utterance_range'], len(utterances)))
+                   for i in ranked for anchor in episodes[i]['anchors'][area]]
+        if not options:
+            continue
+
+        def disjoint(span):
+            return all(span[1] <= a or b <= span[0] for a, b in used_ranges)
+
+        chosen, span = next(
+            (o for o in options if o[0] not in used_episodes and disjoint(o[1])),
+            next((o for o in options if disjoint(o[1])), options[0]))
+        used_episodes.add(chosen)
+        used_ranges.append(span)
+
+        episode = episodes[chosen]
+        excerpt = utterances[span[0]:span[1]]
+        samples.append({
+            'area': area,
+            'time_range': f"{_mmss(excerpt[0][1])}-{_mmss(excerpt[-1][2])}",
+            'episode_time_range': episode['time_range'],
+            'score': round(episode['area_scores'][area], 3),
+            'dialogue': [
+                {'speaker': 'child' if is_child else 'teacher', 'text': text}
+                for is_child, _, _, text in excerpt
+            ],
+        })
+
+    return samples
+
+
+def main():
+    import argparse
+    import time
+    from enhanced_analysis import PlaySessionAnalyzer
+
+    parser = argparse.ArgumentParser(description='TF-IDF 에피소드 클러스터링 (모델 호출 없음)')
+    parser.add_argument('session', help='세션 폴더 (vtt/ 포함)')
+    parser.add_argument('--top', type=int, default=5, help='출력할 상위 에피소드 수')
+    parser.add_argument('--window', type=float, default=WINDOW_SECONDS, help='창 길이 (초)')
+    parser.add_argument('--threshold', type=float, default=SIMILARITY_THRESHOLD, help='이어 붙일 최소 유사도')
+    args = parser.parse_args()
+
+    analyzer = PlaySessionAnalyzer(args.session)
+    utterances = analyzer.parse_vtt_files()
+
+    started = time.perf_counter()
+    episodes = find_episodes(utterances, args.window, args.threshold)
+    elapsed = time.perf_counter() - started
+
+    print(f"🧩 발화 {len(utterances)}개 → 에피소드 {len(episodes)}개 ({elapsed * 1000:.0f}ms)")
+    for e in rank_episodes(episodes, args.top):
+        areas = ', '.join(f"{area} {score:.2f}" for area, score in e['area_scores'].items())
+        print(f"  {e['time_range']}  발화 {e['utterance_count']:4d}  점수 {e['score']:.2f}  ({areas})")
+
+    print("\n⭐ 핵심 에피소드")
+    for sample in core_episodes(utterances, episodes):
+        print(f"  [{sample['area']}] {sample['time_range']} (에피소드 {sample['episode_time_range']})")
+        for line in sample['dialogue']:
+            print(f"     {line['speaker']}: {line['text']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,7 @@
 """
 놀이 세션 레포트 생성기
 - 회사용 레포트 (상세)
-- 부모용 레포트 (아이 중심)
+- 부모용 레포트 (아이 중심) + 부모용 구조화 레포트 (JSON, 스키마 검증)
 - 선생님용 레포트 (교육적 인사이트)
 """
 
@@ -10,6 +10,10 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from session_view import SessionView
+from analysis_adapters import to_enhanced
+from parent_report_json import build_parent_report, parent_report_errors
+
 
 class ReportGenerator:
     """레포트 생성기"""
@@ -599,6 +603,18 @@ class ReportGenerator:
             f.write(parent_report)
         print(f"✅ 부모용 레포트 저장: {parent_file}")
         
+        # 2-1. 부모용 구조화 레포트 (JSON, 스키마 검증 통과 시에만 저장)
+        parent_json = build_parent_report(SessionView(to_enhanced(self.data)))
+        errors = parent_report_errors(parent_json)
+        parent_json_file = None
+        if errors:
+            print(f"⚠️  부모용 JSON 스키마 검증 실패 ({len(errors)}건): {errors[0]}")
+        else:
+            parent_json_file = output_path / f"{session_name}_parent_report.json"
+            with open(parent_json_file, 'w', encoding='utf-8') as f:
+                json.dump(parent_json, f, ensure_ascii=False, indent=2)
+            print(f"✅ 부모용 JSON 저장: {parent_json_file}")
+        
         # 3. 선생님용 레포트
         teacher_report = self.generate_teacher_report()
         teacher_file = output_path / f"{session_name}_teacher_report.txt"
@@ -609,6 +625,7 @@ class ReportGenerator:
         return {
             'company': company_file,
             'parent': parent_file,
+            'parent_json': parent_json_file,
             'teacher': teacher_file
         }
 
@@ -640,6 +657,7 @@ def main():
     print("="*80)
     print(f"\n회사용: {report_files['company']}")
     print(f"부모용: {report_files['parent']}")
+    print(f"부모용 JSON: {report_files['parent_json'] or '생성 안 됨 (스키마 검증 실패)'}")
     print(f"선생님용: {report_files['teacher']}")
     print()
 
@@ -10,6 +10,10 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict
 
+from session_view import SessionView, DetailedSessionView
+from analysis_adapters import to_enhanced
+from parent_report_json import build_parent_report, parent_report_errors
+
 
 class ReportGenerator:
     """레포트 생성 클래스"""
@@ -17,17 +21,18 @@ class ReportGenerator:
     def __init__(self, analysis_result: Dict):
         self.data = analysis_result
         self.session_info = analysis_result.get('session_info', {})
+        # 레포트 3종이 공유하는 파생 지표 (세션당 1회 계산)
+        self.view = DetailedSessionView(analysis_result)
         
     def generate_parent_report(self) -> str:
         """부모용 레포트 생성"""
-        child_name = self.session_info.get('child_name', '아이')
-        age = self.session_info.get('age', '')
-        date = self.format_date(self.session_info.get('date', ''))
+        v = self.view
+        child_name = v.child_name
+        age = v.age
+        date = v.date
         
-        speech_ratio = self.data['speech_ratio']
         utterance = self.data['utterance_volume']
         sentiment = self.data['sentiment']
-        topics = self.data['main_topics']
         problem_solving = self.data['problem_solving']
         
         report = f"""
@@ -39,33 +44,33 @@ class ReportGenerator:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
   • 아동명: {child_name} ({age})
   • 관찰일: {date}
-  • 선생님: {self.session_info.get('teacher_name', '')}
+  • 선생님: {v.teacher_name}
 
 
 🎯 이번 놀이 활동
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  • 주요 놀이: {', '.join(topics['detected_play_types']) if topics['detected_play_types'] else '자유놀이'}
-  • 관심 주제: {', '.join([kw['word'] for kw in topics['top_keywords'][:3]])}
+  • 주요 놀이: {', '.join(v.play_types) if v.play_types else '자유놀이'}
+  • 관심 주제: {', '.join([kw['word'] for kw in v.top_keywords[:3]])}
 
 
 💬 의사소통 발달
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-  • 말하기 참여도: {self.get_participation_level(speech_ratio['child_utterance_ratio'])}
+  • 말하기 참여도: {self.get_participation_level(v.speech_ratio)}
   • 발화 횟수: {utterance['child_total_utterances']}회
-  • 평가: {self.evaluate_speech_ratio(speech_ratio['child_utterance_ratio'])}
+  • 평가: {self.evaluate_speech_ratio(v.speech_ratio)}
 
 
 🧠 사고력 발달
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
   • 문제해결 시도: {problem_solving['problem_solving_utterance_count']}회
-  • 평가: {self.evaluate_problem_solving(problem_solving['problem_solving_ratio'])}
+  • 평가: {self.evaluate_problem_solving(v.ps_ratio)}
 
 
 😊 정서 발달
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
   • 긍정적 표현: {sentiment['positive_count']}회
   • 부정적 표현: {sentiment['negative_count']}회
-  • 정서 상태: {self.evaluate_sentiment(sentiment['sentiment_score'])}
+  • 정서 상태: {self.evaluate_sentiment(v.sentiment_score)}
 
 
 ✨ 특별히 관찰된 점
@@ -85,9 +90,10 @@ class ReportGenerator:
     
     def generate_teacher_report(self) -> str:
         """선생님용 레포트 + 방문일지 생성"""
-        child_name = self.session_info.get('child_name', '아이')
-        age = self.session_info.get('age', '')
-        date = self.format_date(self.session_info.get('date', ''))
+        v = self.view
+        child_name = v.child_name
+        age = v.age
+        date = v.date
         
         speech_ratio = self.data['speech_ratio']
         utterance = self.data['utterance_volume']
@@ -96,7 +102,6 @@ class ReportGenerator:
         problem_solving = self.data['problem_solving']
         sentiment = self.data['sentiment']
         emotion_words = self.data['emotion_words']
-        topics = self.data['main_topics']
         
         report = f"""
 ╔════════════════════════════════════════════════════════════╗
@@ -107,7 +112,7 @@ class ReportGenerator:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
   • 관찰 아동: {child_name} ({age})
   • 관찰 일시: {date}
-  • 관찰 교사: {self.session_info.get('teacher_name', '')}
+  • 관찰 교사: {v.teacher_name}
   • 관찰 시간: {self.session_info.get('duration', '').replace('_', ':')}
 
 
@@ -116,15 +121,15 @@ class ReportGenerator:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 [주요 놀이 유형]
-{self.format_play_types(topics['detected_play_types'])}
+{self.format_play_types(v.play_types)}
 
 [놀이 주제 및 관심사]
-{self.format_play_topics(topics['top_keywords'][:5])}
+{self.format_play_topics(v.top_keywords[:5])}
 
 [놀이 지속성]
 • 주제 전환 횟수: {topic_consistency['topic_changes']}회
 • 주제 지속도: {topic_consistency['topic_consistency_score']}점
-• 평가: {self.evaluate_topic_consistency(topic_consistency['topic_consistency_score'])}
+• 평가: {self.evaluate_topic_consistency(v.consistency_score)}
 
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -199,15 +204,16 @@ class ReportGenerator:
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 작성일: {datetime.now().strftime('%Y년 %m월 %d일')}
-작성자: {self.session_info.get('teacher_name', '')}
+작성자: {v.teacher_name}
 """
         return report
     
     def generate_company_report(self) -> str:
         """회사용 상세 분석 레포트 생성"""
-        child_name = self.session_info.get('child_name', '아이')
-        age = self.session_info.get('age', '')
-        date = self.format_date(self.session_info.get('date', ''))
+        v = self.view
+        child_name = v.child_name
+        age = v.age
+        date = v.date
         
         report = f"""
 ╔════════════════════════════════════════════════════════════╗
@@ -220,7 +226,7 @@ class ReportGenerator:
   • 세션명: {self.session_info.get('session_name', '')}
   • 아동명: {child_name} ({age})
   • 관찰일: {date}
-  • 교사명: {self.session_info.get('teacher_name', '')}
+  • 교사명: {v.teacher_name}
   • 세션 길이: {self.session_info.get('duration', '')}
 
 
@@ -350,15 +356,15 @@ class ReportGenerator:
         """부모용 하이라이트"""
         highlights = []
         
-        speech_ratio = self.data['speech_ratio']['child_utterance_ratio']
+        speech_ratio = self.view.speech_ratio
         if speech_ratio >= 45:
             highlights.append("• 대화에 매우 적극적으로 참여하는 모습이 인상적이었습니다.")
         
-        problem_solving = self.data['problem_solving']['problem_solving_ratio']
+        problem_solving = self.view.ps_ratio
         if problem_solving >= 15:
             highlights.append("• 스스로 생각하고 문제를 해결하려는 시도가 많았습니다.")
         
-        sentiment = self.data['sentiment']['sentiment_score']
+        sentiment = self.view.sentiment_score
         if sentiment > 10:
             highlights.append("• 놀이 내내 즐겁고 긍정적인 모습을 보였습니다.")
         
@@ -370,10 +376,10 @@ class ReportGenerator:
     def generate_parent_suggestions(self) -> str:
         """부모용 제안"""
         suggestions = []
-        topics = self.data['main_topics']
+        play_types = self.view.play_types
         
-        if topics['detected_play_types']:
-            play_type = topics['detected_play_types'][0]
+        if play_types:
+            play_type = play_types[0]
             suggestions.append(f"• {play_type}에 관심이 많으니 관련 활동을 함께 해보세요.")
         
         suggestions.append("• 아이의 이야기를 경청하고 질문을 통해 생각을 확장해보세요.")
@@ -441,16 +447,16 @@ class ReportGenerator:
         """강점 생성"""
         strengths = []
         
-        if self.data['speech_ratio']['child_utterance_ratio'] >= 40:
+        if self.view.speech_ratio >= 40:
             strengths.append("• 언어 표현력: 적극적인 의사소통 능력을 보임")
         
-        if self.data['problem_solving']['problem_solving_ratio'] >= 15:
+        if self.view.ps_ratio >= 15:
             strengths.append("• 문제해결력: 호기심과 탐구심이 뛰어남")
         
-        if self.data['sentiment']['sentiment_score'] > 5:
+        if self.view.sentiment_score > 5:
             strengths.append("• 정서 발달: 긍정적이고 안정적인 정서 상태")
         
-        if self.data['topic_consistency']['topic_consistency_score'] >= 60:
+        if self.view.consistency_score >= 60:
             strengths.append("• 집중력: 놀이에 대한 집중력과 몰입도가 높음")
         
         if not strengths:
@@ -462,13 +468,13 @@ class ReportGenerator:
         """발달 지원 영역"""
         areas = []
         
-        if self.data['speech_ratio']['child_utterance_ratio'] < 30:
+        if self.view.speech_ratio < 30:
             areas.append("• 자발적 언어 표현 기회 확대")
         
-        if self.data['problem_solving']['problem_solving_ratio'] < 10:
+        if self.view.ps_ratio < 10:
             areas.append("• 문제해결 상황 제공 및 사고 확장 질문")
         
-        if self.data['topic_consistency']['topic_consistency_score'] < 50:
+        if self.view.consistency_score < 50:
             areas.append("• 놀이 지속 시간 확장 및 집중력 향상")
         
         if not areas:
@@ -480,12 +486,12 @@ class ReportGenerator:
         """교사용 제안"""
         suggestions = []
         
-        speech_ratio = self.data['speech_ratio']['child_utterance_ratio']
+        speech_ratio = self.view.speech_ratio
         if speech_ratio < 35:
             suggestions.append("• 아동의 발화를 기다리고 경청하는 시간을 늘려보세요.")
             suggestions.append("• 개방형 질문을 통해 아동의 생각을 이끌어내세요.")
         
-        problem_solving = self.data['problem_solving']['problem_solving_ratio']
+        problem_solving = self.view.ps_ratio
         if problem_solving < 10:
             suggestions.append("• '왜?', '어떻게?' 등의 질문으로 사고를 확장해보세요.")
             suggestions.append("• 문제 상황을 제시하고 아동의 해결책을 기다려보세요.")
@@ -498,15 +504,15 @@ class ReportGenerator:
     
     def generate_teacher_notes(self) -> str:
         """교사 소감"""
-        child_name = self.session_info.get('child_name', '아이')
-        topics = self.data['main_topics']['detected_play_types']
+        child_name = self.view.child_name
+        topics = self.view.play_types
         
         notes = f"{child_name} 아동은 "
         
         if topics:
             notes += f"{topics[0]}을 중심으로 "
         
-        sentiment_score = self.data['sentiment']['sentiment_score']
+        sentiment_score = self.view.sentiment_score
         if sentiment_score > 10:
             notes += "즐겁고 적극적으로 놀이에 참여했습니다. "
         elif sentiment_score > 0:
@@ -514,7 +520,7 @@ class ReportGenerator:
         else:
             notes += "놀이 활동에 참여했습니다. "
         
-        speech_ratio = self.data['speech_ratio']['child_utterance_ratio']
+        speech_ratio = self.view.speech_ratio
         if speech_ratio >= 40:
             notes += "자신의 생각과 느낌을 적극적으로 표현하는 모습이 인상적이었습니다."
         else:
@@ -541,11 +547,11 @@ class ReportGenerator:
     def calculate_overall_scores(self) -> str:
         """종합 점수 계산"""
         scores = {
-            '언어 발달': self.data['speech_ratio']['child_utterance_ratio'],
-            '사고력': self.data['problem_solving']['problem_solving_ratio'] * 5,  # 스케일 조정
-            '정서 안정': max(0, min(100, 50 + self.data['sentiment']['sentiment_score'])),
-            '놀이 집중도': self.data['topic_consistency']['topic_consistency_score'],
-            '상호작용': self.data['context_switches']['switch_rate']
+            '언어 발달': self.view.speech_ratio,
+            '사고력': self.view.ps_ratio * 5,  # 스케일 조정
+            '정서 안정': max(0, min(100, 50 + self.view.sentiment_score)),
+            '놀이 집중도': self.view.consistency_score,
+            '상호작용': self.view.switch_rate
         }
         
         result = []
@@ -605,6 +611,17 @@ def generate_all_reports(analysis_json_path: str, output_dir: str = None):
         f.write(parent_report)
     print(f"✓ 부모용 레포트 생성: {parent_file}")
     
+    # 1-1. 부모용 구조화 레포트 (JSON, 스키마 검증 통과 시에만 저장)
+    parent_json = build_parent_report(SessionView(to_enhanced(analysis_data)))
+    errors = parent_report_errors(parent_json)
+    if errors:
+        print(f"⚠ 부모용 JSON 스키마 검증 실패 ({len(errors)}건): {errors[0]}")
+    else:
+        parent_json_file = output_dir / f"{session_name}_parent_report.json"
+        with open(parent_json_file, 'w', encoding='utf-8') as f:
+            json.dump(parent_json, f, ensure_ascii=False, indent=2)
+        print(f"✓ 부모용 JSON 생성: {parent_json_file}")
+    
     # 2. 선생님용 레포트 + 방문일지
     teacher_report = generator.generate_teacher_report()
     teacher_file = output_dir / f"{session_name}_teacher_report.txt"
@@ -0,0 +1,186 @@
+"""
+부모용 레포트 정적 HTML 렌더러
+- parent_report_json 형식 레포트를 ui/report_preview.css 스타일의 단독 페이지로 렌더링
+- 에셋 처리 (--assets)
+  · inline : CSS는 <style>, 로고는 data URI로 페이지 안에 포함 (파일 하나로 완결)
+  · hashed : assets/ 폴더에 내용 해시가 붙은 파일로 한 번만 저장하고 링크 (장기 캐시 가능)
+- 페이지와 에셋마다 .gz 사본을 함께 저장 (정적 호스트가 요청마다 압축하지 않음)
+- 분석 결과 JSON을 주면 부모용 JSON을 만든 뒤 렌더링 (numpy 불필요)
+
+Usage: python html_report.py <analysis 또는 parent_report JSON...> [--output-dir DIR] [--assets inline|hashed]
+"""
+
+import gzip
+import json
+import base64
+import hashlib
+from functools import lru_cache
+from html import escape
+from pathlib import Path
+from typing import Any, Dict, List
+
+from template_engine import render_template
+from session_view import SessionView
+from analysis_adapters import to_enhanced
+from parent_report_json import build_parent_report, parent_report_errors
+
+UI_DIR = Path(__file__).parent / 'ui'
+CSS_PATH = UI_DIR / 'report_preview.css'
+LOGO_PATH = UI_DIR / '째깍악어-로고.png'
+
+ASSET_MODES = ('inline', 'hashed')
+
+AREA_LABELS = {
+    '언어발달': '💬 언어발달',
+    '인지발달': '🧩 인지발달',
+    '사회정서발달': '💛 사회정서발달',
+}
+
+
+def _escape_tree(value: Any) -> Any:
+    """dict/list 안의 모든 문자열을 HTML 이스케이프 (템플릿은 값을 그대로 출력)"""
+    if isinstance(value, str):
+        return escape(value)
+    if isinstance(value, dict):
+        return {key: _escape_tree(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_escape_tree(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=None)
+def _asset_bytes(path: Path) -> bytes:
+    """에셋 파일 내용 (프로세스당 1회 읽기)"""
+    return path.read_bytes()
+
+
+def _content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def write_with_gzip(path: Path, data: bytes) -> Path:
+    """
+    파일과 .gz 사본 저장 (gzip 헤더의 mtime을 0으로 고정해 같은 내용이면 같은 바이트)
+
+    Returns:
+        .gz 파일 경로
+    """
+    path.write_bytes(data)
+    gz_path = path.with_name(path.name + '.gz')
+    gz_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    return gz_path
+
+
+class HTMLReportRenderer:
+    """부모용 레포트 HTML 렌더러 (에셋은 렌더러당 한 번 준비)"""
+
+    def __init__(self, output_dir: str, assets: str = 'inline'):
+        """
+        Args:
+            output_dir: HTML 저장 폴더
+            assets: 'inline' (페이지에 포함) 또는 'hashed' (assets/에 해시 파일로 저장)
+        """
+        if assets not in ASSET_MODES:
+            raise ValueError(f"알 수 없는 에셋 모드: {assets} (가능: {', '.join(ASSET_MODES)})")
+
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.assets = assets
+
+        css = _asset_bytes(CSS_PATH)
+        logo = _asset_bytes(LOGO_PATH)
+
+        if assets == 'inline':
+            self.head_assets = f"<style>\n{css.decode('utf-8')}</style>"
+            self.logo_src = 'data:image/png;base64,' + base64.b64encode(logo).decode('ascii')
+        else:
+            css_name = self._write_asset('report', '.css', css)
+            logo_name = self._write_asset('logo', '.png', logo)
+            self.head_assets = f'<link rel="stylesheet" href="assets/{css_name}">'
+            self.logo_src = f"assets/{logo_name}"
+
+    def _write_asset(self, stem: str, suffix: str, data: bytes) -> str:
+        """assets/<stem>.<해시><suffix> 저장 (이미 있으면 건너뜀). 파일명 반환"""
+        asset_dir = self.output_dir / 'assets'
+        asset_dir.mkdir(exist_ok=True)
+        name = f"{stem}.{_content_hash(data)}{suffix}"
+        path = asset_dir / name
+        if not path.exists():
+            # 로고(PNG)는 이미 압축되어 있어 .gz를 만들지 않음
+            if suffix == '.png':
+                path.write_bytes(data)
+            else:
+                write_with_gzip(path, data)
+        return name
+
+    def render(self, report: Dict[str, Any]) -> str:
+        """부모용 레포트 dict → HTML 문자열"""
+        return render_template(
+            'parent_report_html',
+            r=_escape_tree(report),
+            head_assets=self.head_assets,
+            logo_src=self.logo_src,
+            area_labels=AREA_LABELS,
+        )
+
+    def save(self, report: Dict[str, Any]) -> Path:
+        """
+        HTML 페이지와 .gz 사본 저장
+
+        Returns:
+            HTML 파일 경로
+        """
+        session_id = report['session_metadata']['session_id']
+        html_file = self.output_dir / f"{session_id}_parent_report.html"
+        write_with_gzip(html_file, self.render(report).encode('utf-8'))
+        return html_file
+
+
+def load_parent_report(json_path: str) -> Dict[str, Any]:
+    """부모용 JSON은 그대로, 분석 결과 JSON은 부모용 레포트로 변환해서 반환"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if 'session_metadata' in data and 'core_episodes' in data:
+        return data
+    return build_parent_report(SessionView(to_enhanced(data)))
+
+
+def render_files(json_paths: List[str], output_dir: str, assets: str = 'inline') -> List[Path]:
+    """
+    여러 JSON을 HTML로 렌더링 (스키마 검증을 통과한 레포트만)
+
+    Returns:
+        저장된 HTML 파일 목록
+    """
+    renderer = HTMLReportRenderer(output_dir, assets)
+    saved = []
+
+    for json_path in json_paths:
+        report = load_parent_report(json_path)
+        errors = parent_report_errors(report)
+        if errors:
+            print(f"⚠️  건너뜀 ({Path(json_path).name}): 스키마 검증 실패 {len(errors)}건 - {errors[0]}")
+            continue
+        html_file = renderer.save(report)
+        saved.append(html_file)
+        print(f"✅ {html_file}")
+
+    return saved
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='부모용 레포트 정적 HTML 생성')
+    parser.add_argument('inputs', nargs='+', help='분석 결과 또는 부모용 레포트 JSON')
+    parser.add_argument('--output-dir', default='reports/html', help='HTML 저장 폴더')
+    parser.add_argument('--assets', choices=ASSET_MODES, default='inline',
+                        help='inline: CSS/로고를 페이지에 포함, hashed: 해시 파일명 에셋으로 분리')
+    args = parser.parse_args()
+
+    saved = render_files(args.inputs, args.output_dir, args.assets)
+    print(f"\n📄 HTML {len(saved)}개 생성 ({args.assets}, .gz 포함): {args.output_dir}")
+
+
+if __name__ == '__main__':
+    main()
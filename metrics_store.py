@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+세션 지표 저장소 (SQLite)
+- session_metrics: 세션당 한 행, 타입이 지정된 컬럼 (아동/선생님/나이/날짜 + 비교 리포트 수치 지표)
+  · 비교 지표 컬럼은 basic 분석(*_analysis.json)에만 있어 다른 형식만 있는 세션은 NULL
+- session_kpis: 세션별 모든 수치 지표 (세션, 지표, 값) 행
+  · 세 형식 모두 어댑터(analysis_adapters)의 enhanced 지표 이름으로 통일, 중첩 지표는 '.'으로 연결
+  · 추정한 지표(metrics['estimated'])와 값이 없는 지표는 저장하지 않음
+  · 같은 세션의 여러 형식 중 가장 자세한 형식(enhanced > detailed > basic)의 지표를 유지
+- 분석이 끝날 때마다 추가 (같은 세션은 덮어씀)
+- 나이별/선생님별 집계를 JSON 재파싱 없이 SQL 한 번으로 계산
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from analysis_adapters import FORMAT_PRIORITY, detect_format, split_analysis_name, to_enhanced
+from comparison import extract_row, format_table
+from corpus import CorpusReader
+
+
+# (SQL 컬럼, 타입, 비교 행(extract_row) 키)
+TEXT_COLUMNS = [
+    ('session', 'TEXT', '세션명'),
+    ('date', 'TEXT', '날짜'),
+    ('teacher', 'TEXT', '선생님'),
+    ('child', 'TEXT', '아동'),
+    ('age', 'TEXT', '나이'),
+]
+
+METRIC_COLUMNS = [
+    ('child_speech_ratio', 'REAL', '아동발화비율(%)'),
+    ('child_utterance_count', 'INTEGER', '아동발화횟수'),
+    ('avg_utterance_length', 'REAL', '평균발화길이'),
+    ('positive_ratio', 'REAL', '긍정비율(%)'),
+    ('negative_ratio', 'REAL', '부정비율(%)'),
+    ('unique_words', 'INTEGER', '고유단어수'),
+    ('vocabulary_diversity', 'REAL', '어휘다양도(%)'),
+    ('problem_solving_ratio', 'REAL', '문제해결비율(%)'),
+    ('total_turns', 'INTEGER', '총턴수'),
+    ('turn_balance', 'REAL', '턴균형도'),
+]
+
+ALL_COLUMNS = TEXT_COLUMNS + METRIC_COLUMNS
+
+# 그룹 기준 (한글 이름도 허용)
+GROUP_KEYS = {
+    'date': 'date', '날짜': 'date',
+    'teacher': 'teacher', '선생님': 'teacher',
+    'child': 'child', '아동': 'child',
+    'age': 'age', '나이': 'age',
+}
+
+AGGREGATES = ('AVG', 'MIN', 'MAX', 'SUM')
+
+
+def kpi_values(data: Dict[str, Any]) -> Dict[str, float]:
+    """
+    분석 결과의 수치 지표 (형식과 무관하게 enhanced 지표 이름 기준)
+
+    Args:
+        data: 세 형식 중 하나의 분석 결과
+
+    Returns:
+        {지표 이름: 값}. 중첩 지표는 'context_switches.total_switches'처럼 '.'으로 연결,
+        추정한 지표와 값이 없는(None) 지표는 제외
+    """
+    metrics = to_enhanced(data)['metrics']
+    estimated = set(metrics.get('estimated', []))
+    values = {}
+
+    def collect(name, value):
+        if isinstance(value, bool) or value is None:
+            return
+        if isinstance(value, (int, float)):
+            values[name] = float(value)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                collect(f"{name}.{key}", item)
+
+    for name, value in metrics.items():
+        if name not in estimated:
+            collect(name, value)
+    return values
+
+
+class MetricsStore:
+    """세션 지표 SQLite 저장소"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # 여러 워커 프로세스가 동시에 추가할 수 있도록 잠금 대기 시간을 넉넉히 둠
+        self.conn = sqlite3.connect(str(self.path), timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self._create_schema()
+
+    def _create_schema(self):
+        columns = ', '.join(
+            f"{name} {sql_type}" + (' PRIMARY KEY' if name == 'session' else '')
+            for name, sql_type, _ in ALL_COLUMNS
+        )
+        with self.conn:
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS session_metrics ({columns})")
+            for key in ('date', 'teacher', 'child', 'age'):
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_session_metrics_{key} ON session_metrics ({key})"
+                )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS session_kpis "
+                "(session TEXT, metric TEXT, value REAL, kind TEXT, PRIMARY KEY (session, metric))"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_session_kpis_metric ON session_kpis (metric)")
+
+    def _add(self, session: str, data: Dict[str, Any]):
+        """분석 결과 한 건 기록 (트랜잭션은 호출한 쪽에서)"""
+        kind = detect_format(data)
+
+        if kind == 'basic':
+            row = extract_row(data)
+            names = ', '.join(name for name, _, _ in ALL_COLUMNS)
+            placeholders = ', '.join('?' for _ in ALL_COLUMNS)
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO session_metrics ({names}) VALUES ({placeholders})",
+                [session] + [row[key] for _, _, key in ALL_COLUMNS[1:]]
+            )
+        else:
+            # 비교 지표 컬럼은 basic 결과에서만 채우므로 기존 값은 그대로 둠
+            metadata = to_enhanced(data)['metadata']
+            self.conn.execute(
+                "INSERT INTO session_metrics (session, date, teacher, child, age) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (session) DO UPDATE SET date = excluded.date, teacher = excluded.teacher, "
+                "child = excluded.child, age = excluded.age",
+                (session, metadata['date'], metadata['teacher'], metadata['child'], metadata['age'])
+            )
+
+        stored = self.conn.execute("SELECT kind FROM session_kpis WHERE session = ? LIMIT 1",
+                                   (session,)).fetchone()
+        if stored is not None and FORMAT_PRIORITY.get(stored[0], len(FORMAT_PRIORITY)) < FORMAT_PRIORITY[kind]:
+            return
+        self.conn.execute("DELETE FROM session_kpis WHERE session = ?", (session,))
+        self.conn.executemany(
+            "INSERT INTO session_kpis (session, metric, value, kind) VALUES (?, ?, ?, ?)",
+            ((session, metric, value, kind) for metric, value in kpi_values(data).items())
+        )
+
+    def add(self, session: str, data: Dict[str, Any]):
+        """
+        분석 결과 한 건 추가 (같은 세션이 있으면 교체)
+
+        Args:
+            session: 세션 이름
+            data: 세 형식(basic/detailed/enhanced) 중 하나의 분석 결과
+        """
+        with self.conn:
+            self._add(session, data)
+
+    def add_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]):
+        """(세션 이름, 분석 결과) 여러 건을 한 트랜잭션으로 추가"""
+        with self.conn:
+            for session, data in items:
+                self._add(session, data)
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM session_metrics").fetchone()[0]
+
+    def kpi_names(self) -> List[str]:
+        """저장된 수치 지표 이름 (session_kpis)"""
+        return [row[0] for row in self.conn.execute("SELECT DISTINCT metric FROM session_kpis ORDER BY metric")]
+
+    def group_by(self, key: str, metrics: Optional[List[str]] = None,
+                 func: str = 'AVG') -> List[Dict[str, Any]]:
+        """
+        그룹별 집계
+
+        Args:
+            key: 그룹 기준 ('나이', '선생님', '아동', '날짜' 또는 영문 컬럼명)
+            metrics: 집계할 지표 - 비교 지표 컬럼 또는 session_kpis 지표 이름 (기본값: 모든 비교 지표 컬럼)
+            func: 집계 함수 (AVG, MIN, MAX, SUM)
+
+        Returns:
+            [{key: 그룹 값, 'sessions': 세션 수, 지표: 값, ...}] (그룹 값 오름차순)
+        """
+        column = GROUP_KEYS.get(key)
+        if column is None:
+            raise ValueError(f"알 수 없는 그룹 기준: {key!r} ({', '.join(GROUP_KEYS)})")
+
+        func = func.upper()
+        if func not in AGGREGATES:
+            raise ValueError(f"알 수 없는 집계 함수: {func!r} ({', '.join(AGGREGATES)})")
+
+        metric_names = [name for name, _, _ in METRIC_COLUMNS]
+        metrics = metrics or metric_names
+        columns = [m for m in metrics if m in metric_names]
+        kpis = [m for m in metrics if m not in metric_names]
+        unknown = sorted(set(kpis) - set(self.kpi_names()))
+        if unknown:
+            raise ValueError(f"알 수 없는 지표: {', '.join(unknown)}")
+
+        select = ''.join(f", {func}({m})" for m in columns)
+        cursor = self.conn.execute(
+            f"SELECT {column}, COUNT(*){select} FROM session_metrics "
+            f"GROUP BY {column} ORDER BY {column}"
+        )
+        groups = [
+            {column: row[0], 'sessions': row[1], **dict(zip(columns, row[2:]))}
+            for row in cursor
+        ]
+
+        if kpis:
+            # 지표마다 조건부 집계 (값이 없는 세션은 집계에서 빠짐)
+            select = ', '.join(f"{func}(CASE WHEN k.metric = ? THEN k.value END)" for _ in kpis)
+            cursor = self.conn.execute(
+                f"SELECT m.{column}, {select} FROM session_metrics m "
+                f"JOIN session_kpis k ON k.session = m.session "
+                f"WHERE k.metric IN ({', '.join('?' for _ in kpis)}) GROUP BY m.{column}",
+                kpis + kpis
+            )
+            values = {row[0]: row[1:] for row in cursor}
+            for group in groups:
+                group.update(zip(kpis, values.get(group[column], [None] * len(kpis))))
+
+        return [{column: g[column], 'sessions': g['sessions'], **{m: g[m] for m in metrics}} for g in groups]
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def append_to_store(store_path: Optional[str], session: str, data: Dict[str, Any]):
+    """store_path가 지정된 경우에만 세션 지표 추가 (선택 기능 연결용)"""
+    if store_path:
+        with MetricsStore(store_path) as store:
+            store.add(session, data)
+
+
+def iter_sources(analysis_dirs: Iterable = (), corpora: Iterable = ()) -> Iterable[Tuple[str, Dict[str, Any]]]:
+    """
+    분석 결과 폴더/코퍼스의 (세션 이름, 분석 결과) 순회 (세 형식 모두)
+
+    같은 세션의 여러 형식은 저장소가 자세한 형식의 지표를 유지하므로 모두 넘깁니다.
+    """
+    for analysis_dir in analysis_dirs:
+        for path in sorted(Path(analysis_dir).glob("*_analysis.json")):
+            session, _ = split_analysis_name(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                yield session, json.load(f)
+
+    for corpus_path in corpora:
+        for kind in ('analysis', 'detailed', 'enhanced'):
+            yield from CorpusReader(corpus_path).iter_records(kind)
+
+
+def main():
+    """명령줄 인터페이스"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='세션 지표 저장소')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    load_parser = subparsers.add_parser('load', help='기존 분석 결과를 저장소로 가져오기')
+    load_parser.add_argument('db', help='SQLite 파일 경로')
+    load_parser.add_argument('analysis_dirs', nargs='*', help='분석 결과 폴더 (basic/detailed/enhanced 모두)')
+    load_parser.add_argument('--corpus', nargs='+', help='분석 결과 코퍼스(JSONL)')
+
+    group_parser = subparsers.add_parser('group', help='그룹별 집계 출력')
+    group_parser.add_argument('db', help='SQLite 파일 경로')
+    group_parser.add_argument('key', help="그룹 기준 (나이, 선생님, 아동, 날짜)")
+    group_parser.add_argument('--metrics', nargs='+',
+                              help='집계할 지표 (비교 지표 컬럼 또는 지표 이름, 예: topic_persistence)')
+    group_parser.add_argument('--func', default='avg', help='집계 함수 (avg, min, max, sum)')
+
+    args = parser.parse_args()
+
+    with MetricsStore(args.db) as store:
+        if args.command == 'load':
+            if not args.analysis_dirs and not args.corpus:
+                parser.error('load: 분석 결과 폴더 또는 --corpus 를 지정하세요')
+            store.add_many(iter_sources(args.analysis_dirs, args.corpus or []))
+            print(f"✅ 저장 완료: {args.db} (총 {store.count()}개 세션)")
+            return
+
+        groups = store.group_by(args.key, args.metrics, args.func)
+        column = GROUP_KEYS[args.key]
+        metrics = args.metrics or [name for name, _, _ in METRIC_COLUMNS]
+        rows = [
+            (str(group[column]), [f"{group[m]:.1f}" if group[m] is not None else '-' for m in metrics]
+             + [str(group['sessions'])])
+            for group in groups
+        ]
+        print(format_table(args.key, metrics + ['sessions'], rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+부모용 구조화 레포트 (JSON)
+- SessionView의 지표로 schema/parent_report_schema.json 형식의 레포트를 바로 생성
+- 검증은 schema_validator로 컴파일한 검증기를 프로세스당 한 번 만들어 재사용
+- UI는 텍스트 레포트를 다시 파싱하지 않고 이 JSON을 그대로 렌더링
+"""
+
+from pathlib import Path
+from typing import Dict, Any, List
+
+from session_view import SessionView, grade
+from schema_validator import load_validator, SchemaValidationError
+
+PARENT_SCHEMA_PATH = Path(__file__).parent / 'schema' / 'parent_report_schema.json'
+
+# 발달 영역 → episode_id 접미사, 발달적 의미
+AREA_IDS = {
+    '언어발달': 'language',
+    '인지발달': 'cognitive',
+    '사회정서발달': 'social_emotional',
+}
+AREA_TITLES = {
+    '언어발달': '💬',
+    '인지발달': '🧩',
+    '사회정서발달': '💛',
+}
+AREA_SIGNIFICANCE = {
+    '언어발달': "자기 생각을 여러 어절로 이어 말하는 모습에서 문장을 구성하고 표현하는 힘이 자라고 있음을 볼 수 있습니다.",
+    '인지발달': "궁금한 점을 묻고 방법을 찾아보는 모습에서 원인과 결과를 연결해 생각하는 힘이 자라고 있음을 볼 수 있습니다.",
+    '사회정서발달': "놀이 중 느낀 감정을 말로 표현하는 모습에서 자기 감정을 알아차리고 나누는 힘이 자라고 있음을 볼 수 있습니다.",
+}
+
+# 놀이 수준 별점 기준 (schema/play_rating_criteria.md의 점수별 첫 기준)
+RATING_CRITERIA = {
+    'engagement': {
+        1: "놀이에 10분 이상 집중하지 못함",
+        2: "10-20분 정도 참여하지만 일관성 없음",
+        3: "20-30분 정도 한 가지 놀이 지속",
+        4: "30-45분 이상 놀이 지속",
+        5: "45분 이상 깊은 몰입",
+    },
+    'creativity': {
+        1: "정해진 방식으로만 놀이",
+        2: "가끔 새로운 시도를 하지만 단순함",
+        3: "기존 놀이에 작은 변형 추가",
+        4: "놀이를 독창적으로 변형",
+        5: "완전히 새로운 놀이 규칙이나 상황 창조",
+    },
+    'cooperation': {
+        1: "함께 놀기 거부",
+        2: "혼자 놀이 선호",
+        3: "선생님과 기본적인 협력",
+        4: "적극적으로 협력",
+        5: "탁월한 협력과 소통",
+    },
+    'persistence': {
+        1: "어려움에 즉시 포기",
+        2: "조금만 어려워도 포기",
+        3: "적당한 난이도의 과제 지속",
+        4: "어려운 과제도 시도",
+        5: "매우 어려운 과제도 끈기있게 시도",
+    },
+}
+
+
+def _iso_date(date_str: str) -> str:
+    """20251017 -> 2025-10-17"""
+    if len(date_str) == 8 and date_str.isdigit():
+        return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
+    return date_str
+
+
+def _rating(dimension: str, score: int, evidence: str) -> Dict[str, Any]:
+    """별점 항목 (점수, 기준, 근거)"""
+    return {
+        'score': score,
+        'criteria': RATING_CRITERIA[dimension][score],
+        'evidence': evidence,
+    }
+
+
+def _session_metadata(v: SessionView) -> Dict[str, Any]:
+    meta = v.metadata
+    return {
+        'session_id': f"{meta['date']}-{meta['teacher']}교사-{meta['child']}-{meta['age']}",
+        'date': _iso_date(meta['date']),
+        'child_name': v.child_name,
+        'child_age': str(v.child_age),
+        'teacher_name': v.teacher_name,
+        'duration_minutes': v.minutes,
+    }
+
+
+def _summary_stats(v: SessionView) -> Dict[str, Any]:
+    # 활발한 참여: 아동 발화가 30% 이상인 10분 구간 비율 (구간 정보가 없으면 전체 발화 비율)
+    if v.segments:
+        active = sum(1 for s in v.segments if s['child_ratio'] >= 0.3)
+        engagement_rate = active / len(v.segments) * 100
+    else:
+        engagement_rate = v.child_ratio * 100
+
+    age_comparison = {
+        'high': "또래 평균보다 말이 많은 편",
+        'balanced': "또래 평균 수준",
+        'low': "또래 평균보다 말수가 적은 편",
+    }[v.participation]
+
+    interaction_stats = {
+        'child_utterance_ratio': round(v.child_ratio * 100, 1),
+        'total_utterances': v.metrics['total_utterance_count'],
+        'age_comparison': age_comparison,
+    }
+    # 단어 수를 추정한 형식은 평균 발화 길이를 넣지 않음
+    if v.avg_words is not None:
+        interaction_stats['avg_utterance_length_words'] = round(v.avg_words, 1)
+
+    return {
+        'play_duration': {
+            'total_minutes': v.minutes,
+            'active_engagement_rate': round(engagement_rate, 1),
+        },
+        'interaction_stats': interaction_stats,
+        'voice_analysis': {
+            'interpretation': "이번 분석에는 음성 특징 데이터가 포함되어 있지 않습니다.",
+        },
+        'primary_emotions': [word for word, _ in v.positive_words[:3]],
+    }
+
+
+def _core_episodes(v: SessionView) -> List[Dict[str, Any]]:
+    # 에피소드 클러스터링 결과가 없는 분석 결과(이전 버전, basic/detailed)는 대화 발췌 사용
+    episodes = []
+    for n, sample in enumerate(v.core_episodes or v.dialogue_samples, 1):
+        area = sample['area']
+        dialogue = sample['dialogue']
+        quote = next((line['text'] for line in dialogue if line['speaker'] == 'child'), dialogue[0]['text'])
+        episodes.append({
+            'episode_id': f"ep{n}_{AREA_IDS[area]}",
+            'developmental_area': area,
+            'title': f"{AREA_TITLES[area]} \"{quote[:30]}\"",
+            'time_range': sample['time_range'],
+            'dialogue_excerpt': dialogue,
+            'narrative_description': (
+                f"{sample['time_range']} 무렵 {v.child_name}(이)가 선생님과 나눈 대화입니다. "
+                f"\"{quote}\"라고 말하며 놀이를 이어갔습니다."
+            ),
+            'developmental_significance': AREA_SIGNIFICANCE[area],
+        })
+    return episodes
+
+
+def _language_development(v: SessionView) -> Dict[str, Any]:
+    assessment = {
+        'high': "대화에 적극적으로 참여하는 편",
+        'balanced': "선생님과 균형 있게 대화하는 편",
+        'low': "듣는 시간이 많은 편",
+    }[v.participation]
+    notable = v.notable_utterances or v.examples
+    if len(notable) < 3:
+        # 인상적인 발화가 없는 형식(basic)은 에피소드 발췌의 아동 발화 중 긴 것으로 채움
+        lines = [line['text'] for sample in (v.core_episodes or v.dialogue_samples)
+                 for line in sample['dialogue'] if line['speaker'] == 'child']
+        notable = list(dict.fromkeys(notable + sorted(lines, key=len, reverse=True)))
+
+    key_metrics = {
+        'vocabulary_range': {
+            'theme_words': [word for word, _ in v.main_topics[:5]],
+        },
+    }
+    if v.avg_words is None:
+        # 단어 수를 추정한 형식은 평균 발화 길이를 말하거나 평가하지 않음
+        narrative = f"{v.child_name}(이)는 이번 놀이에서 {v.child_count}번 이야기했습니다. "
+    else:
+        narrative = (f"{v.child_name}(이)는 이번 놀이에서 {v.child_count}번 이야기했고, "
+                     f"한 번에 평균 {v.avg_words:.1f}단어로 말했습니다. ")
+        key_metrics['avg_utterance_length'] = {
+            'value': round(v.avg_words, 1),
+            'assessment': assessment,
+        }
+
+    return {
+        'summary_narrative': (
+            narrative
+            + f"전체 대화 중 {v.child_ratio:.0%}를 {v.child_name}(이)가 말해 {assessment}입니다."
+        ),
+        'key_metrics': key_metrics,
+        'notable_utterances': [
+            {
+                'text': text,
+                'significance': "생각을 여러 어절로 이어 말한 발화입니다.",
+                'linguistic_feature': f"{len(text.split())}어절",
+            }
+            for text in notable[:5]
+        ],
+    }
+
+
+def _cognitive_development(v: SessionView) -> Dict[str, Any]:
+    skills = []
+    if v.ps_count > 0:
+        skills.append({
+            'skill': "문제 해결",
+            'description': f"놀이 중 '왜', '어떻게' 같은 질문과 방법 찾기 발화가 {v.ps_count}번 있었습니다.",
+            'examples': v.examples[:3],
+        })
+
+    return {
+        'summary_narrative': (
+            f"{v.child_name}(이)는 놀이 중 궁금한 것을 묻거나 방법을 찾는 말을 {v.ps_count}번 했습니다. "
+            + {
+                'high': "호기심이 많고 스스로 생각해 보는 모습이 자주 보였습니다.",
+                'mid': "필요할 때 질문하며 생각을 넓혀 가는 모습이 보였습니다.",
+                'low': "선생님의 질문에 답하며 생각을 이어 가는 모습이 보였습니다.",
+            }[v.curiosity]
+        ),
+        'observed_skills': skills,
+    }
+
+
+def _social_emotional_development(v: SessionView) -> Dict[str, Any]:
+    traits = []
+    if v.positive_words:
+        traits.append({
+            'trait': "긍정 표현",
+            'examples': [word for word, _ in v.positive_words[:3]],
+        })
+
+    return {
+        'positive_aspects': (
+            f"{v.child_name}(이)는 긍정적인 표현을 {v.positive}번 사용했습니다. "
+            + {
+                'bright': "밝고 즐거운 마음으로 놀이에 참여했습니다.",
+                'stable': "안정된 마음으로 놀이에 참여했습니다.",
+                'frank': "자기 감정을 솔직하게 표현하며 놀이에 참여했습니다.",
+            }[v.mood]
+        ),
+        'challenging_moments': (
+            f"속상하거나 어려운 마음을 표현한 순간이 {v.negative}번 있었으며, "
+            "이는 감정을 말로 나누는 자연스러운 과정입니다."
+            if v.negative > 0 else "이번 놀이에서는 특별히 힘들어한 순간이 관찰되지 않았습니다."
+        ),
+        'observed_traits': traits,
+    }
+
+
+def _play_analysis(v: SessionView) -> Dict[str, Any]:
+    themes = [
+        {
+            'theme': topic,
+            'duration_minutes': round(v.minutes * pct / 100),
+            'description': f"전체 대화의 {pct:.0f}%가 {topic}와 관련된 이야기였습니다.",
+        }
+        for topic, pct in v.play_areas if topic != '기타'
+    ][:3]
+
+    engagement = grade(v.child_ratio, [(0.5, 5), (0.4, 4), (0.3, 3), (0.2, 2)], 1)
+    creativity = grade(v.ps_count, [(50, 5), (30, 4), (15, 3), (5, 2)], 1)
+    cooperation = grade(v.ratio, [(2.0, 5), (1.5, 4), (0.7, 3), (0.4, 2)], 1)
+
+    ratings = {
+        'engagement': _rating('engagement', engagement, f"아동 발화 비율 {v.child_ratio:.0%}"),
+        'creativity': _rating('creativity', creativity, f"질문·문제해결 발화 {v.ps_count}회"),
+        'cooperation': _rating('cooperation', cooperation,
+                               f"긍정/부정 표현 {v.positive}:{v.negative}"),
+    }
+    # 주제 지속도를 측정하지 않은 분석 결과는 끈기 별점을 매기지 않음
+    if v.persistence is not None:
+        persistence = grade(v.persistence, [(3.5, 5), (3.0, 4), (2.0, 3), (1.5, 2)], 1)
+        ratings['persistence'] = _rating('persistence', persistence, f"주제 지속도 {v.persistence:.1f}")
+
+    return {
+        'primary_themes': themes,
+        'play_quality_ratings': ratings,
+    }
+
+
+def _conversation_starters(v: SessionView) -> List[Dict[str, Any]]:
+    topic = v.top_topic or "놀이"
+    return [
+        {
+            'question': f"오늘 선생님이랑 {topic} 이야기할 때 뭐가 제일 재미있었어?",
+            'context': f"놀이 중 가장 많이 나온 '{topic}' 이야기를 떠올리게 하는 질문",
+            'why_effective': "아이가 오늘의 경험을 스스로 정리해 말해 보며 기억과 표현을 함께 연습할 수 있습니다.",
+        },
+        {
+            'question': "다음에 선생님이 오면 어떤 놀이를 새로 해보고 싶어?",
+            'context': "오늘의 놀이 경험을 바탕으로 다음 놀이를 상상해 보게 하는 질문",
+            'why_effective': "아이의 선호를 알 수 있고, 스스로 놀이를 계획해 보는 경험이 됩니다.",
+        },
+    ]
+
+
+def build_parent_report(view: SessionView) -> Dict[str, Any]:
+    """
+    부모용 구조화 레포트 생성
+
+    Args:
+        view: 세션 파생 지표
+
+    Returns:
+        parent_report_schema.json 형식의 dict (검증 전)
+    """
+    return {
+        'session_metadata': _session_metadata(view),
+        'summary_stats': _summary_stats(view),
+        'core_episodes': _core_episodes(view),
+        'language_development': _language_development(view),
+        'cognitive_development': _cognitive_development(view),
+        'social_emotional_development': _social_emotional_development(view),
+        'play_analysis': _play_analysis(view),
+        'conversation_starters': _conversation_starters(view),
+    }
+
+
+def parent_report_errors(report: Dict[str, Any]) -> List[str]:
+    """부모용 레포트의 스키마 위반 목록 (맞으면 빈 목록)"""
+    return load_validator(PARENT_SCHEMA_PATH).errors(report)
+
+
+def validate_parent_report(report: Dict[str, Any]):
+    """부모용 레포트가 스키마에 맞지 않으면 SchemaValidationError"""
+    errors = parent_report_errors(report)
+    if errors:
+        raise SchemaValidationError(errors)
@@ -0,0 +1,167 @@
+"""
+프롬프트/모델 응답 캐시 (내용 해시 키, 용량 기준 LRU)
+- 키: sha256(종류 + 내용 + 모델 파라미터) → 같은 입력이면 다시 만들거나 다시 호출하지 않음
+  · 'prompt'   : 청크 대화 + 프롬프트 양식 → 프롬프트 텍스트
+  · 'response' : 프롬프트 텍스트 + 백엔드 파라미터 → 모델 응답
+- 항목마다 파일 하나 (<캐시>/<키 앞 2자리>/<키>.json), 목록은 <캐시>/index.json
+- 전체 크기가 max_bytes를 넘으면 가장 오래 쓰이지 않은 항목부터 삭제
+- 인덱스는 임시 파일에 쓴 뒤 os.replace로 교체 (중간에 끊겨도 깨지지 않음)
+
+Usage: python prompt_cache.py [캐시 폴더] [--clear]
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_DIR = '.prompt_cache'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+INDEX_NAME = 'index.json'
+
+
+def cache_key(kind: str, content: Any, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    캐시 키 계산
+
+    Args:
+        kind: 항목 종류 ('prompt', 'response')
+        content: 키를 만들 내용 (JSON 직렬화 가능)
+        params: 모델 파라미터 (다르면 다른 키)
+    """
+    payload = json.dumps([kind, content, params or {}], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class PromptCache:
+    """디스크 캐시 (with 문 또는 save()로 인덱스 저장)"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: 캐시 폴더
+            max_bytes: 캐시 전체 크기 상한 (바이트)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        # key → {'size': 바이트, 'used': 마지막 사용 순번}
+        index_path = self.cache_dir / INDEX_NAME
+        if index_path.exists():
+            with open(index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        else:
+            self.index = {}
+        self.total_bytes = sum(entry['size'] for entry in self.index.values())
+        self._clock = max((entry['used'] for entry in self.index.values()), default=0)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _touch(self, key: str):
+        self._clock += 1
+        self.index[key]['used'] = self._clock
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 값 (없으면 None)"""
+        if key not in self.index:
+            self.misses += 1
+            return None
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            # 파일이 지워졌거나 깨진 항목은 인덱스에서 제거
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._touch(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        """값 저장 후 용량 상한을 넘으면 오래된 항목부터 삭제"""
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(data)
+
+        if key in self.index:
+            self.total_bytes -= self.index[key]['size']
+        self.index[key] = {'size': len(data), 'used': 0}
+        self.total_bytes += len(data)
+        self._touch(key)
+        self._evict()
+
+    def _remove(self, key: str):
+        entry = self.index.pop(key)
+        self.total_bytes -= entry['size']
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        if self.total_bytes <= self.max_bytes:
+            return
+        for key in sorted(self.index, key=lambda k: self.index[k]['used']):
+            if self.total_bytes <= self.max_bytes:
+                break
+            self._remove(key)
+
+    def clear(self):
+        """모든 항목 삭제"""
+        for key in list(self.index):
+            self._remove(key)
+        self.save()
+
+    def save(self):
+        """인덱스 저장"""
+        path = self.cache_dir / INDEX_NAME
+        temp = path.with_name(path.name + '.tmp')
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, separators=(',', ':'))
+        os.replace(temp, path)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'entries': len(self.index),
+            'bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.save()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='프롬프트/응답 캐시 상태 확인')
+    parser.add_argument('cache_dir', nargs='?', default=DEFAULT_CACHE_DIR, help='캐시 폴더')
+    parser.add_argument('--clear', action='store_true', help='캐시 비우기')
+    args = parser.parse_args()
+
+    cache = PromptCache(args.cache_dir)
+    if args.clear:
+        count = len(cache.index)
+        cache.clear()
+        print(f"🗑️  {count}개 항목 삭제: {args.cache_dir}")
+        return
+
+    stats = cache.stats()
+    print(f"📦 {args.cache_dir}: {stats['entries']}개 항목, "
+          f"{stats['bytes'] / 1024 / 1024:.1f}MB / {stats['max_bytes'] / 1024 / 1024:.0f}MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+토큰 예산 기반 대화 청크 분할
+- 발화별 토큰 수를 로컬 근사치로 추정 (한국어 토크나이저 근사, 외부 의존성 없음)
+  · 한글 음절 1개 ≈ 1토큰
+  · 영문/숫자 연속 ≈ 4글자당 1토큰
+  · 그 밖의 기호 1개 ≈ 1토큰, 공백은 0
+- 발화를 순서대로 예산까지 채워 청크를 만들고, 다음 청크는 직전 청크 끝의 발화 일부를
+  겹쳐서 시작 (overlap) → 청크 경계에서 맥락이 끊기지 않음
+- 모든 발화가 최소 한 청크에 포함됨 (잘라내지 않음). 예산보다 긴 발화 하나는 단독 청크
+"""
+
+import re
+from typing import List, Sequence, Tuple
+
+HANGUL_RE = re.compile(r'[가-힣ㄱ-ㆎ]')
+ALNUM_RE = re.compile(r'[A-Za-z0-9]+')
+SYMBOL_RE = re.compile(r'[^\sA-Za-z0-9가-힣ㄱ-ㆎ]')
+
+# 발화 한 줄의 고정 비용 (가장 긴 '[선생님] ' 라벨 기준)
+LINE_OVERHEAD_TOKENS = 5
+
+DEFAULT_MAX_TOKENS = 3000
+DEFAULT_OVERLAP_TOKENS = 200
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수 근사치"""
+    hangul = len(HANGUL_RE.findall(text))
+    alnum = sum((len(run) + 3) // 4 for run in ALNUM_RE.findall(text))
+    symbols = len(SYMBOL_RE.findall(text))
+    return hangul + alnum + symbols
+
+
+def pack_by_tokens(costs: Sequence[int], max_tokens: int = DEFAULT_MAX_TOKENS,
+                   overlap_tokens: int = DEFAULT_OVERLAP_TOKENS) -> List[Tuple[int, int]]:
+    """
+    항목별 토큰 비용을 예산 안에서 순서대로 묶기
+
+    Args:
+        costs: 항목(발화)별 토큰 수
+        max_tokens: 청크 하나의 토큰 예산
+        overlap_tokens: 다음 청크가 앞 청크 끝에서 다시 포함할 최대 토큰 수
+
+    Returns:
+        [(시작 인덱스, 끝 인덱스(미포함)), ...] - 모든 항목을 덮음
+    """
+    if max_tokens <= 0:
+        raise ValueError("max_tokens는 0보다 커야 합니다")
+    overlap_tokens = max(0, min(overlap_tokens, max_tokens // 2))
+
+    spans = []
+    start = 0
+    n = len(costs)
+
+    while start < n:
+        # 예산까지 채우기 (최소 1개)
+        end = start
+        total = 0
+        while end < n and (end == start or total + costs[end] <= max_tokens):
+            total += costs[end]
+            end += 1
+        spans.append((start, end))
+        if end >= n:
+            break
+
+        # 다음 청크 시작: 끝에서부터 overlap 예산만큼 되돌아가되, 반드시 앞으로 진행
+        next_start = end
+        overlap = 0
+        while next_start - 1 > start and overlap + costs[next_start - 1] <= overlap_tokens:
+            next_start -= 1
+            overlap += costs[next_start]
+        # 겹침 때문에 새 항목이 들어갈 자리가 없으면 겹침을 줄임
+        while next_start < end and overlap + costs[end] > max_tokens:
+            overlap -= costs[next_start]
+            next_start += 1
+        start = next_start
+
+    return spans
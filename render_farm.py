@@ -0,0 +1,374 @@
+"""
+레포트 렌더 팜
+- (세션 × 대상) 렌더 작업을 프로세스 풀에 분배
+  · 다시 렌더링할 작업을 세션별 묶음으로 나눠 보내므로 같은 세션의 대상들은
+    같은 워커에서 분석 파일을 한 번만 읽어 렌더링
+- 워커는 내용만 돌려주고, 파일 쓰기는 부모 프로세스가 모아서 한 번에 처리
+  (임시 파일에 쓴 뒤 os.replace로 원자적 교체 → 쓰는 도중의 파일이 보이지 않음)
+- 진행 상황은 파일마다 print하지 않고 하나의 진행 표시줄로만 출력
+- 증분 렌더링: (분석 내용 해시, 대상, 대상별 템플릿 버전 해시)가 지난번과 같은 레포트는 건너뜀
+  · 기록은 레포트 폴더의 .render_manifest.json
+  · --dry-run: 다시 렌더링할 (세션, 대상)과 이유만 출력
+
+Usage: python render_farm.py [analysis_dir] [--report-dir DIR] [--workers N] [--audiences parent,teacher,...]
+                             [--dry-run] [--force]
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from analysis_adapters import pick_session_files
+
+# 대상 → (ReportGenerator 메서드, 파일 접미사)
+AUDIENCES = {
+    'parent': ('generate_parent_report', '_parent_report.txt'),
+    'parent_json': ('generate_parent_report_json', '_parent_report.json'),
+    'teacher': ('generate_teacher_report', '_teacher_report.txt'),
+    'journal': ('generate_visit_journal', '_visit_journal.txt'),
+    'company': ('generate_company_report', '_company_report.txt'),
+}
+
+BASE_DIR = Path(__file__).parent
+MANIFEST_NAME = '.render_manifest.json'
+
+# 모든 대상이 공유하는 렌더링 코드 (바뀌면 전체 다시 렌더링)
+SHARED_SOURCES = ['report_generator.py', 'session_view.py', 'analysis_adapters.py', 'template_engine.py']
+
+# 대상별 템플릿/생성 코드 (바뀌면 해당 대상만 다시 렌더링)
+AUDIENCE_SOURCES = {
+    'parent': ['templates/parent_report.tmpl'],
+    'parent_json': ['parent_report_json.py', 'schema_validator.py', 'schema/parent_report_schema.json'],
+    'teacher': ['templates/teacher_report.tmpl'],
+    'journal': ['templates/visit_journal.tmpl'],
+    'company': ['templates/company_report.tmpl'],
+}
+
+# 워커 프로세스별 마지막 세션의 생성기 (같은 세션의 다음 대상에서 재사용)
+_cached = (None, None)
+
+
+def _generator(analysis_file: str):
+    global _cached
+    if _cached[0] != analysis_file:
+        from report_generator import ReportGenerator
+        _cached = (analysis_file, ReportGenerator(analysis_file))
+    return _cached[1]
+
+
+def render_job(job: Tuple[str, str]) -> Dict:
+    """
+    작업 하나 렌더링 (워커에서 실행, 파일은 쓰지 않음)
+
+    Args:
+        job: (분석 파일 경로, 대상)
+
+    Returns:
+        {'status': 'ok', 'name': 파일명, 'data': bytes} /
+        {'status': 'skipped' | 'error', 'error': 메시지}
+    """
+    analysis_file, audience = job
+    method, suffix = AUDIENCES[audience]
+    try:
+        generator = _generator(analysis_file)
+        content = getattr(generator, method)()
+        if audience == 'parent_json':
+            from parent_report_json import parent_report_errors
+            errors = parent_report_errors(content)
+            if errors:
+                return {'status': 'skipped', 'error': f"스키마 검증 실패 {len(errors)}건 - {errors[0]}"}
+            content = json.dumps(content, ensure_ascii=False, indent=2)
+        return {'status': 'ok', 'name': generator.session_name + suffix, 'data': content.encode('utf-8')}
+    except Exception as e:
+        return {'status': 'error', 'error': str(e)}
+
+
+def render_batch(jobs: List[Tuple[str, str]]) -> List[Dict]:
+    """같은 세션의 작업 묶음 렌더링 (워커에서 실행, render_job 결과 목록)"""
+    return [render_job(job) for job in jobs]
+
+
+def session_batches(jobs: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+    """작업을 분석 파일별 묶음으로 (첫 등장 순서 유지)"""
+    batches = {}
+    for job in jobs:
+        batches.setdefault(job[0], []).append(job)
+    return list(batches.values())
+
+
+def _hash_files(paths: Iterable) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def template_versions(audiences: Iterable[str]) -> Dict[str, str]:
+    """대상별 템플릿 버전 해시 (공유 렌더링 코드 + 대상 템플릿 내용)"""
+    shared = [BASE_DIR / name for name in SHARED_SOURCES]
+    return {
+        audience: _hash_files(shared + [BASE_DIR / name for name in AUDIENCE_SOURCES[audience]])
+        for audience in audiences
+    }
+
+
+def load_manifest(report_dir) -> Dict[str, Dict]:
+    """렌더링 기록 {'분석파일명|대상': {'analysis', 'template', 'output'}} (output None: 검증 실패로 미저장)"""
+    path = Path(report_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(report_dir, manifest: Dict[str, Dict]):
+    """렌더링 기록 저장 (임시 파일 후 교체)"""
+    path = Path(report_dir) / MANIFEST_NAME
+    temp = path.with_name(f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+    with open(temp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(temp, path)
+
+
+def plan_renders(analysis_files: Iterable, report_dir, audiences: List[str],
+                 force: bool = False) -> Tuple[List[Tuple[Tuple[str, str], Dict, str]], int]:
+    """
+    다시 렌더링할 작업 목록
+
+    Returns:
+        ([(작업, 새 기록, 이유)], 건너뛸 작업 수)
+    """
+    report_dir = Path(report_dir)
+    manifest = {} if force else load_manifest(report_dir)
+    versions = template_versions(audiences)
+    planned, unchanged = [], 0
+
+    for path in analysis_files:
+        analysis_hash = _hash_files([path])
+        for audience in audiences:
+            entry_key = f"{Path(path).name}|{audience}"
+            entry = {'analysis': analysis_hash, 'template': versions[audience]}
+            previous = manifest.get(entry_key)
+
+            if previous is None:
+                reason = '신규' if not force else '강제'
+            elif previous['analysis'] != analysis_hash:
+                reason = '분석 변경'
+            elif previous['template'] != versions[audience]:
+                reason = '템플릿 변경'
+            elif previous['output'] and not (report_dir / previous['output']).exists():
+                reason = '출력 없음'
+            else:
+                unchanged += 1
+                continue
+
+            planned.append(((str(path), audience), entry, reason))
+
+    return planned, unchanged
+
+
+class BatchWriter:
+    """렌더 결과를 모아 두었다가 한 번에 원자적으로 쓰는 기록기"""
+
+    def __init__(self, output_dir, max_files: int = 64, max_bytes: int = 4 * 1024 * 1024):
+        """
+        Args:
+            output_dir: 저장 폴더
+            max_files: 이 개수만큼 모이면 flush
+            max_bytes: 이 크기만큼 모이면 flush
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self._pending: List[Tuple[str, bytes]] = []
+        self._pending_bytes = 0
+        self.written = 0
+
+    def add(self, name: str, data: bytes):
+        self._pending.append((name, data))
+        self._pending_bytes += len(data)
+        if len(self._pending) >= self.max_files or self._pending_bytes >= self.max_bytes:
+            self.flush()
+
+    def flush(self):
+        """모인 파일을 임시 파일로 모두 쓴 뒤 차례로 제자리에 교체"""
+        if not self._pending:
+            return
+        temps = []
+        for name, data in self._pending:
+            target = self.output_dir / name
+            temp = target.with_name(f".{name}.{os.getpid()}.tmp")
+            with open(temp, 'wb') as f:
+                f.write(data)
+            temps.append((temp, target))
+        for temp, target in temps:
+            os.replace(temp, target)
+        self.written += len(temps)
+        self._pending = []
+        self._pending_bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+
+class Progress:
+    """단일 진행 표시줄 (stderr, 갱신 간격 제한)"""
+
+    def __init__(self, total: int, label: str = '렌더링', interval: float = 0.2, stream=None):
+        self.total = total
+        self.label = label
+        self.interval = interval
+        self.stream = stream or sys.stderr
+        self.done = 0
+        self.failed = 0
+        self._start = time.perf_counter()
+        self._last = 0.0
+        self._drawn = -1
+
+    def update(self, ok: bool = True):
+        self.done += 1
+        if not ok:
+            self.failed += 1
+        now = time.perf_counter()
+        if now - self._last >= self.interval or self.done == self.total:
+            self._last = now
+            self._draw(now)
+
+    def _draw(self, now: float):
+        self._drawn = self.done
+        elapsed = now - self._start
+        rate = self.done / elapsed if elapsed > 0 else 0
+        self.stream.write(f"\r📝 {self.label} {self.done}/{self.total} "
+                          f"(실패 {self.failed}) {rate:.0f}건/초")
+        self.stream.flush()
+
+    def close(self):
+        if self._drawn != self.done:
+            self._draw(time.perf_counter())
+        self.stream.write('\n')
+        self.stream.flush()
+
+
+def render_reports(analysis_files: Iterable, report_dir: str = 'reports', workers: int = 1,
+                   audiences: Optional[List[str]] = None, incremental: bool = False,
+                   dry_run: bool = False) -> Dict:
+    """
+    여러 세션의 레포트를 대상별로 병렬 렌더링해서 저장
+
+    Args:
+        analysis_files: 세션별 분석 JSON 경로
+        report_dir: 레포트 저장 폴더
+        workers: 렌더링 프로세스 수 (1이면 현재 프로세스에서 처리)
+        audiences: 생성할 대상 (기본: AUDIENCES 전부)
+        incremental: 분석/템플릿이 바뀐 (세션, 대상)만 렌더링
+        dry_run: 렌더링하지 않고 계획만 반환 (incremental 기록 기준)
+
+    Returns:
+        {'written': 저장 수, 'unchanged': 건너뛴 수, 'planned': [(작업, 이유)],
+         'skipped': [(작업, 사유)], 'errors': [(작업, 오류)]}
+    """
+    audiences = list(audiences) if audiences else list(AUDIENCES)
+    unknown = [a for a in audiences if a not in AUDIENCES]
+    if unknown:
+        raise ValueError(f"알 수 없는 대상: {', '.join(unknown)} (가능: {', '.join(AUDIENCES)})")
+
+    analysis_files = list(analysis_files)
+    planned, unchanged = plan_renders(analysis_files, report_dir, audiences, force=not (incremental or dry_run))
+    summary = {
+        'written': 0,
+        'unchanged': unchanged,
+        'planned': [(job, reason) for job, _, reason in planned],
+        'skipped': [],
+        'errors': [],
+    }
+    if dry_run:
+        return summary
+
+    batches = session_batches([job for job, _, _ in planned])
+    jobs = [job for batch in batches for job in batch]
+    entries = {job: entry for job, entry, _ in planned}
+    manifest = load_manifest(report_dir)
+    progress = Progress(len(jobs))
+    skipped, errors = summary['skipped'], summary['errors']
+
+    with BatchWriter(report_dir) as writer:
+        if workers <= 1:
+            results = map(render_job, jobs)
+            executor = None
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=workers)
+            # 증분 렌더링이면 세션마다 남은 대상 수가 달라 고정 chunksize로는 묶이지 않으므로 세션 묶음 단위로 분배
+            results = (result for batch in executor.map(render_batch, batches) for result in batch)
+
+        try:
+            for job, result in zip(jobs, results):
+                status = result['status']
+                if status == 'ok':
+                    writer.add(result['name'], result['data'])
+                    manifest[f"{Path(job[0]).name}|{job[1]}"] = dict(entries[job], output=result['name'])
+                elif status == 'skipped':
+                    # 스키마 검증 실패도 기록해 두어 입력이 바뀌기 전에는 다시 시도하지 않음
+                    skipped.append((job, result['error']))
+                    manifest[f"{Path(job[0]).name}|{job[1]}"] = dict(entries[job], output=None)
+                else:
+                    errors.append((job, result['error']))
+                progress.update(status != 'error')
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    progress.close()
+    save_manifest(report_dir, manifest)
+    summary['written'] = writer.written
+    return summary
+
+
+def print_plan(summary: Dict):
+    """dry-run 계획 출력 (다시 렌더링할 (세션, 대상)과 이유)"""
+    for (analysis_file, audience), reason in summary['planned']:
+        print(f"  • {Path(analysis_file).name} [{audience}]: {reason}")
+    print(f"🔎 다시 렌더링 {len(summary['planned'])}개, 변경 없음 {summary['unchanged']}개")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='레포트 렌더 팜 (세션 × 대상 병렬 렌더링)')
+    parser.add_argument('analysis_dir', nargs='?', default='analysis_results', help='분석 결과 폴더')
+    parser.add_argument('--report-dir', default='reports', help='레포트 저장 폴더')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='렌더링 프로세스 수')
+    parser.add_argument('--audiences', default=','.join(AUDIENCES),
+                        help=f"생성할 대상 (쉼표 구분, 기본: {','.join(AUDIENCES)})")
+    parser.add_argument('--dry-run', action='store_true', help='다시 렌더링할 (세션, 대상)만 출력')
+    parser.add_argument('--force', action='store_true', help='기록을 무시하고 전부 다시 렌더링')
+    args = parser.parse_args()
+
+    analysis_files = pick_session_files(Path(args.analysis_dir).glob('*_analysis.json'))
+    audiences = [a.strip() for a in args.audiences.split(',') if a.strip()]
+
+    summary = render_reports(analysis_files, args.report_dir, args.workers, audiences,
+                             incremental=not args.force, dry_run=args.dry_run)
+
+    if args.dry_run:
+        print_plan(summary)
+        return
+
+    print(f"✅ {summary['written']}개 저장, 변경 없음 {summary['unchanged']}개: {args.report_dir}")
+    for (analysis_file, audience), reason in summary['skipped']:
+        print(f"⚠️  건너뜀 {Path(analysis_file).name} [{audience}]: {reason}")
+    for (analysis_file, audience), error in summary['errors']:
+        print(f"❌ {Path(analysis_file).name} [{audience}]: {error}")
+    sys.exit(1 if summary['errors'] else 0)
+
+
+if __name__ == '__main__':
+    main()
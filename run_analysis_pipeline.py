@@ -12,10 +12,18 @@ import json
 # 로컬 모듈 임포트
 from analyze_metrics import PlaySessionAnalyzer
 from generate_reports_v2 import generate_all_reports
+from sharding import parse_shard, select_shard
+from corpus import append_to_corpus
 
 
-def run_full_analysis(session_path: str, output_dir: str = None):
-    """전체 분석 파이프라인 실행"""
+def run_full_analysis(session_path: str, output_dir: str = None, corpus: str = None, store: str = None):
+    """
+    전체 분석 파이프라인 실행
+    
+    Args:
+        corpus: 분석 결과 코퍼스(JSONL) 경로. 지정하면 세션별 JSON과 함께 한 줄씩 추가
+        store: 세션 지표 저장소(SQLite) 경로. 지정하면 수치 지표를 함께 추가
+    """
     
     session_path = Path(session_path)
     
@@ -45,6 +53,10 @@ def run_full_analysis(session_path: str, output_dir: str = None):
     analysis_file = output_dir / f"{session_path.name}_detailed_analysis.json"
     with open(analysis_file, 'w', encoding='utf-8') as f:
         json.dump(analysis_result, f, ensure_ascii=False, indent=2)
+    append_to_corpus(corpus, session_path.name, 'detailed', analysis_result)
+    if store:
+        from metrics_store import append_to_store
+        append_to_store(store, session_path.name, analysis_result)
     
     print(f"✓ 분석 결과 저장: {analysis_file}\n")
     
@@ -66,8 +78,16 @@ def run_full_analysis(session_path: str, output_dir: str = None):
     return analysis_result
 
 
-def batch_analyze_all_sessions(raw_data_dir: str, output_dir: str = None):
-    """모든 세션 일괄 분석"""
+def batch_analyze_all_sessions(raw_data_dir: str, output_dir: str = None, shard: tuple = None,
+                               corpus: str = None, store: str = None):
+    """
+    모든 세션 일괄 분석
+    
+    Args:
+        shard: (index, count) 튜플. 지정하면 해당 샤드의 세션만 분석
+        corpus: 분석 결과 코퍼스(JSONL) 경로
+        store: 세션 지표 저장소(SQLite) 경로
+    """
     
     raw_data_dir = Path(raw_data_dir)
     
@@ -78,8 +98,12 @@ def batch_analyze_all_sessions(raw_data_dir: str, output_dir: str = None):
     # 세션 디렉토리 찾기 (날짜로 시작하는 디렉토리)
     session_dirs = [d for d in raw_data_dir.iterdir() 
                    if d.is_dir() and d.name[0].isdigit() and len(d.name) > 8]
+    found_count = len(session_dirs)
+    session_dirs = select_shard(sorted(session_dirs), shard)
     
-    print(f"\n발견된 세션 수: {len(session_dirs)}")
+    print(f"\n발견된 세션 수: {found_count}")
+    if shard:
+        print(f"샤드 {shard[0]}/{shard[1]} 담당 세션 수: {len(session_dirs)}")
     print(f"{'='*70}\n")
     
     results = []
@@ -87,7 +111,7 @@ def batch_analyze_all_sessions(raw_data_dir: str, output_dir: str = None):
         print(f"\n[{i}/{len(session_dirs)}] {session_dir.name}")
         
         try:
-            result = run_full_analysis(str(session_dir), output_dir)
+            result = run_full_analysis(str(session_dir), output_dir, corpus, store)
             results.append({
                 'session': session_dir.name,
                 'status': 'success',
@@ -126,16 +150,38 @@ def batch_analyze_all_sessions(raw_data_dir: str, output_dir: str = None):
 def main():
     """메인 함수"""
     
-    if len(sys.argv) > 1:
+    args = sys.argv[1:]
+    
+    def pop_option(name):
+        """'--name 값' 옵션을 인자 목록에서 꺼냄"""
+        if name not in args:
+            return None
+        i = args.index(name)
+        value = args[i + 1] if i + 1 < len(args) else ''
+        del args[i:i + 2]
+        return value
+    
+    # --shard i/N: 일괄 분석 시 해당 샤드의 세션만 처리
+    try:
+        shard = parse_shard(pop_option('--shard'))
+    except ValueError as e:
+        print(f"❌ {e}")
+        raise SystemExit(2)
+    # --corpus 경로: 분석 결과를 코퍼스(JSONL)에도 추가
+    corpus = pop_option('--corpus')
+    # --store 경로: 세션 지표를 SQLite 저장소에도 추가
+    store = pop_option('--store')
+    
+    if args:
         # 명령줄 인자로 세션 경로 지정
-        session_path = sys.argv[1]
+        session_path = args[0]
         
         if Path(session_path).is_dir() and not Path(session_path).name[0].isdigit():
             # raw_data 디렉토리가 전달된 경우 일괄 분석
-            batch_analyze_all_sessions(session_path)
+            batch_analyze_all_sessions(session_path, shard=shard, corpus=corpus, store=store)
         else:
             # 특정 세션 분석
-            run_full_analysis(session_path)
+            run_full_analysis(session_path, corpus=corpus, store=store)
     else:
         # 기본: 샘플 세션 2개 분석
         raw_data_dir = Path(__file__).parent / "raw_data"
@@ -146,7 +192,7 @@ def main():
         ]
         
         print("샘플 세션 분석 실행")
-        print("(전체 세션을 분석하려면: python run_analysis_pipeline.py <raw_data_dir>)")
+        print("(전체 세션을 분석하려면: python run_analysis_pipeline.py <raw_data_dir> [--shard i/N])")
         print()
         
         for session_name in sample_sessions:
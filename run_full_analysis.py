@@ -8,17 +8,21 @@
 import os
 import sys
 from datetime import datetime
+from functools import partial
 from enhanced_analysis import analyze_session
 from report_generator import ReportGenerator
+from sharding import shard_arg, select_shard
+from batch_runner import ResultLog, iter_results, run_bounded
 
 
-def run_full_pipeline(session_path: str, output_base_dir: str = None):
+def run_full_pipeline(session_path: str, output_base_dir: str = None, store: str = None):
     """
     전체 파이프라인 실행
     
     Args:
         session_path: 세션 폴더 경로
         output_base_dir: 출력 디렉토리 (기본값: 프로젝트 루트)
+        store: 세션 지표 저장소(SQLite) 경로. 지정하면 수치 지표를 함께 추가
     """
     if output_base_dir is None:
         output_base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -38,7 +42,7 @@ def run_full_pipeline(session_path: str, output_base_dir: str = None):
     
     try:
         analysis_dir = os.path.join(output_base_dir, 'analysis_results')
-        analyzer, analysis_file = analyze_session(session_path, analysis_dir)
+        analyzer, analysis_file = analyze_session(session_path, analysis_dir, store_path=store)
         print(f"✅ 분석 완료: {analysis_file}\n")
     except Exception as e:
         print(f"❌ 분석 실패: {e}")
@@ -87,14 +91,44 @@ def run_full_pipeline(session_path: str, output_base_dir: str = None):
     }
 
 
-def batch_process_sessions(raw_data_dir: str, output_base_dir: str = None, limit: int = None):
+def _process_session(session_path: str, output_base_dir: str, store: str = None):
+    """세션 하나 처리 (프로세스 풀 워커) - 전체 지표 대신 결과 요약만 반환"""
+    try:
+        result = run_full_pipeline(session_path, output_base_dir, store)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        return {'status': 'error', 'error': str(e)}
+    
+    if not result:
+        return {'status': 'failed'}
+    
+    return {
+        'status': 'success',
+        'analysis_file': result['analysis_file'],
+        'reports': result['reports']
+    }
+
+
+def batch_process_sessions(raw_data_dir: str, output_base_dir: str = None, limit: int = None,
+                           shard: tuple = None, workers: int = 1, max_rss_mb: float = None,
+                           results_log: str = None, store: str = None):
     """
     여러 세션 일괄 처리
     
+    세션별 결과 요약은 끝나는 즉시 JSONL 파일에 기록하고, 메모리에는 카운터만 유지합니다.
+    
     Args:
         raw_data_dir: raw_data 디렉토리 경로
         output_base_dir: 출력 디렉토리
         limit: 처리할 세션 수 제한 (None이면 전체)
+        shard: (index, count) 튜플. 지정하면 해당 샤드의 세션만 처리
+        workers: 동시 처리 프로세스 수
+        max_rss_mb: 전체 RSS 상한 (MB). 넘으면 동시 실행 수를 줄임
+        results_log: 결과 요약 JSONL 경로 (기본값: 출력 디렉토리/batch_results.jsonl)
+        store: 세션 지표 저장소(SQLite) 경로
+    
+    Returns:
+        {'total', 'success', 'failed', 'results_log'} 카운터
     """
     if output_base_dir is None:
         output_base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -114,68 +148,57 @@ def batch_process_sessions(raw_data_dir: str, output_base_dir: str = None, limit
                 sessions.append(item_path)
     
     sessions.sort()
+    sessions = select_shard(sessions, shard)
     
     if limit:
         sessions = sessions[:limit]
     
     print(f"📦 발견된 세션: {len(sessions)}개")
+    if shard:
+        print(f"🧩 샤드 {shard[0]}/{shard[1]} 담당 세션만 처리합니다.")
     if limit:
         print(f"📝 처리할 세션: {limit}개\n")
     else:
         print(f"📝 모든 세션을 처리합니다.\n")
     
-    results = []
-    success_count = 0
-    fail_count = 0
+    if results_log is None:
+        results_log = os.path.join(output_base_dir, 'batch_results.jsonl')
     
-    for i, session_path in enumerate(sessions, 1):
-        session_name = os.path.basename(session_path)
-        
-        print(f"\n{'▶'*3} [{i}/{len(sessions)}] {session_name}")
-        print("-" * 70)
-        
-        try:
-            result = run_full_pipeline(session_path, output_base_dir)
-            if result:
-                results.append({
-                    'session': session_name,
-                    'status': 'success',
-                    'result': result
-                })
-                success_count += 1
+    counters = {'total': len(sessions), 'success': 0, 'failed': 0, 'results_log': results_log}
+    
+    with ResultLog(results_log) as log:
+        def on_result(session_path, result):
+            session_name = os.path.basename(session_path)
+            done = counters['success'] + counters['failed'] + 1
+            log.write({'session': session_name, **result})
+            
+            if result['status'] == 'success':
+                counters['success'] += 1
             else:
-                results.append({
-                    'session': session_name,
-                    'status': 'failed',
-                    'result': None
-                })
-                fail_count += 1
-        except Exception as e:
-            print(f"❌ 오류 발생: {e}")
-            results.append({
-                'session': session_name,
-                'status': 'error',
-                'error': str(e)
-            })
-            fail_count += 1
+                counters['failed'] += 1
+            print(f"\n{'▶'*3} [{done}/{len(sessions)}] {session_name}: {result['status']}")
+        
+        run_bounded(sessions, partial(_process_session, output_base_dir=output_base_dir, store=store),
+                    workers=workers, max_rss_mb=max_rss_mb, on_result=on_result)
     
     # 최종 요약
     print("\n" + "="*70)
     print("🏁 일괄 처리 완료")
     print("="*70)
     print(f"\n총 {len(sessions)}개 세션 처리:")
-    print(f"  ✅ 성공: {success_count}개")
-    print(f"  ❌ 실패: {fail_count}개")
+    print(f"  ✅ 성공: {counters['success']}개")
+    print(f"  ❌ 실패: {counters['failed']}개")
+    print(f"  📄 결과 요약: {results_log}")
     
-    if fail_count > 0:
+    if counters['failed'] > 0:
         print("\n실패한 세션:")
-        for r in results:
+        for r in iter_results(results_log):
             if r['status'] != 'success':
                 print(f"  • {r['session']}: {r.get('error', '알 수 없는 오류')}")
     
     print("\n" + "="*70 + "\n")
     
-    return results
+    return counters
 
 
 def main():
@@ -190,15 +213,22 @@ def main():
                        help='raw_data 디렉토리 경로')
     parser.add_argument('--output-dir', type=str, help='출력 디렉토리')
     parser.add_argument('--limit', type=int, help='처리할 세션 수 제한')
+    parser.add_argument('--shard', type=shard_arg, help='분산 처리 샤드 (i/N, i는 0부터 시작)')
+    parser.add_argument('--workers', type=int, default=1, help='동시 처리 프로세스 수')
+    parser.add_argument('--max-rss-mb', type=float, help='전체 메모리(RSS) 상한 (MB)')
+    parser.add_argument('--results-log', type=str, help='세션별 결과 요약 JSONL 경로')
+    parser.add_argument('--store', type=str, help='세션 지표를 추가할 SQLite 저장소 경로')
     
     args = parser.parse_args()
     
     if args.session:
         # 단일 세션 처리
-        run_full_pipeline(args.session, args.output_dir)
+        run_full_pipeline(args.session, args.output_dir, args.store)
     elif args.batch:
         # 일괄 처리
-        batch_process_sessions(args.raw_data_dir, args.output_dir, args.limit)
+        batch_process_sessions(args.raw_data_dir, args.output_dir, args.limit,
+                               args.shard, args.workers, args.max_rss_mb,
+                               args.results_log, args.store)
     else:
         # 기본: 첫 번째 세션 처리 (테스트)
         session_path = '/Users/healin/Downloads/develop/care-intell/raw_data/20251017-이민정교사-김준우-만4세-02_00_48-65kbps_mono'
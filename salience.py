@@ -0,0 +1,117 @@
+"""
+핵심 발화 선택 (프롬프트 구성용)
+- 발화마다 정보량 점수를 매겨 토큰 예산 안에서 점수가 높은 발화만 남김 (시간 순서는 유지)
+  · 키워드: 문제해결/정서 단어(enhanced_analysis 사전), 질문
+  · 길이: 한글 음절 수 (20음절에서 상한)
+  · 화자 교대: 앞 발화와 화자가 바뀌면 가산 (주고받는 대화)
+  · 아동 발화 가산
+  · 새로움: 위 점수 합에 곱함. 앞에서 이미 나온 단어일수록 낮아서 '콜콜' 같은 반복 추임새나
+    똑같이 되풀이된 발화는 키워드가 있어도 뒤로 밀림
+- 인지/정서/문제해결 장면은 남기고 반복 추임새를 빼서 프롬프트 토큰과 호출 비용을 줄임
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence
+
+from enhanced_analysis import POSITIVE_WORDS, NEGATIVE_WORDS, PROBLEM_SOLVING_WORDS, WORD_RE
+from prompt_chunker import estimate_tokens, LINE_OVERHEAD_TOKENS
+
+PROBLEM_WEIGHT = 2.0
+EMOTION_WEIGHT = 1.5
+QUESTION_WEIGHT = 1.0
+LENGTH_WEIGHT = 1.0
+ALTERNATION_WEIGHT = 0.5
+CHILD_WEIGHT = 0.5
+
+# 모든 단어가 이미 나온 발화에 남기는 점수 비율
+NOVELTY_FLOOR = 0.2
+
+# 길이 점수가 최대가 되는 음절 수
+FULL_LENGTH_SYLLABLES = 20
+
+HANGUL_RE = re.compile(r'[가-힣]')
+
+
+def _words_re(words: Sequence[str]):
+    return re.compile('|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True)))
+
+
+PROBLEM_RE = _words_re(PROBLEM_SOLVING_WORDS)
+EMOTION_RE = _words_re(POSITIVE_WORDS + NEGATIVE_WORDS)
+
+
+def score_utterances(dialogues: List[Dict[str, Any]]) -> List[float]:
+    """
+    발화별 정보량 점수 (새로움은 앞 발화들에 따라 달라지므로 시간 순으로 계산)
+
+    Args:
+        dialogues: [{'speaker_type', 'text'}, ...] (시간 순)
+    """
+    seen = Counter()
+    previous_speaker = None
+    scores = []
+
+    for d in dialogues:
+        text = d['text']
+        score = 0.0
+
+        if PROBLEM_RE.search(text):
+            score += PROBLEM_WEIGHT
+        if EMOTION_RE.search(text):
+            score += EMOTION_WEIGHT
+        if '?' in text:
+            score += QUESTION_WEIGHT
+
+        syllables = len(HANGUL_RE.findall(text))
+        score += LENGTH_WEIGHT * min(1.0, syllables / FULL_LENGTH_SYLLABLES)
+
+        if previous_speaker is not None and d['speaker_type'] != previous_speaker:
+            score += ALTERNATION_WEIGHT
+        if d['speaker_type'] == 'child':
+            score += CHILD_WEIGHT
+        previous_speaker = d['speaker_type']
+
+        # 새로움 (단어가 없는 짧은 발화는 발화 전체를 단어 하나로 취급)
+        words = WORD_RE.findall(text) or [text.strip()]
+        novelty = sum(1 / (1 + seen[w]) for w in words) / len(words)
+        seen.update(words)
+
+        scores.append(score * (NOVELTY_FLOOR + (1 - NOVELTY_FLOOR) * novelty))
+
+    return scores
+
+
+def select_salient(dialogues: List[Dict[str, Any]], budget: int,
+                   costs: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+    """
+    토큰 예산 안에서 점수가 높은 발화 선택
+
+    Args:
+        dialogues: 발화 리스트 (시간 순)
+        budget: 선택한 발화들의 토큰 합 상한
+        costs: 발화별 토큰 수 (기본: 프롬프트 한 줄 비용)
+
+    Returns:
+        선택된 발화 (원래 순서)
+    """
+    if costs is None:
+        costs = [estimate_tokens(d['text']) + LINE_OVERHEAD_TOKENS for d in dialogues]
+    scores = score_utterances(dialogues)
+
+    chosen = []
+    used = 0
+    for i in sorted(range(len(dialogues)), key=lambda i: (-scores[i], i)):
+        if used + costs[i] <= budget:
+            chosen.append(i)
+            used += costs[i]
+
+    return [dialogues[i] for i in sorted(chosen)]
+
+
+def sample_salient(dialogues: List[Dict[str, Any]], keep_ratio: float) -> List[Dict[str, Any]]:
+    """발화 토큰의 keep_ratio만큼만 남기기 (0 < keep_ratio <= 1)"""
+    if not 0 < keep_ratio <= 1:
+        raise ValueError("keep_ratio는 0보다 크고 1 이하여야 합니다")
+    costs = [estimate_tokens(d['text']) + LINE_OVERHEAD_TOKENS for d in dialogues]
+    return select_salient(dialogues, int(sum(costs) * keep_ratio), costs)
@@ -0,0 +1,253 @@
+"""
+JSON 스키마 검증기 (draft-07 일부)
+- 스키마를 검사 함수 트리로 한 번 컴파일해 두고 문서마다 호출만 함
+  (문서마다 스키마 dict를 다시 해석하지 않음)
+- 지원 키워드: type, enum, const, required, properties, additionalProperties,
+  items, minItems, maxItems, minimum, maximum, minLength, maxLength, pattern, format(date)
+- 그 밖의 키워드(description, title 등)는 draft-07과 같이 무시
+
+Usage: python schema_validator.py <schema.json> <document.json> [<document.json> ...]
+"""
+
+import re
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+DATE_RE = re.compile(r'^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$')
+
+_TYPE_CHECKS = {
+    'object': lambda v: isinstance(v, dict),
+    'array': lambda v: isinstance(v, list),
+    'string': lambda v: isinstance(v, str),
+    'boolean': lambda v: isinstance(v, bool),
+    'null': lambda v: v is None,
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    'integer': lambda v: (isinstance(v, int) and not isinstance(v, bool))
+                         or (isinstance(v, float) and v.is_integer()),
+}
+
+# 검사 함수: (값, 경로, 오류 목록) → None
+# 경로는 (상위 경로, 키) 튜플 체인으로 넘기고 오류가 났을 때만 문자열로 만듦
+Check = Callable[[Any, Any, List[str]], None]
+
+
+def _format_path(path) -> str:
+    """경로 튜플 체인 → '$.a.b[0]'"""
+    parts = []
+    while path is not None:
+        path, key = path
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return '$' + ''.join(reversed(parts))
+
+
+class SchemaValidationError(ValueError):
+    """문서가 스키마에 맞지 않을 때 (errors: 경로별 오류 메시지 목록)"""
+
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        super().__init__(f"스키마 검증 실패 ({len(errors)}건): " + '; '.join(errors[:5]))
+
+
+def _compile(schema: Dict[str, Any]) -> Check:
+    """스키마 하나를 검사 함수로 컴파일 (하위 스키마는 재귀적으로 미리 컴파일)"""
+    checks = []
+
+    if 'type' in schema:
+        types = schema['type'] if isinstance(schema['type'], list) else [schema['type']]
+        type_fns = [_TYPE_CHECKS[t] for t in types]
+        expected = '/'.join(types)
+
+        if len(type_fns) == 1:
+            is_type = type_fns[0]
+        else:
+            def is_type(value):
+                return any(fn(value) for fn in type_fns)
+
+        def check_type(value, path, errors):
+            if not is_type(value):
+                errors.append(f"{_format_path(path)}: {expected} 타입이어야 함 (실제: {type(value).__name__})")
+        checks.append(check_type)
+
+    if 'enum' in schema:
+        allowed = schema['enum']
+
+        def check_enum(value, path, errors):
+            if value not in allowed:
+                errors.append(f"{_format_path(path)}: {allowed} 중 하나여야 함 (실제: {value!r})")
+        checks.append(check_enum)
+
+    if 'const' in schema:
+        const = schema['const']
+
+        def check_const(value, path, errors):
+            if value != const:
+                errors.append(f"{_format_path(path)}: {const!r} 이어야 함 (실제: {value!r})")
+        checks.append(check_const)
+
+    # object
+    required = schema.get('required', [])
+    properties = {name: _compile(sub) for name, sub in schema.get('properties', {}).items()}
+    additional = schema.get('additionalProperties', True)
+    additional_check = _compile(additional) if isinstance(additional, dict) else None
+
+    if required or properties or additional is not True:
+        def check_object(value, path, errors):
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    errors.append(f"{_format_path(path)}: 필수 항목 '{name}' 없음")
+            for name, item in value.items():
+                sub = properties.get(name)
+                if sub is not None:
+                    sub(item, (path, name), errors)
+                elif additional is False:
+                    errors.append(f"{_format_path(path)}: 허용되지 않은 항목 '{name}'")
+                elif additional_check is not None:
+                    additional_check(item, (path, name), errors)
+        checks.append(check_object)
+
+    # array
+    items = _compile(schema['items']) if isinstance(schema.get('items'), dict) else None
+    min_items = schema.get('minItems')
+    max_items = schema.get('maxItems')
+
+    if items is not None or min_items is not None or max_items is not None:
+        def check_array(value, path, errors):
+            if not isinstance(value, list):
+                return
+            if min_items is not None and len(value) < min_items:
+                errors.append(f"{_format_path(path)}: 항목이 {min_items}개 이상이어야 함 (실제: {len(value)}개)")
+            if max_items is not None and len(value) > max_items:
+                errors.append(f"{_format_path(path)}: 항목이 {max_items}개 이하여야 함 (실제: {len(value)}개)")
+            if items is not None:
+                for index, item in enumerate(value):
+                    items(item, (path, index), errors)
+        checks.append(check_array)
+
+    # number
+    minimum = schema.get('minimum')
+    maximum = schema.get('maximum')
+
+    if minimum is not None or maximum is not None:
+        def check_range(value, path, errors):
+            if not _TYPE_CHECKS['number'](value):
+                return
+            if minimum is not None and value < minimum:
+                errors.append(f"{_format_path(path)}: {minimum} 이상이어야 함 (실제: {value})")
+            if maximum is not None and value > maximum:
+                errors.append(f"{_format_path(path)}: {maximum} 이하여야 함 (실제: {value})")
+        checks.append(check_range)
+
+    # string
+    min_length = schema.get('minLength')
+    max_length = schema.get('maxLength')
+    pattern = re.compile(schema['pattern']) if 'pattern' in schema else None
+    date_format = schema.get('format') == 'date'
+
+    if min_length is not None or max_length is not None or pattern is not None or date_format:
+        def check_string(value, path, errors):
+            if not isinstance(value, str):
+                return
+            if min_length is not None and len(value) < min_length:
+                errors.append(f"{_format_path(path)}: {min_length}자 이상이어야 함")
+            if max_length is not None and len(value) > max_length:
+                errors.append(f"{_format_path(path)}: {max_length}자 이하여야 함")
+            if pattern is not None and not pattern.search(value):
+                errors.append(f"{_format_path(path)}: 패턴 {pattern.pattern} 불일치")
+            if date_format and not DATE_RE.match(value):
+                errors.append(f"{_format_path(path)}: YYYY-MM-DD 날짜 형식이어야 함 (실제: {value!r})")
+        checks.append(check_string)
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value, path, errors):
+        for check in checks:
+            check(value, path, errors)
+    return check_all
+
+
+class SchemaValidator:
+    """컴파일된 스키마 검증기"""
+
+    def __init__(self, schema: Dict[str, Any]):
+        """
+        Args:
+            schema: JSON 스키마 (dict)
+        """
+        self.schema = schema
+        self.title = schema.get('title', '')
+        self._check = _compile(schema)
+
+    def errors(self, instance: Any) -> List[str]:
+        """스키마 위반 목록 (맞으면 빈 목록)"""
+        errors = []
+        self._check(instance, None, errors)
+        return errors
+
+    def is_valid(self, instance: Any) -> bool:
+        """스키마에 맞는지 여부"""
+        return not self.errors(instance)
+
+    def validate(self, instance: Any):
+        """스키마에 맞지 않으면 SchemaValidationError"""
+        errors = self.errors(instance)
+        if errors:
+            raise SchemaValidationError(errors)
+
+
+_validators: Dict[str, SchemaValidator] = {}
+
+
+def load_validator(schema_path) -> SchemaValidator:
+    """
+    스키마 파일의 검증기 (프로세스당 파일별 1회 컴파일)
+
+    Args:
+        schema_path: JSON 스키마 파일 경로
+    """
+    key = str(Path(schema_path).resolve())
+    validator = _validators.get(key)
+    if validator is None:
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            validator = SchemaValidator(json.load(f))
+        _validators[key] = validator
+    return validator
+
+
+def main():
+    import sys
+    import time
+
+    if len(sys.argv) < 3:
+        print("Usage: python schema_validator.py <schema.json> <document.json> [<document.json> ...]")
+        sys.exit(1)
+
+    validator = load_validator(sys.argv[1])
+    failed = 0
+    start = time.perf_counter()
+
+    for doc_path in sys.argv[2:]:
+        try:
+            with open(doc_path, 'r', encoding='utf-8') as f:
+                errors = validator.errors(json.load(f))
+        except json.JSONDecodeError as e:
+            errors = [f"JSON 파싱 실패: {e}"]
+
+        if errors:
+            failed += 1
+            print(f"❌ {doc_path}")
+            for error in errors:
+                print(f"   - {error}")
+        else:
+            print(f"✅ {doc_path}")
+
+    elapsed = time.perf_counter() - start
+    print(f"\n📊 {len(sys.argv) - 2}개 중 {failed}개 실패 ({elapsed * 1000:.1f}ms)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
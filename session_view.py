@@ -0,0 +1,158 @@
+"""
+세션 파생 지표 뷰
+- 분석 결과(JSON)에서 레포트들이 공통으로 쓰는 값(분 단위 시간, 주제 목록,
+  정렬된 topic_distribution, 참여도/정서 등급 등)을 세션당 한 번만 계산
+- SessionView: enhanced_analysis 형식 (report_generator.py)
+- DetailedSessionView: analyze_metrics 상세 형식 (generate_reports_v2.py)
+"""
+
+from datetime import datetime
+from typing import Dict, Any, List
+
+
+def format_date(date_str: str) -> str:
+    """날짜 포맷팅 (20251017 -> 2025년 10월 17일)"""
+    if len(date_str) == 8:
+        year = date_str[:4]
+        month = date_str[4:6]
+        day = date_str[6:8]
+        return f"{year}년 {int(month)}월 {int(day)}일"
+    return date_str
+
+
+def grade(value, levels: List, default):
+    """
+    구간 등급 판정
+
+    Args:
+        value: 지표 값
+        levels: (하한, 등급) 목록 (하한 내림차순). value >= 하한인 첫 등급 반환
+        default: 어느 하한에도 못 미칠 때의 등급
+    """
+    for threshold, level in levels:
+        if value >= threshold:
+            return level
+    return default
+
+
+class SessionView:
+    """
+    enhanced 분석 결과의 파생 지표 (세션당 1회 계산)
+
+    부모용/선생님용/방문일지/회사용 레포트가 모두 이 객체의 속성을 읽으므로
+    정렬·조회·등급 판정이 레포트 수만큼 반복되지 않는다.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Args:
+            data: enhanced_analysis.py 분석 결과 (metadata, metrics, timestamp)
+        """
+        self.data = data
+        self.metadata = data['metadata']
+        self.metrics = m = data['metrics']
+
+        # 원본에 없는(None) 지표와 추정한(estimated) 지표는 None: 레포트는 등급 없이 '측정 불가'로 표시
+        estimated = set(m.get('estimated', []))
+
+        def measured(name):
+            return None if name in estimated else m.get(name)
+
+        # 기본 정보
+        self.child_name = self.metadata['child']
+        self.child_age = self.metadata['age']
+        self.teacher_name = self.metadata['teacher']
+        self.date = format_date(self.metadata['date'])
+        self.minutes = int(m['total_session_duration'] // 60)
+
+        # 발화
+        self.child_ratio = m['child_utterance_ratio']
+        self.child_count = m['child_utterance_count']
+        self.avg_words = measured('child_avg_words_per_utterance')
+        self.child_words = measured('child_word_count')
+        self.teacher_words = measured('teacher_word_count')
+        self.child_speaking = measured('child_speaking_duration')
+        self.teacher_speaking = measured('teacher_speaking_duration')
+        self.speaking_ratio = measured('child_speaking_ratio')
+
+        # 문제해결
+        problem_solving = m.get('problem_solving_utterances', {})
+        self.ps_count = problem_solving.get('child_count', 0)
+        self.ps_teacher = problem_solving.get('teacher_count')
+        self.examples = problem_solving.get('child_examples', [])
+
+        # 정서
+        self.positive = m['positive_utterances']
+        self.negative = m['negative_utterances']
+        self.ratio = m['positive_negative_ratio']
+        emotion_kw = m.get('emotion_keywords', {})
+        self.positive_words = emotion_kw.get('positive', [])
+        self.negative_words = emotion_kw.get('negative', [])
+
+        # 주제 및 맥락 전환
+        self.persistence = measured('topic_persistence')
+        self.main_topics = m.get('main_topics', [])
+        self.top_topic = self.main_topics[0][0] if self.main_topics else None
+        context_switches = m.get('context_switches', {})
+        self.total_switches = context_switches.get('total_switches', 0)
+        self.switches_per_min = context_switches.get('switches_per_minute', 0)
+        self.topic_dist = context_switches.get('topic_distribution', {})
+        self.sorted_topics = sorted(self.topic_dist.items(), key=lambda x: -x[1])
+        total_topics = sum(self.topic_dist.values())
+        self.play_areas = [
+            (topic, count / total_topics * 100) for topic, count in self.sorted_topics
+        ]
+        self.segments = m.get('time_segments', [])
+
+        # 대화 발췌 (enhanced 분석에만 있음)
+        self.dialogue_samples = m.get('dialogue_samples', [])
+        self.core_episodes = m.get('core_episodes', [])
+        self.notable_utterances = m.get('notable_child_utterances', [])
+
+        # ai_response/ 구간별 AI 분석 (enhanced 분석에 ai_response/가 있을 때만)
+        self.ai_annotations = m.get('ai_annotations', [])
+
+        # 공통 등급
+        self.participation = grade(self.child_ratio, [(0.5, 'high'), (0.35, 'balanced')], 'low')
+        self.curiosity = grade(self.ps_count, [(50, 'high'), (20, 'mid')], 'low')
+        self.persist_level = None if self.persistence is None else \
+            grade(self.persistence, [(3.0, 'high'), (2.0, 'mid')], 'normal')
+        self.eq_level = grade(self.ratio, [(1.5, 'high'), (0.7, 'mid')], 'low')
+        if self.positive > self.negative * 1.5:
+            self.mood = 'bright'
+        elif self.positive > self.negative * 0.7:
+            self.mood = 'stable'
+        else:
+            self.mood = 'frank'
+
+        # 작성 시각 (한 세션의 레포트는 같은 시각으로 기록)
+        now = datetime.now()
+        self.today = now.strftime('%Y년 %m월 %d일')
+        self.now = now.strftime('%Y-%m-%d %H:%M:%S')
+
+
+class DetailedSessionView:
+    """analyze_metrics 상세 분석 결과의 파생 지표 (세션당 1회 계산)"""
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Args:
+            data: analyze_metrics.py 분석 결과 (session_info, speech_ratio, ...)
+        """
+        self.data = data
+        self.session_info = info = data.get('session_info', {})
+
+        self.child_name = info.get('child_name', '아이')
+        self.age = info.get('age', '')
+        self.teacher_name = info.get('teacher_name', '')
+        date_str = info.get('date', '')
+        self.date = f"{date_str[:4]}년 {date_str[4:6]}월 {date_str[6:8]}일" if len(date_str) == 8 else date_str
+
+        self.speech_ratio = data['speech_ratio']['child_utterance_ratio']
+        self.utterance_count = data['utterance_volume']['child_total_utterances']
+        self.ps_ratio = data['problem_solving']['problem_solving_ratio']
+        self.sentiment_score = data['sentiment']['sentiment_score']
+        self.consistency_score = data['topic_consistency']['topic_consistency_score']
+        self.switch_rate = data['context_switches']['switch_rate']
+        self.play_types = data['main_topics']['detected_play_types']
+        self.top_keywords = data['main_topics']['top_keywords']
@@ -0,0 +1,78 @@
+"""
+세션 샤딩 유틸리티
+- `--shard i/N` 형식 파싱 (argparse type= 으로도 사용)
+- 세션 이름 해시 기반의 결정적 분할 (조정 서비스 없이 N대가 서로 겹치지 않게 처리)
+"""
+
+import hashlib
+import unicodedata
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+
+def parse_shard(spec: Optional[str]) -> Optional[Tuple[int, int]]:
+    """
+    샤드 지정 문자열 파싱
+
+    Args:
+        spec: "i/N" 형식 (i는 0부터 N-1까지). None이면 샤딩 없음
+
+    Returns:
+        (index, count) 튜플 또는 None
+    """
+    if spec is None:
+        return None
+
+    try:
+        index_str, count_str = spec.split('/')
+        index, count = int(index_str), int(count_str)
+    except ValueError:
+        raise ValueError(f"샤드 형식이 올바르지 않습니다: {spec!r} (예: 0/4)")
+
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"샤드 범위가 올바르지 않습니다: {spec!r} (0 <= i < N)")
+
+    return index, count
+
+
+def shard_arg(spec: str) -> Tuple[int, int]:
+    """argparse type= 용 parse_shard (잘못된 값은 트레이스백 대신 사용법과 함께 오류 출력)"""
+    import argparse
+
+    try:
+        return parse_shard(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def shard_of(session_name: str, count: int) -> int:
+    """
+    세션이 속하는 샤드 번호
+
+    파이썬 내장 hash()는 프로세스마다 값이 달라지므로 sha1을 사용합니다.
+    어느 머신에서 실행해도 같은 세션은 항상 같은 샤드에 배정됩니다.
+    한글 파일명은 macOS(NFD)와 Linux(NFC)에서 바이트가 다르므로 NFC로 맞춘 뒤 해시합니다.
+    """
+    normalized = unicodedata.normalize('NFC', session_name)
+    digest = hashlib.sha1(normalized.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count
+
+
+def select_shard(sessions: Iterable, shard: Optional[Tuple[int, int]], name=None) -> List:
+    """
+    현재 샤드에 해당하는 세션만 선택
+
+    Args:
+        sessions: 세션 목록 (경로 문자열 또는 Path)
+        shard: parse_shard() 결과. None이면 전체 반환
+        name: 세션에서 이름을 얻는 함수 (기본값: 경로의 마지막 요소)
+    """
+    sessions = list(sessions)
+    if shard is None:
+        return sessions
+
+    if name is None:
+        name = lambda s: Path(s).name
+
+    index, count = shard
+    return [s for s in sessions if shard_of(name(s), count) == index]
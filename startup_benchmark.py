@@ -0,0 +1,120 @@
+"""
+CLI 시작 시간 측정 및 예산 검사
+- CLI 모듈마다 새 파이썬 프로세스에서 import 시간을 여러 번 재고 중앙값을 예산과 비교
+- import 직후 무거운 모듈(numpy, pandas, multiprocessing 등)이 로드되어 있으면 실패
+  (무거운 모듈은 실제로 쓰는 코드 경로 안에서만 import)
+- 예산을 넘거나 무거운 모듈이 로드되면 종료 코드 1 (CI/잡 러너에서 회귀 감지용)
+
+Usage: python startup_benchmark.py [모듈...] [--repeat N] [--budget-ms MS]
+"""
+
+import sys
+import json
+import statistics
+import subprocess
+from pathlib import Path
+from typing import Dict, List
+
+BASE_DIR = Path(__file__).parent
+
+# 잡 러너/사용자가 직접 실행하는 CLI 모듈
+CLI_MODULES = [
+    'run_full_analysis',
+    'enhanced_analysis',
+    'combined_analysis',
+    'run_analysis_pipeline',
+    'batch_analyze',
+    'report_generator',
+    'generate_reports_v2',
+    'render_farm',
+    'html_report',
+    'schema_validator',
+]
+
+# CLI 시작 시 로드되면 안 되는 모듈
+HEAVY_MODULES = [
+    'numpy',
+    'pandas',
+    'multiprocessing',
+    'concurrent.futures.process',
+    'sqlite3',
+]
+
+DEFAULT_BUDGET_MS = 60.0
+
+_PROBE = (
+    "import sys, time, json\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = (time.perf_counter() - start) * 1000\n"
+    "print(json.dumps({{'ms': elapsed, 'heavy': [m for m in {heavy!r} if m in sys.modules]}}))\n"
+)
+
+
+def measure_import(module: str, repeat: int = 5) -> Dict:
+    """
+    새 프로세스에서 모듈 import 시간 측정
+
+    Returns:
+        {'ms': 중앙값(ms), 'runs': [ms...], 'heavy': 로드된 무거운 모듈}
+    """
+    probe = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    runs, heavy = [], []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', probe], cwd=BASE_DIR,
+                             capture_output=True, text=True)
+        if out.returncode != 0:
+            error = out.stderr.strip().splitlines()[-1] if out.stderr.strip() else 'import 실패'
+            return {'ms': None, 'runs': [], 'heavy': [], 'error': error}
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        runs.append(result['ms'])
+        heavy = result['heavy']
+    return {'ms': statistics.median(runs), 'runs': runs, 'heavy': heavy}
+
+
+def check_startup(modules: List[str], repeat: int = 5, budget_ms: float = DEFAULT_BUDGET_MS) -> bool:
+    """
+    모듈별 시작 시간 표 출력 후 예산 검사
+
+    Returns:
+        모두 예산 안이고 무거운 모듈이 로드되지 않았으면 True
+    """
+    ok = True
+    print(f"{'모듈':28s}{'import(ms)':>12s}  결과")
+    print('-' * 60)
+
+    for module in modules:
+        result = measure_import(module, repeat)
+        if result['ms'] is None:
+            ok = False
+            print(f"{module:28s}{'-':>12s}  ❌ {result['error']}")
+            continue
+
+        problems = []
+        if result['ms'] > budget_ms:
+            problems.append(f"예산 {budget_ms:.0f}ms 초과")
+        if result['heavy']:
+            problems.append(f"무거운 모듈 로드: {', '.join(result['heavy'])}")
+        ok = ok and not problems
+        status = '❌ ' + ', '.join(problems) if problems else '✅'
+        print(f"{module:28s}{result['ms']:12.1f}  {status}")
+
+    return ok
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='CLI 시작 시간 측정 및 예산 검사')
+    parser.add_argument('modules', nargs='*', default=CLI_MODULES, help='검사할 모듈 (기본: 전체 CLI)')
+    parser.add_argument('--repeat', type=int, default=5, help='모듈별 측정 횟수 (중앙값 사용)')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help='모듈별 import 시간 예산 (ms)')
+    args = parser.parse_args()
+
+    ok = check_startup(args.modules, args.repeat, args.budget_ms)
+    print(f"\n{'✅ 시작 시간 예산 통과' if ok else '❌ 시작 시간 예산 위반'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,302 @@
+"""
+계층적 요약 파이프라인 (청크 → 세션 → 아동 성장 기록)
+- map    : 세션의 토큰 예산 청크를 동시에 요약 (ContextualDialogueAnalyzer.run_chunk_analysis)
+- reduce : 요약을 fan_in개씩 묶어 통합 요약을 만드는 트리 리듀스 (같은 단계의 묶음은 동시에 실행)
+- history: 한 아동(선생님 + 아동 이름)의 여러 세션 요약을 날짜 순으로 같은 트리 리듀스로 통합
+  (세션마다 다른 나이는 프롬프트 머리말이 아닌 세션 라벨에 넣어, 생일이 지나도 이전 묶음 캐시 유지)
+- 모든 호출은 응답 캐시(prompt_cache)를 거침 → 묶음 경계가 왼쪽부터 고정되어 있어서
+  세션 하나를 추가하면 새 세션의 map/reduce + 성장 기록 트리의 오른쪽 경로(log 깊이)만 호출
+- call_log를 주면 모든 호출 기록을 세션/단계별로 모아 실행 리포트로 저장 (call_metrics)
+
+Usage: python summary_pipeline.py <세션 경로...> [--url URL | --stub] [--fan-in N] [--output-dir DIR]
+       [--report FILE]
+"""
+
+import os
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from contextual_analysis import ContextualDialogueAnalyzer
+from chunk_executor import run_cached
+from call_metrics import call_record
+from prompt_chunker import DEFAULT_MAX_TOKENS, DEFAULT_OVERLAP_TOKENS
+
+DEFAULT_FAN_IN = 4
+
+
+def build_reduce_prompt(kind: str, items: List[Dict[str, str]], metadata: Dict[str, str]) -> str:
+    """
+    통합 요약 프롬프트
+
+    Args:
+        kind: 'session' (구간 요약 → 세션 요약) 또는 'history' (세션 요약 → 성장 기록)
+        items: [{'label': 구간/세션 이름, 'text': 요약}, ...] (시간 순)
+        metadata: teacher, child, age ('history'는 child만 사용, 나이는 세션 라벨에 있음)
+    """
+    summaries = '\n'.join(f"[{item['label']}] {item['text']}" for item in items)
+
+    if kind == 'session':
+        return f"""다음은 {metadata['teacher']} 선생님과 {metadata['child']} 아동({metadata['age']})의
+놀이 세션을 구간별로 요약한 내용입니다.
+
+# 구간 요약
+{summaries}
+
+# 통합 요약 요청
+위 구간 요약들을 시간 순서대로 하나의 요약으로 통합해주세요:
+
+1. **전체 놀이 흐름**: 어떤 놀이가 어떤 순서로 이어졌나요?
+2. **반복된 상호작용 패턴**: 여러 구간에 걸쳐 나타난 모습
+3. **발달 영역별 핵심 장면**: 언어, 인지, 사회정서
+4. **인상적인 순간**: 부모와 공유할 장면 1-2개
+
+간결하게 요약해주세요 (300자 이내).
+"""
+
+    return f"""다음은 {metadata['child']} 아동의 놀이 세션 요약입니다 (날짜 순, 괄호는 당시 나이).
+
+# 세션 요약
+{summaries}
+
+# 성장 기록 요약 요청
+위 세션 요약들을 하나의 성장 기록으로 통합해주세요:
+
+1. **달라진 점**: 세션을 거치며 변화한 언어, 인지, 사회정서 모습
+2. **꾸준한 관심사와 강점**: 여러 세션에 공통으로 나타난 모습
+3. **다음 세션에서 살펴볼 점**: 1-2개
+
+간결하게 요약해주세요 (400자 이내).
+"""
+
+
+def child_key(metadata: Dict[str, str]) -> Tuple[str, str]:
+    """성장 기록을 묶는 단위 (선생님, 아동 이름)"""
+    return metadata['teacher'], metadata['child']
+
+
+class SummaryPipeline:
+    """청크 → 세션 → 성장 기록 요약"""
+
+    def __init__(self, executor, cache=None, fan_in: int = DEFAULT_FAN_IN,
+                 max_tokens: int = DEFAULT_MAX_TOKENS, overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+                 keep_ratio: Optional[float] = None, call_log=None):
+        """
+        Args:
+            executor: chunk_executor.ChunkExecutor
+            cache: prompt_cache.PromptCache (중간 결과 재사용)
+            fan_in: 통합 요약 하나에 묶는 요약 수 (2 이상)
+            max_tokens: 청크 프롬프트 토큰 예산
+            overlap_tokens: 청크 사이에 겹치는 토큰 수
+            keep_ratio: 구간별로 남길 발화 토큰 비율 (salience, None이면 모든 발화)
+            call_log: call_metrics.CallLog (호출 기록을 실행 리포트로 모을 때)
+        """
+        if fan_in < 2:
+            raise ValueError("fan_in은 2 이상이어야 합니다")
+        self.executor = executor
+        self.cache = cache
+        self.fan_in = fan_in
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.keep_ratio = keep_ratio
+        self.call_log = call_log
+
+    def tree_reduce(self, kind: str, items: List[Dict[str, str]],
+                    metadata: Dict[str, str], log_group: Optional[str] = None) -> Dict[str, Any]:
+        """
+        요약들을 fan_in개씩 묶어 하나가 될 때까지 통합
+
+        Args:
+            log_group: 호출 기록을 남길 이름 (세션 또는 아동, call_log가 있을 때)
+
+        Returns:
+            {'status', 'summary', 'levels': 단계별 [{'label', 'text', 'cached'}], 'error'}
+        """
+        if not items:
+            return {'status': 'error', 'error': '통합할 요약이 없습니다', 'levels': []}
+
+        levels = []
+        while len(items) > 1:
+            groups = [items[i:i + self.fan_in] for i in range(0, len(items), self.fan_in)]
+            # 마지막에 하나만 남은 묶음은 호출 없이 다음 단계로 올림
+            merge = [group for group in groups if len(group) > 1]
+            prompts = [build_reduce_prompt(kind, group, metadata) for group in merge]
+            results = run_cached(self.executor, prompts, self.cache)
+            if self.call_log is not None and log_group is not None:
+                self.call_log.add(log_group, f"{kind}_reduce", [call_record(r) for r in results])
+
+            failed = [r for r in results if r['status'] != 'success']
+            if failed:
+                return {'status': 'error', 'error': failed[0]['error'], 'levels': levels}
+
+            merged = iter(results)
+            items = []
+            for group in groups:
+                if len(group) == 1:
+                    items.append(group[0])
+                    continue
+                result = next(merged)
+                items.append({
+                    'label': f"{group[0]['label']} ~ {group[-1]['label']}",
+                    'text': result['text'],
+                    'cached': result['cached'],
+                })
+            levels.append(items)
+
+        return {'status': 'success', 'summary': items[0]['text'], 'levels': levels}
+
+    def summarize_session(self, session_path: str, output_dir: str = 'contextual_prompts') -> Dict[str, Any]:
+        """
+        세션 하나 요약 (청크 map → 트리 reduce) 후 <세션>_session_summary.json 저장
+
+        Returns:
+            {'session', 'metadata', 'status', 'summary', 'levels', 'chunk_count'}
+        """
+        analyzer = ContextualDialogueAnalyzer(session_path, self.cache, self.keep_ratio)
+        chunks = analyzer.run_chunk_analysis(self.executor, output_dir, self.max_tokens, self.overlap_tokens,
+                                             self.call_log)
+
+        failed = [c for c in chunks if c['status'] != 'success']
+        if failed:
+            reduced = {'status': 'error', 'levels': [],
+                       'error': f"청크 {len(failed)}개 분석 실패 - {failed[0]['error']}"}
+        else:
+            items = [{'label': c['time_range'], 'text': c['ai_summary']} for c in chunks]
+            reduced = self.tree_reduce('session', items, analyzer.metadata, analyzer.session_name)
+
+        analyzer.final_summary = {
+            'session': analyzer.session_name,
+            'metadata': analyzer.metadata,
+            'chunk_count': len(chunks),
+            **reduced,
+        }
+
+        summary_file = os.path.join(output_dir, f"{analyzer.session_name}_session_summary.json")
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(analyzer.final_summary, f, ensure_ascii=False, indent=2)
+
+        if reduced['status'] == 'success':
+            print(f"📝 세션 요약 완료: {analyzer.session_name} (reduce {len(reduced['levels'])}단계)")
+        else:
+            print(f"❌ 세션 요약 실패: {analyzer.session_name} - {reduced['error']}")
+
+        return analyzer.final_summary
+
+    def summarize_child(self, session_summaries: List[Dict[str, Any]],
+                        output_dir: str = 'contextual_prompts') -> Optional[Dict[str, Any]]:
+        """
+        한 아동의 세션 요약들을 날짜 순으로 통합해 <선생님>교사-<아동>_history_summary.json 저장
+
+        Args:
+            session_summaries: summarize_session 결과 (같은 선생님/아동)
+
+        Returns:
+            성장 기록 요약 (요약된 세션이 없으면 None)
+        """
+        done = sorted((s for s in session_summaries if s['status'] == 'success'),
+                      key=lambda s: (s['metadata']['date'], s['session']))
+        if not done:
+            return None
+
+        teacher, child = child_key(done[0]['metadata'])
+        name = f"{teacher}교사-{child}"
+        items = [{'label': f"{s['metadata']['date']} ({s['metadata']['age']})", 'text': s['summary']}
+                 for s in done]
+        reduced = self.tree_reduce('history', items, {'child': child}, name)
+
+        history = {
+            'teacher': teacher,
+            'child': child,
+            'sessions': [s['session'] for s in done],
+            **reduced,
+        }
+
+        history_file = os.path.join(output_dir, f"{name}_history_summary.json")
+        with open(history_file, 'w', encoding='utf-8') as f:
+            json.dump(history, f, ensure_ascii=False, indent=2)
+
+        print(f"📚 성장 기록 요약: {name} (세션 {len(done)}개) → {history_file}")
+        return history
+
+    def run(self, session_paths: List[str], output_dir: str = 'contextual_prompts') -> Dict[str, Any]:
+        """
+        세션별 요약 후 아동별 성장 기록 요약
+
+        Returns:
+            {'sessions': [세션 요약...], 'children': {'<선생님>교사-<아동>': 성장 기록}}
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        sessions = [self.summarize_session(path, output_dir) for path in session_paths]
+
+        # 이름이 같은 다른 아동이 섞이지 않도록 (선생님, 아동) 단위로 묶음
+        by_child = {}
+        for summary in sessions:
+            by_child.setdefault(child_key(summary['metadata']), []).append(summary)
+
+        children = {}
+        for (teacher, child), summaries in by_child.items():
+            history = self.summarize_child(summaries, output_dir)
+            if history is not None:
+                children[f"{teacher}교사-{child}"] = history
+
+        return {'sessions': sessions, 'children': children}
+
+
+def main():
+    import argparse
+    from chunk_executor import (
+        ChunkExecutor, HTTPBackend, StubServer,
+        DEFAULT_CONCURRENCY, DEFAULT_RATE, DEFAULT_TIMEOUT, DEFAULT_RETRIES,
+    )
+    from prompt_cache import PromptCache, DEFAULT_CACHE_DIR
+    from call_metrics import CallLog, format_summary
+
+    parser = argparse.ArgumentParser(description='계층적 요약 (청크 → 세션 → 성장 기록)')
+    parser.add_argument('sessions', nargs='+', help='세션 폴더 (vtt/ 포함)')
+    parser.add_argument('--url', help='분석 백엔드 URL')
+    parser.add_argument('--stub', action='store_true', help='로컬 스텁 서버를 백엔드로 사용')
+    parser.add_argument('--output-dir', default='contextual_prompts', help='결과 저장 폴더')
+    parser.add_argument('--fan-in', type=int, default=DEFAULT_FAN_IN, help='통합 요약 하나에 묶는 요약 수')
+    parser.add_argument('--max-tokens', type=int, default=DEFAULT_MAX_TOKENS, help='청크 프롬프트 토큰 예산')
+    parser.add_argument('--keep-ratio', type=float, help='구간별로 남길 핵심 발화 토큰 비율 (예: 0.5)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='동시 호출 수')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='초당 호출 수 상한')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='호출 1회 타임아웃 (초)')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES, help='재시도 횟수')
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help='프롬프트/응답 캐시 폴더')
+    parser.add_argument('--no-cache', action='store_true', help='캐시 없이 모두 호출')
+    parser.add_argument('--report', help='호출 지연/비용 실행 리포트 JSON 경로')
+    parser.add_argument('--input-price', type=float, help='입력 토큰 100만 개당 가격 (예상 비용 계산)')
+    parser.add_argument('--output-price', type=float, help='출력 토큰 100만 개당 가격')
+    args = parser.parse_args()
+
+    if not args.url and not args.stub:
+        parser.error('--url 또는 --stub 중 하나가 필요합니다')
+
+    cache = None if args.no_cache else PromptCache(args.cache_dir)
+
+    def run(url):
+        executor = ChunkExecutor(HTTPBackend(url, args.timeout), args.concurrency, args.rate,
+                                 timeout=args.timeout, retries=args.retries)
+        call_log = CallLog(executor, args.input_price, args.output_price)
+        pipeline = SummaryPipeline(executor, cache, args.fan_in, args.max_tokens,
+                                   keep_ratio=args.keep_ratio, call_log=call_log)
+        result = pipeline.run(args.sessions, args.output_dir)
+        report = call_log.save(args.report) if args.report else call_log.report()
+        print(f"\n⏱️  전체: {format_summary(report['total'])}")
+        if args.report:
+            print(f"📁 실행 리포트: {args.report}")
+        return result
+
+    if args.stub:
+        with StubServer() as stub:
+            result = run(stub.url)
+    else:
+        result = run(args.url)
+
+    ok = sum(1 for s in result['sessions'] if s['status'] == 'success')
+    print(f"\n✅ 세션 요약 {ok}/{len(result['sessions'])}개, 성장 기록 {len(result['children'])}개")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,276 @@
+"""
+레포트 텍스트 템플릿 엔진
+- templates/*.tmpl 파일을 파이썬 렌더 함수로 컴파일 (프로세스당 한 번, 캐시)
+- 연속된 텍스트 줄은 하나의 f-string으로 합쳐 렌더링 비용 최소화
+
+문법:
+    % args a, b, c          렌더 함수가 받는 이름 (첫 번째 제어 줄)
+    % if 조건: / % elif 조건: / % else: / % endif
+    % for x in 목록: / % endfor
+    %# 주석                  출력되지 않음
+    {식} {식:포맷} {식!r}    파이썬 식 삽입 (f-string과 동일한 포맷 규칙)
+    {{ }}                   중괄호 문자 그대로
+    %%                      줄 맨 앞의 % 문자 그대로
+
+각 텍스트 줄은 줄바꿈과 함께 그대로 출력됩니다 (앞뒤 공백 유지).
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
+
+_OPENERS = {'(': ')', '[': ']', '{': '}'}
+
+
+class TemplateError(Exception):
+    """템플릿 문법 오류"""
+
+    def __init__(self, name: str, line_no: int, message: str):
+        super().__init__(f"{name}:{line_no}: {message}")
+
+
+def _split_field(field: str) -> Tuple[str, str, str]:
+    """
+    '{...}' 내부를 (식, 변환, 포맷)으로 분리
+
+    괄호/문자열 안의 ':' 와 '!' 는 무시합니다 (f-string 규칙과 동일).
+    """
+    depth = 0
+    quote = None
+    i = 0
+    while i < len(field):
+        ch = field[i]
+        if quote:
+            if ch == '\\':
+                i += 1
+            elif field.startswith(quote, i):
+                i += len(quote) - 1
+                quote = None
+        elif ch in '\'"':
+            quote = field[i:i + 3] if field[i:i + 3] in ("'''", '"""') else ch
+            i += len(quote) - 1
+        elif ch in _OPENERS:
+            depth += 1
+        elif ch in ')]}':
+            depth -= 1
+        elif depth == 0 and ch == '!' and field[i + 1:i + 2] in ('r', 's', 'a') \
+                and field[i + 2:i + 3] in ('', ':'):
+            spec = field[i + 3:]
+            return field[:i], field[i + 1], spec[1:] if spec else ''
+        elif depth == 0 and ch == ':':
+            return field[:i], '', field[i + 1:]
+        i += 1
+    return field, '', ''
+
+
+def _parse_line(line: str, name: str, line_no: int) -> List[Tuple[str, ...]]:
+    """
+    텍스트 한 줄을 조각 목록으로 분리
+
+    Returns:
+        ('text', 문자열) 또는 ('expr', 식, 변환, 포맷) 튜플 목록
+    """
+    parts = []
+    text = []
+    i = 0
+    while i < len(line):
+        ch = line[i]
+        if line.startswith('{{', i) or line.startswith('}}', i):
+            text.append(ch)
+            i += 2
+        elif ch == '{':
+            # 짝이 맞는 '}' 찾기 (식 안의 괄호/문자열 고려)
+            depth = 0
+            quote = None
+            j = i + 1
+            while j < len(line):
+                c = line[j]
+                if quote:
+                    if c == '\\':
+                        j += 1
+                    elif c == quote:
+                        quote = None
+                elif c in '\'"':
+                    quote = c
+                elif c in _OPENERS:
+                    depth += 1
+                elif c in ')]}':
+                    if depth == 0:
+                        break
+                    depth -= 1
+                j += 1
+            else:
+                raise TemplateError(name, line_no, "닫히지 않은 '{'")
+
+            expr, conversion, spec = _split_field(line[i + 1:j])
+            expr = expr.strip()
+            if not expr:
+                raise TemplateError(name, line_no, "빈 식 '{}'")
+            if text:
+                parts.append(('text', ''.join(text)))
+                text = []
+            parts.append(('expr', expr, conversion, spec))
+            i = j + 1
+        elif ch == '}':
+            raise TemplateError(name, line_no, "짝이 없는 '}' (문자 그대로는 '}}')")
+        else:
+            text.append(ch)
+            i += 1
+    if text:
+        parts.append(('text', ''.join(text)))
+    return parts
+
+
+def _fstring(parts: List[Tuple[str, ...]], emit: Callable[[str], None]) -> str:
+    """
+    조각 목록을 f-string 소스 하나로 변환
+
+    따옴표/역슬래시가 들어간 식은 f-string 안에 둘 수 없으므로 임시 변수로 먼저 계산합니다.
+    """
+    source = []
+    temp = 0
+    for part in parts:
+        if part[0] == 'text':
+            source.append(part[1].replace('{', '{{').replace('}', '}}'))
+            continue
+
+        _, expr, conversion, spec = part
+        if any(c in expr for c in '\'"\\#{}'):
+            emit(f"_v{temp} = ({expr})")
+            expr = f"_v{temp}"
+            temp += 1
+        field = f"({expr})" if expr.startswith('{') or ':' in expr or '!' in expr else expr
+        if conversion:
+            field += '!' + conversion
+        if spec:
+            field += ':' + spec
+        source.append('{' + field + '}')
+    return 'f' + repr(''.join(source))
+
+
+def compile_template(source: str, name: str = '<template>') -> Callable[..., str]:
+    """
+    템플릿 소스를 렌더 함수로 컴파일
+
+    Args:
+        source: 템플릿 텍스트
+        name: 오류 메시지에 표시할 템플릿 이름
+
+    Returns:
+        키워드 인자(% args에 선언된 이름)를 받아 문자열을 반환하는 함수
+    """
+    params = None
+    code = []
+    stack = []  # (종류, 줄 번호)
+    indent = 1
+    block_empty = False
+    pending = []
+
+    def emit(statement):
+        code.append('    ' * indent + statement)
+
+    def flush_text():
+        nonlocal block_empty
+        if not pending:
+            return
+        parts = []
+        for line_parts in pending:
+            parts.extend(line_parts)
+            parts.append(('text', '\n'))
+        emit(f"_a({_fstring(parts, emit)})")
+        pending.clear()
+        block_empty = False
+
+    for line_no, line in enumerate(source.splitlines(), 1):
+        stripped = line.lstrip()
+
+        if stripped.startswith('%%'):
+            line = line.replace('%%', '%', 1)
+        elif stripped.startswith('%'):
+            directive = stripped[1:].strip()
+            keyword = directive.split(None, 1)[0].rstrip(':') if directive else ''
+
+            if keyword.startswith('#'):
+                continue
+
+            flush_text()
+
+            if keyword == 'args':
+                if params is not None or code:
+                    raise TemplateError(name, line_no, "'% args'는 맨 앞에 한 번만 올 수 있습니다")
+                params = [p.strip() for p in directive[4:].split(',') if p.strip()]
+            elif keyword in ('if', 'for'):
+                if not directive.endswith(':'):
+                    raise TemplateError(name, line_no, f"'{keyword}' 줄은 ':'로 끝나야 합니다")
+                emit(directive)
+                stack.append((keyword, line_no))
+                indent += 1
+                block_empty = True
+            elif keyword in ('elif', 'else'):
+                if not stack or stack[-1][0] != 'if':
+                    raise TemplateError(name, line_no, f"'if' 없이 '{keyword}'")
+                if block_empty:
+                    emit('pass')
+                indent -= 1
+                emit(directive if directive.endswith(':') else directive + ':')
+                indent += 1
+                block_empty = True
+            elif keyword in ('endif', 'endfor'):
+                if not stack or stack[-1][0] != keyword[3:]:
+                    raise TemplateError(name, line_no, f"짝이 맞지 않는 '{keyword}'")
+                if block_empty:
+                    emit('pass')
+                stack.pop()
+                indent -= 1
+                block_empty = False
+            else:
+                raise TemplateError(name, line_no, f"알 수 없는 제어문: {directive!r}")
+            continue
+
+        pending.append(_parse_line(line, name, line_no))
+
+    flush_text()
+
+    if stack:
+        keyword, line_no = stack[-1]
+        raise TemplateError(name, line_no, f"닫히지 않은 '{keyword}'")
+
+    signature = ', '.join((params or []) + ['**_'])
+    body = '\n'.join(code) or '    pass'
+    module_source = (
+        f"def render({signature}):\n"
+        f"    _out = []\n"
+        f"    _a = _out.append\n"
+        f"{body}\n"
+        f"    return ''.join(_out)\n"
+    )
+
+    namespace = {}
+    exec(compile(module_source, f"<template {name}>", 'exec'), namespace)
+    render = namespace['render']
+    render.source = module_source
+    return render
+
+
+@lru_cache(maxsize=None)
+def load_template(name: str) -> Callable[..., str]:
+    """templates/<name>.tmpl을 읽어 컴파일 (프로세스당 한 번)"""
+    path = TEMPLATE_DIR / f"{name}.tmpl"
+    return compile_template(path.read_text(encoding='utf-8'), path.name)
+
+
+def render_template(name: str, **context) -> str:
+    """
+    템플릿 렌더링
+
+    Args:
+        name: 템플릿 이름 (확장자 제외)
+        **context: 템플릿의 % args에 선언된 값
+
+    Returns:
+        렌더링된 텍스트
+    """
+    return load_template(name)(**context)
@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# 모듈이 저장소 최상위에 있으므로 테스트에서 바로 import 할 수 있도록
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# 레포트/저장소 테스트용 세션 (구간 파일 3개, 교사/아동 번갈아 발화)
+SESSION = '20251030-김민지교사-박서준-만4세-00_06_00-63kbps_mono'
+
+TEACHER_LINES = [
+    "오늘은 무엇을 하고 놀고 싶어?",
+    "그렇구나 어떤 걸 만들어 볼까?",
+    "우와 정말 멋지다",
+    "왜 그렇게 생각했어?",
+    "선생님도 같이 해 볼게",
+]
+CHILD_LINES = [
+    "기차 선로를 길게 연결해서 터널까지 가게 만들고 싶어요",
+    "바퀴가 자꾸 빠지는데 어떻게 하면 안 빠질까?",
+    "블록으로 다리를 만들면 기차가 건너갈 수 있어요",
+    "친구랑 같이 하니까 너무 재밌고 좋아",
+    "무서운 괴물이 나오면 속상해서 울 것 같아",
+    "왜 달은 밤에만 나와요?",
+    "엄마한테 오늘 만든 기차 보여주고 싶어요",
+    "이렇게 하면 더 높이 쌓을 수 있어",
+]
+
+
+def _write_session(root):
+    vtt_dir = root / SESSION / 'vtt'
+    vtt_dir.mkdir(parents=True)
+    n = 0
+    for segment in range(3):
+        blocks = []
+        for i in range(12):
+            start = i * 10
+            if i % 2 == 0:
+                speaker, text = '김민지 선생님', TEACHER_LINES[n % len(TEACHER_LINES)]
+            else:
+                speaker, text = '박서준 아이', CHILD_LINES[n % len(CHILD_LINES)]
+            n += 1
+            blocks.append(f"00:{start // 60:02d}:{start % 60:02d}.000 --> 00:{start // 60:02d}:{start % 60 + 5:02d}.000\n"
+                          f"[{speaker}] {text}")
+        name = f"{SESSION}_{segment * 2:03d}-{segment * 2 + 2:03d}분_후처리됨.vtt"
+        (vtt_dir / name).write_text('WEBVTT\n\n' + '\n\n'.join(blocks) + '\n', encoding='utf-8')
+    return root / SESSION
+
+
+@pytest.fixture(scope='module')
+def analysis_files(tmp_path_factory):
+    """통합 분석으로 만든 세 형식 분석 파일 {형식: 경로} (테스트 모듈 단위로 한 번 생성)"""
+    import combined_analysis
+
+    root = tmp_path_factory.mktemp('session')
+    return combined_analysis.analyze_combined(_write_session(root), root / 'analysis_results')
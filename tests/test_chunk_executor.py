@@ -0,0 +1,35 @@
+"""chunk_executor 동시 호출 수 상한 테스트"""
+
+import threading
+
+from chunk_executor import ChunkExecutor, HTTPBackend, StubServer
+
+
+class _CountingBackend(HTTPBackend):
+    """스레드에서 실제로 진행 중인 urllib 호출 수를 세는 백엔드"""
+
+    def __init__(self, url, timeout):
+        super().__init__(url, timeout)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def _post(self, prompt):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            return super()._post(prompt)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def test_timed_out_calls_keep_their_slot_until_the_thread_returns():
+    with StubServer(latency=0.3) as stub:
+        backend = _CountingBackend(stub.url, timeout=0.2)
+        executor = ChunkExecutor(backend, concurrency=2, rate=100, timeout=0.05, retries=0)
+        results = executor.run_sync(['[아이] 안녕'] * 6)
+
+    assert [r['status'] for r in results] == ['error'] * 6
+    assert backend.peak <= 2
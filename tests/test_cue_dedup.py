@@ -0,0 +1,53 @@
+"""cue_dedup 파일 오프셋 / 중복 큐 제거 테스트"""
+
+from cue_dedup import file_offset
+from enhanced_analysis import PlaySessionAnalyzer
+
+SESSION = '20251030-김교사-테스트-만4세-00_04_00-63kbps_mono'
+
+
+def _write_session(tmp_path, files):
+    vtt_dir = tmp_path / SESSION / 'vtt'
+    vtt_dir.mkdir(parents=True)
+    for name, cues in files.items():
+        blocks = [f"{start} --> {end}\n[{speaker}] {text}" for start, end, speaker, text in cues]
+        (vtt_dir / name).write_text('WEBVTT\n\n' + '\n\n'.join(blocks) + '\n', encoding='utf-8')
+    return tmp_path / SESSION
+
+
+def test_file_offset_is_decided_per_file():
+    # 파일 기준 시간 (0부터 다시 시작)
+    assert file_offset(600, 720, 1.5) == 600
+    # 세션 기준 시간: 구간 시작보다 조금 앞선 겹침 큐도 그대로
+    assert file_offset(600, 720, 599.8) == 0
+    assert file_offset(0, 120, 0.0) == 0
+
+
+def test_overlap_cue_in_session_absolute_file_is_dropped(tmp_path):
+    session = _write_session(tmp_path, {
+        's_000-002분_subtitle.vtt': [
+            ('00:00:01.000', '00:00:03.000', '선생님', '뭐 하고 놀까?'),
+            ('00:01:59.800', '00:02:01.000', '아이', '기차 놀이 하자'),
+        ],
+        's_002-004분_subtitle.vtt': [
+            ('00:01:59.800', '00:02:01.000', '아이', '기차 놀이 하자'),
+            ('00:02:30.000', '00:02:33.000', '선생님', '좋아 기차 만들자'),
+        ],
+    })
+
+    analyzer = PlaySessionAnalyzer(str(session))
+    utterances = analyzer.parse_vtt_files()
+
+    assert [u[1] for u in utterances] == [1.0, 119.8, 150.0]
+    assert analyzer.dropped_cues == 1
+
+
+def test_file_relative_times_are_shifted(tmp_path):
+    session = _write_session(tmp_path, {
+        's_000-002분_subtitle.vtt': [('00:00:01.000', '00:00:03.000', '아이', '안녕')],
+        's_002-004분_subtitle.vtt': [('00:00:05.000', '00:00:07.000', '아이', '또 만나')],
+    })
+
+    utterances = PlaySessionAnalyzer(str(session)).parse_vtt_files()
+
+    assert [u[1] for u in utterances] == [1.0, 125.0]
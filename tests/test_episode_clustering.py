@@ -0,0 +1,43 @@
+"""episode_clustering 핵심 에피소드 발췌 테스트"""
+
+from episode_clustering import MIN_EXCERPT_LINES, core_episodes, find_episodes
+
+# 서로 겹치는 글자가 거의 없는 아동/교사 발화 (창마다 발화 하나 → 발화 1개짜리 에피소드)
+TEXTS = [
+    (False, "오늘은 무엇을 하고 놀까"),
+    (True, "기차 선로를 길게 연결해서 터널까지 가고 싶어요"),
+    (False, "좋은 생각이네"),
+    (True, "왜 바퀴가 자꾸 빠지는 거예요?"),
+    (False, "같이 살펴볼까"),
+    (True, "블록으로 다리를 만들어서 해결했어요"),
+    (False, "정말 멋지다"),
+    (True, "친구랑 같이 하니까 너무 좋아"),
+    (False, "마지막으로 정리하자"),
+    (True, "속상해 더 놀고 싶은데"),
+]
+
+
+def _utterances(gap=90.0):
+    return [(is_child, i * gap, i * gap + 3.0, text) for i, (is_child, text) in enumerate(TEXTS)]
+
+
+def test_short_episodes_get_at_least_min_excerpt_lines():
+    utterances = _utterances()
+    episodes = find_episodes(utterances)
+    assert max(e['utterance_count'] for e in episodes) <= 2
+
+    samples = core_episodes(utterances, episodes)
+
+    assert [s['area'] for s in samples] == ['언어발달', '인지발달', '사회정서발달']
+    for sample in samples:
+        assert MIN_EXCERPT_LINES <= len(sample['dialogue']) <= 6
+
+
+def test_excerpt_stays_inside_long_episode():
+    # 모두 한 창 안에 있으면 에피소드 하나 → 발췌는 에피소드 안에서만
+    utterances = _utterances(gap=1.0)
+    episodes = find_episodes(utterances)
+    assert len(episodes) == 1
+
+    for sample in core_episodes(utterances, episodes):
+        assert MIN_EXCERPT_LINES <= len(sample['dialogue']) <= 6
@@ -0,0 +1,39 @@
+"""metrics_store 세션 지표 저장 테스트"""
+
+import json
+
+from conftest import SESSION
+from metrics_store import MetricsStore, kpi_values
+
+
+def _load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_every_format_stores_numeric_kpis_without_estimates(analysis_files):
+    for kind in ('basic', 'detailed', 'enhanced'):
+        values = kpi_values(_load(analysis_files[kind]))
+        assert values['child_utterance_count'] > 0
+        assert 'context_switches.total_switches' in values
+        if kind != 'enhanced':
+            # 글자 수로 추정한 단어 수는 저장하지 않음
+            assert 'child_word_count' not in values
+
+
+def test_richest_format_wins_regardless_of_order(analysis_files, tmp_path):
+    enhanced = _load(analysis_files['enhanced'])
+    basic = _load(analysis_files['basic'])
+
+    with MetricsStore(tmp_path / 'metrics.db') as store:
+        store.add(SESSION, enhanced)
+        store.add(SESSION, basic)
+
+        assert store.count() == 1
+        kinds = store.conn.execute("SELECT DISTINCT kind FROM session_kpis").fetchall()
+        assert kinds == [('enhanced',)]
+
+        group = store.group_by('나이', ['child_speech_ratio', 'topic_persistence'])[0]
+        assert group['sessions'] == 1
+        assert group['child_speech_ratio'] is not None
+        assert group['topic_persistence'] == enhanced['metrics']['topic_persistence']
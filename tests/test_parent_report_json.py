@@ -0,0 +1,86 @@
+"""형식별 레포트 생성기가 스키마를 통과하는 부모용 JSON을 실제로 저장하는지 확인"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import generate_reports
+import generate_reports_v2
+import render_farm
+from analysis_adapters import pick_session_files
+from parent_report_json import parent_report_errors
+
+from conftest import SESSION
+
+
+def _assert_valid(path):
+    assert path is not None and path.exists()
+    with open(path, 'r', encoding='utf-8') as f:
+        assert parent_report_errors(json.load(f)) == []
+
+
+def test_generate_reports_writes_parent_json_for_basic(analysis_files, tmp_path):
+    files = generate_reports.ReportGenerator(analysis_files['basic']).save_all_reports(str(tmp_path))
+    _assert_valid(files['parent_json'])
+
+
+def test_generate_reports_v2_writes_parent_json_for_detailed(analysis_files, tmp_path):
+    generate_reports_v2.generate_all_reports(str(analysis_files['detailed']), str(tmp_path))
+    _assert_valid(tmp_path / f"{SESSION}_parent_report.json")
+
+
+@pytest.mark.parametrize('kind', ['basic', 'detailed', 'enhanced'])
+def test_render_farm_writes_parent_json(analysis_files, tmp_path, kind):
+    summary = render_farm.render_reports([analysis_files[kind]], str(tmp_path), audiences=['parent_json'])
+    assert summary['errors'] == [] and summary['skipped'] == []
+    written = list(tmp_path.glob('*_parent_report.json'))
+    assert len(written) == 1
+    _assert_valid(written[0])
+
+
+@pytest.mark.parametrize('kind', ['basic', 'detailed', 'enhanced'])
+def test_report_generator_writes_parent_json(analysis_files, tmp_path, kind):
+    pytest.importorskip('numpy')    # 회사용 레포트
+    from report_generator import ReportGenerator
+
+    files = ReportGenerator(str(analysis_files[kind])).save_all_reports(str(tmp_path))
+    _assert_valid(files['parent_json'])
+
+
+def test_basic_input_has_no_persistence_rating(analysis_files):
+    from analysis_adapters import load_analysis
+    from parent_report_json import build_parent_report
+    from session_view import SessionView
+
+    ratings = {kind: build_parent_report(SessionView(load_analysis(analysis_files[kind])))
+               ['play_analysis']['play_quality_ratings'] for kind in ('basic', 'enhanced')}
+
+    # 기본 형식은 주제 지속도를 측정하지 않으므로 끈기 별점을 매기지 않음
+    assert 'persistence' not in ratings['basic']
+    assert 'persistence' in ratings['enhanced']
+
+
+def test_shipped_analysis_results_are_valid(tmp_path):
+    # 에피소드가 없는 이전 버전 결과와 date 칸이 없는 기본 형식 파일(송나윤3)도 건너뛰지 않음
+    paths = sorted(Path(__file__).parent.parent.glob('analysis_results/*_analysis.json'))
+    for kind in ('basic', 'detailed', 'enhanced'):
+        out = tmp_path / kind
+        summary = render_farm.render_reports(pick_session_files(paths, [kind]), str(out),
+                                             audiences=['parent_json'])
+        assert summary['errors'] == [] and summary['skipped'] == []
+        written = list(out.glob('*_parent_report.json'))
+        assert len(written) == 2
+        for path in written:
+            _assert_valid(path)
+
+
+def test_html_report_labels_missing_rating(analysis_files, tmp_path):
+    from analysis_adapters import load_analysis
+    from html_report import HTMLReportRenderer
+    from parent_report_json import build_parent_report
+    from session_view import SessionView
+
+    report = build_parent_report(SessionView(load_analysis(analysis_files['basic'])))
+    html = HTMLReportRenderer(str(tmp_path)).render(report)
+    assert '<li>지속성: <span class="small">측정 불가</span></li>' in html
@@ -0,0 +1,31 @@
+"""render_farm 세션별 작업 묶음 / 증분 렌더링 테스트"""
+
+import pytest
+
+from render_farm import session_batches
+
+
+def test_session_batches_group_uneven_incremental_jobs_by_session():
+    # 증분 렌더링 후 세션마다 남은 대상 수가 다름
+    jobs = [('a.json', 'parent'), ('a.json', 'teacher'), ('a.json', 'journal'),
+            ('b.json', 'teacher'),
+            ('c.json', 'parent'), ('c.json', 'company')]
+
+    assert session_batches(jobs) == [
+        [('a.json', 'parent'), ('a.json', 'teacher'), ('a.json', 'journal')],
+        [('b.json', 'teacher')],
+        [('c.json', 'parent'), ('c.json', 'company')],
+    ]
+
+
+def test_batch_sequential_reports_are_incremental(analysis_files, tmp_path):
+    pytest.importorskip('numpy')    # 회사용 레포트
+    import batch_analyze
+
+    analysis_dir = analysis_files['enhanced'].parent
+    first = batch_analyze.generate_all_reports(analysis_dir, tmp_path)
+    assert first['errors'] == [] and first['written'] == 5
+
+    # 순차 경로(--render-workers 없음)도 바뀐 것이 없으면 다시 렌더링하지 않음
+    assert batch_analyze.generate_all_reports(analysis_dir, tmp_path, dry_run=True)['planned'] == []
+    assert batch_analyze.generate_all_reports(analysis_dir, tmp_path)['written'] == 0
@@ -0,0 +1,35 @@
+"""변환된 basic/detailed 분석 결과의 미측정 지표가 레포트에서 등급 없이 '측정 불가'로 나오는지 확인"""
+
+import pytest
+
+from analysis_adapters import load_analysis
+from report_generator import ReportGenerator
+
+
+def test_adapters_leave_unmeasured_metrics_empty(analysis_files):
+    m = load_analysis(analysis_files['basic'])['metrics']
+
+    assert m['topic_persistence'] is None
+    assert m['child_speaking_duration'] is None and m['child_speaking_ratio'] is None
+    assert m['problem_solving_utterances']['teacher_count'] is None
+    assert 'topic_distribution' not in m['context_switches']
+
+
+def test_teacher_report_does_not_grade_unmeasured_persistence(analysis_files):
+    generator = ReportGenerator(str(analysis_files['basic']))
+    report = generator.generate_teacher_report()
+
+    assert '주제 지속도 지수: 측정 불가' in report
+    assert '탐색적 행동이 우세하며' not in report
+    assert '[놀이집중도]' not in report
+
+
+def test_company_report_excludes_unmeasured_scores(analysis_files):
+    pytest.importorskip('numpy')
+    generator = ReportGenerator(str(analysis_files['basic']))
+    report = generator.generate_company_report()
+
+    assert '아동 말하기 시간: 측정 불가' in report
+    assert '집중도 (현재:' not in report
+    context = generator._company_context()
+    assert context['scores']['집중도'] is None and context['scores']['언어 표현력'] is None
@@ -0,0 +1,23 @@
+"""vtt_source 분석기별 파일 선택 순서 테스트"""
+
+import analyze_metrics
+import analyze_play_session
+from vtt_source import VTTSource
+
+SESSION = '20251030-김교사-테스트-만4세-00_02_00-63kbps_mono'
+
+
+def test_each_analyzer_keeps_its_own_file_preference(tmp_path):
+    vtt_dir = tmp_path / SESSION / 'vtt'
+    vtt_dir.mkdir(parents=True)
+    for suffix, text in (('subtitle', '자막 파일'), ('후처리됨', '후처리 파일')):
+        (vtt_dir / f"{SESSION}_000-002분_{suffix}.vtt").write_text(
+            f"WEBVTT\n\n00:00:01.000 --> 00:00:03.000\n[아이] {text}\n", encoding='utf-8')
+
+    source = VTTSource(tmp_path / SESSION)
+
+    # basic은 _subtitle.vtt 우선, detailed/enhanced는 _후처리됨.vtt 우선 (같은 소스를 공유해도 각자 순서)
+    assert [c['text'] for c in source.cues(analyze_play_session.VTT_PATTERNS)] == ['자막 파일']
+    assert [c['text'] for c in source.cues(analyze_metrics.VTT_PATTERNS)] == ['후처리 파일']
+    assert [c['text'] for c in source.cues()] == ['후처리 파일']
+    assert source.reads == 2 and source.parses == 2
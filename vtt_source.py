@@ -0,0 +1,162 @@
+"""
+세션 VTT 공유 소스
+- 파일 선택: 패턴 목록 중 처음 파일이 있는 패턴 하나 (기본: 구간별 후처리됨 > subtitle > 전체 .vtt)
+  분석기마다 기존 선호 순서가 달라 각 분석기가 VTT_PATTERNS를 넘김 (basic은 subtitle 우선)
+- 큐 파싱 + 파일 단위 시간 오프셋 + 중복 큐 제거(cue_dedup)를 선택된 파일 묶음당 한 번만 수행
+- basic / detailed / enhanced 분석기가 발화 목록을 받아 각자 형식으로 지표 계산
+  (combined_analysis는 소스 하나를 세 분석기에 넘겨 같은 파일은 한 번만 읽고, 같은 파일 묶음은 한 번만 파싱)
+- 발화 목록에서 뽑는 핵심 에피소드(episode_clustering)도 파일 묶음당 한 번 (enhanced 결과에 기록)
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+from cue_dedup import CueDeduplicator, file_offset, timestamp_seconds
+
+
+# VTT 큐: 타임스탬프 줄 + [화자] 텍스트
+CUE_RE = re.compile(
+    r'(\d{2}:\d{2}:\d{2}\.\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}\.\d{3})\s*\n'
+    r'\[([^\]]+)\][ \t]*([^\n]*(?:\n[^\n]+)*)'
+)
+
+# 파일명의 구간 정보 (예: _002-004분)
+SEGMENT_RE = re.compile(r'_(\d{3})-(\d{3})분')
+
+# 기본 파일 선택 순서 (처음 파일이 있는 패턴 하나만 사용)
+FILE_PATTERNS = ("*_후처리됨.vtt", "*_subtitle.vtt", "*.vtt")
+
+
+def is_teacher(speaker: str) -> bool:
+    """화자 이름으로 교사 여부 판별"""
+    return '선생님' in speaker or '교사' in speaker
+
+
+class VTTSource:
+    """
+    세션 VTT 파일 공유 소스
+
+    파일 목록/내용/파싱 결과를 캐시해 여러 분석기가 같은 세션을 분석해도 한 번만 읽고 파싱합니다.
+    """
+
+    def __init__(self, session_dir):
+        """
+        Args:
+            session_dir: 세션 디렉토리 경로 (vtt/ 폴더 포함)
+        """
+        self.session_dir = Path(session_dir)
+        self.vtt_dir = self.session_dir / "vtt"
+        self._texts = {}
+        self._files = {}
+        # 선택된 파일 묶음(tuple) → 파싱 결과
+        self._cues = {}
+        self._utterances = {}
+        self._core_episodes = {}
+        self.reads = 0
+        self.parses = 0
+        self.dropped = 0
+
+    def files(self, pattern: str) -> List[Path]:
+        """vtt 폴더에서 패턴에 맞는 파일 목록 (정렬, 패턴별 1회 조회)"""
+        if pattern not in self._files:
+            self._files[pattern] = sorted(self.vtt_dir.glob(pattern))
+        return list(self._files[pattern])
+
+    def read(self, vtt_path) -> str:
+        """VTT 파일 내용 (파일별 1회 읽기)"""
+        key = str(vtt_path)
+        text = self._texts.get(key)
+        if text is None:
+            with open(vtt_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            self._texts[key] = text
+            self.reads += 1
+        return text
+
+    def vtt_files(self, patterns: Sequence[str] = FILE_PATTERNS) -> List[Path]:
+        """
+        분석할 VTT 파일 (patterns 중 처음 파일이 있는 패턴)
+
+        세션/vtt 폴더가 없거나 VTT 파일이 하나도 없으면 FileNotFoundError
+        (빈 분석 결과로 기존 결과 파일을 덮어쓰지 않도록)
+        """
+        for pattern in patterns:
+            files = self.files(pattern)
+            if files:
+                return files
+        if not self.vtt_dir.is_dir():
+            raise FileNotFoundError(f"vtt 폴더가 없습니다: {self.vtt_dir}")
+        raise FileNotFoundError(f"VTT 파일이 없습니다: {self.vtt_dir}")
+
+    def cues(self, patterns: Sequence[str] = FILE_PATTERNS) -> List[Dict[str, Any]]:
+        """
+        세션의 발화 큐 목록 (파일 묶음당 1회 파싱, 중복 큐 제외)
+
+        2분 단위 파일은 파일마다 시간이 0부터 다시 시작할 수 있어, 파일 단위로 정한
+        오프셋(cue_dedup.file_offset)을 더해 세션 기준 시간으로 맞춥니다.
+
+        Args:
+            patterns: 파일 선택 순서 (분석기별 VTT_PATTERNS)
+
+        Returns:
+            [{'start_time', 'end_time' (파일에 적힌 타임스탬프), 'start', 'end' (세션 기준 초),
+              'speaker', 'text', 'segment' (예: '000-002', 없으면 ''), 'segment_file'}, ...]
+            self.dropped에는 이 묶음에서 제거한 중복 큐 수
+        """
+        key = tuple(self.vtt_files(patterns))
+        if key in self._cues:
+            cues, self.dropped = self._cues[key]
+            return cues
+
+        cues = []
+        dedup = CueDeduplicator()
+
+        for vtt_file in key:
+            matches = list(CUE_RE.finditer(self.read(vtt_file)))
+            segment = SEGMENT_RE.search(vtt_file.name)
+            offset = 0.0
+            if segment and matches:
+                offset = file_offset(int(segment.group(1)) * 60, int(segment.group(2)) * 60,
+                                     timestamp_seconds(matches[0].group(1)))
+
+            for m in matches:
+                start = timestamp_seconds(m.group(1), offset)
+                speaker = m.group(3).strip()
+                text = m.group(4).strip()
+                if dedup.is_duplicate(start, speaker, text):
+                    continue
+                cues.append({
+                    'start_time': m.group(1),
+                    'end_time': m.group(2),
+                    'start': start,
+                    'end': timestamp_seconds(m.group(2), offset),
+                    'speaker': speaker,
+                    'text': text,
+                    'segment': f"{segment.group(1)}-{segment.group(2)}" if segment else '',
+                    'segment_file': vtt_file.name,
+                })
+
+        self._cues[key] = (cues, dedup.dropped)
+        self.parses += 1
+        self.dropped = dedup.dropped
+        return cues
+
+    def utterances(self, patterns: Sequence[str] = FILE_PATTERNS) -> List[Tuple[bool, float, float, str]]:
+        """(아동 여부, 시작 초, 종료 초, 텍스트) 목록 (enhanced_analysis / episode_clustering 입력)"""
+        cues = self.cues(patterns)
+        key = tuple(self.vtt_files(patterns))
+        if key not in self._utterances:
+            self._utterances[key] = [(not is_teacher(c['speaker']), c['start'], c['end'], c['text'])
+                                     for c in cues]
+        return self._utterances[key]
+
+    def core_episodes(self, patterns: Sequence[str] = FILE_PATTERNS) -> List[Dict[str, Any]]:
+        """발달 영역별 핵심 에피소드 발췌 (episode_clustering, 파일 묶음당 1회)"""
+        key = tuple(self.vtt_files(patterns))
+        if key not in self._core_episodes:
+            from episode_clustering import find_episodes, core_episodes
+
+            utterances = self.utterances(patterns)
+            self._core_episodes[key] = core_episodes(utterances, find_episodes(utterances))
+        return self._core_episodes[key]